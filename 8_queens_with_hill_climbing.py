@@ -1,10 +1,21 @@
 import pygame
+import os
 import sys
-import random
+
+# O avaliador incremental, a busca com tabu e a solução construtiva (tecla C) vivem no pacote de análise comparativa
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "analise_comparativa_8_rainhas"))
+from avaliador_conflitos import AvaliadorConflitos
+from constructive_benchmark import solucao_construtiva
+from hill_climbing_tabu_benchmark import hill_climbing_tabu, hill_climbing_tabu_passos
+from renderizacao import EVENTOS_EXPOSICAO, RenderizadorTabuleiro
+from trabalhador import EVENTO_PASSO, EVENTO_SOLUCAO, TrabalhadorSolver
 
 # Configurações
-TAM_CELULA = 60
-NUM_RAINHAS = 8
+_ARGS = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+NUM_RAINHAS = int(_ARGS[0]) if _ARGS else 8  # N opcional na linha de comando
+ANIMAR = "--animar" in sys.argv  # Anima a subida passo a passo (tecla A alterna)
+INTERVALO_ANIMACAO = 0.1  # Segundos entre quadros no modo animado
+TAM_CELULA = max(4, 480 // NUM_RAINHAS)  # Mantém o tabuleiro com ~480 px de lado
 LARGURA = TAM_CELULA * NUM_RAINHAS
 ALTURA = TAM_CELULA * NUM_RAINHAS + 45
 LARGURA_BOTAO = LARGURA
@@ -13,94 +24,69 @@ ALTURA_BOTAO = 45
 # Inicializa o Pygame
 pygame.init()
 screen = pygame.display.set_mode((LARGURA, ALTURA))
-pygame.display.set_caption("8 Rainhas - Hill Climbing")
-
-# Cores
-BRANCO = (255, 255, 255)
-PRETO = (0, 0, 0)
-VERMELHO = (255, 0, 0)
-AZUL = (0, 0, 255)
-
-# Calcula o número de conflitos entre rainhas
-def contar_conflitos(solucao):
-    conflitos = 0
-    for i in range(NUM_RAINHAS):
-        for j in range(i + 1, NUM_RAINHAS):
-            if solucao[i] == solucao[j] or abs(solucao[i] - solucao[j]) == abs(i - j):
-                conflitos += 1
-    return conflitos
-
-# Hill Climbing para encontrar uma solução
-def hill_climbing():
-    estado_atual = [random.randint(0, NUM_RAINHAS - 1) for _ in range(NUM_RAINHAS)]
-    while True:
-        conflitos_atual = contar_conflitos(estado_atual)
-        if conflitos_atual == 0:
-            return estado_atual  # Solução encontrada
+pygame.display.set_caption(f"{NUM_RAINHAS} Rainhas - Hill Climbing")
 
-        melhor_estado = list(estado_atual)
-        melhor_conflitos = conflitos_atual
+# Hill Climbing com movimentos laterais, lista tabu e reinícios: só termina numa
+# solução (ou se cancelado), em vez de parar no primeiro ótimo local
+def hill_climbing(n=NUM_RAINHAS, cancelado=None):
+    solucao, _ = hill_climbing_tabu(n, cancelado=cancelado)
+    return solucao
 
-        for coluna in range(NUM_RAINHAS):
-            original = estado_atual[coluna]
-            for linha in range(NUM_RAINHAS):
-                if linha == original:
-                    continue
-                estado_atual[coluna] = linha
-                novos_conflitos = contar_conflitos(estado_atual)
-                if novos_conflitos < melhor_conflitos:
-                    melhor_conflitos = novos_conflitos
-                    melhor_estado = list(estado_atual)
-            estado_atual[coluna] = original  # Restaura a posição original
+# Versão passo a passo para animação: gera (estado, conflitos) após cada movimento e reinício
+def hill_climbing_passos(n=NUM_RAINHAS, cancelado=None):
+    for avaliador, _ in hill_climbing_tabu_passos(n, cancelado=cancelado):
+        yield list(avaliador.estado), avaliador.conflitos
 
-        if melhor_conflitos >= conflitos_atual:
-            return estado_atual  # Ótimo local atingido
-        estado_atual = melhor_estado
-
-# Funções de desenho
-def desenhar_tabuleiro():
-    for linha in range(NUM_RAINHAS):
-        for coluna in range(NUM_RAINHAS):
-            cor = BRANCO if (linha + coluna) % 2 == 0 else PRETO
-            rect = pygame.Rect(coluna * TAM_CELULA, linha * TAM_CELULA, TAM_CELULA, TAM_CELULA)
-            pygame.draw.rect(screen, cor, rect)
-
-def desenhar_rainhas(solucao):
-    for coluna, linha in enumerate(solucao):
-        center_x = coluna * TAM_CELULA + TAM_CELULA // 2
-        center_y = linha * TAM_CELULA + TAM_CELULA // 2
-        pygame.draw.circle(screen, VERMELHO, (center_x, center_y), TAM_CELULA // 3)
+# Loop principal: a busca roda numa thread (TrabalhadorSolver) e o loop só
+# redesenha quando chega um estado novo ou a janela é exposta
+def main():
+    renderizador = RenderizadorTabuleiro(NUM_RAINHAS, TAM_CELULA, ALTURA_BOTAO)
+    trabalhador = TrabalhadorSolver()
+    animar = ANIMAR
+    solucao = []
+    precisa_redesenhar = True
 
-def desenhar_botao():
-    botao_rect = pygame.Rect(LARGURA // 2 - LARGURA_BOTAO // 2, ALTURA - ALTURA_BOTAO, LARGURA_BOTAO, ALTURA_BOTAO)
-    pygame.draw.rect(screen, AZUL, botao_rect)
-    font = pygame.font.Font(None, 36)
-    texto = font.render("Nova Solução", True, BRANCO)
-    screen.blit(texto, (botao_rect.x + (botao_rect.width - texto.get_width()) // 2, 
-                        botao_rect.y + (botao_rect.height - texto.get_height()) // 2))
+    def nova_busca():
+        if animar:
+            trabalhador.iniciar(None, passos=lambda cancelado: hill_climbing_passos(NUM_RAINHAS, cancelado),
+                                intervalo=INTERVALO_ANIMACAO)
+        else:
+            trabalhador.iniciar(lambda cancelado: hill_climbing(NUM_RAINHAS, cancelado))
+        pygame.display.set_caption(f"{NUM_RAINHAS} Rainhas - Hill Climbing (buscando...)")
 
-# Loop principal
-def main():
-    solucao = hill_climbing()
-    clock = pygame.time.Clock()
+    def solucao_direta():
+        # Construção O(N), sem busca; passa pelo trabalhador para cancelar a busca em andamento
+        trabalhador.iniciar(lambda cancelado: solucao_construtiva(NUM_RAINHAS))
 
+    nova_busca()
     while True:
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
-            if event.type == pygame.MOUSEBUTTONDOWN:
-                mouse_x, mouse_y = event.pos
-                botao_rect = pygame.Rect(LARGURA // 2 - LARGURA_BOTAO // 2, ALTURA - ALTURA_BOTAO, LARGURA_BOTAO, ALTURA_BOTAO)
-                if botao_rect.collidepoint(mouse_x, mouse_y):
-                    solucao = hill_climbing()
+        if precisa_redesenhar:
+            renderizador.desenhar(screen, solucao)
+            pygame.display.flip()
+            precisa_redesenhar = False
 
-        screen.fill(BRANCO)
-        desenhar_tabuleiro()
-        desenhar_rainhas(solucao)
-        desenhar_botao()
-        pygame.display.flip()
-        clock.tick(60)
+        event = pygame.event.wait()
+        if event.type == pygame.QUIT:
+            trabalhador.cancelar()
+            pygame.quit()
+            sys.exit()
+        if event.type == pygame.MOUSEBUTTONDOWN and renderizador.clicou_botao(event.pos):
+            nova_busca()  # Cancela a busca anterior, se ainda estiver rodando
+        elif event.type == pygame.KEYDOWN and event.key == pygame.K_a:
+            animar = not animar
+        elif event.type == pygame.KEYDOWN and event.key == pygame.K_c:
+            solucao_direta()
+        elif event.type in (EVENTO_PASSO, EVENTO_SOLUCAO) and event.geracao == trabalhador.geracao:
+            solucao = event.solucao
+            if event.type == EVENTO_PASSO:
+                pygame.display.set_caption(f"{NUM_RAINHAS} Rainhas - Hill Climbing (conflitos: {event.conflitos})")
+            else:
+                conflitos = AvaliadorConflitos(solucao).conflitos
+                estado = "solução" if conflitos == 0 else f"ótimo local, {conflitos} conflitos"
+                pygame.display.set_caption(f"{NUM_RAINHAS} Rainhas - Hill Climbing ({estado})")
+            precisa_redesenhar = True
+        elif event.type in EVENTOS_EXPOSICAO:
+            precisa_redesenhar = True
 
 if __name__ == "__main__":
     main()
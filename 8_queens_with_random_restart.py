@@ -1,105 +1,129 @@
 import pygame
+import os
 import sys
 import random
 
+# A solução construtiva (tecla C) vive no pacote de análise comparativa
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "analise_comparativa_8_rainhas"))
+from constructive_benchmark import solucao_construtiva
+from renderizacao import EVENTOS_EXPOSICAO, RenderizadorTabuleiro
+from trabalhador import EVENTO_PASSO, EVENTO_SOLUCAO, TrabalhadorSolver
+
 # Configurações
-TAM_CELULA = 60  # Tamanho de cada célula do tabuleiro
-NUM_RAINHAS = 8
+_ARGS = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+NUM_RAINHAS = int(_ARGS[0]) if _ARGS else 8  # N opcional na linha de comando
+ANIMAR = "--animar" in sys.argv  # Mostra cada tentativa (tecla A alterna)
+INTERVALO_ANIMACAO = 0.02  # Segundos entre tentativas no modo animado
+TAM_CELULA = max(4, 480 // NUM_RAINHAS)  # Tamanho de cada célula do tabuleiro
 LARGURA = TAM_CELULA * NUM_RAINHAS
 ALTURA = TAM_CELULA * NUM_RAINHAS + 45  # Damos espaço extra para o botão
-LARGURA_BOTAO = 60 * 8
+LARGURA_BOTAO = LARGURA
 ALTURA_BOTAO = 45
 
 # Função para verificar se uma solução é válida
-def eh_valida(solucao):
-    for i in range(NUM_RAINHAS):
-        for j in range(i + 1, NUM_RAINHAS):
+def eh_valida(solucao, n=NUM_RAINHAS):
+    for i in range(n):
+        for j in range(i + 1, n):
             if solucao[i] == solucao[j] or abs(solucao[i] - solucao[j]) == abs(i - j):
                 return False
     return True
 
 # Função para gerar uma solução aleatória
-def gerar_solucao_aleatoria():
-    solucao = list(range(NUM_RAINHAS))  # Cria uma lista [0, 1, 2, ..., 7]
+def gerar_solucao_aleatoria(n=NUM_RAINHAS):
+    solucao = list(range(n))  # Cria uma lista [0, 1, 2, ..., N-1]
     random.shuffle(solucao)  # Embaralha a lista para criar uma solução aleatória
     return solucao
 
-# Função para tentar encontrar uma solução válida com Random Restart
-def random_restart():
+# Função para contar os pares de rainhas que se atacam (usada na animação)
+def contar_conflitos(solucao, n=NUM_RAINHAS):
+    conflitos = 0
+    for i in range(n):
+        for j in range(i + 1, n):
+            if solucao[i] == solucao[j] or abs(solucao[i] - solucao[j]) == abs(i - j):
+                conflitos += 1
+    return conflitos
+
+# Função para tentar encontrar uma solução válida com Random Restart (None se cancelado)
+def random_restart(n=NUM_RAINHAS, cancelado=None):
+    tentativas = 0
     while True:
-        solucao = gerar_solucao_aleatoria()
-        if eh_valida(solucao):
+        solucao = gerar_solucao_aleatoria(n)
+        if eh_valida(solucao, n):
             return solucao
+        tentativas += 1
+        # Checa o cancelamento a cada 256 tentativas para não pesar no laço
+        if cancelado is not None and tentativas % 256 == 0 and cancelado.is_set():
+            return None
+
+# Versão passo a passo para animação: gera (tentativa, conflitos) até achar uma válida
+def random_restart_passos(n=NUM_RAINHAS, cancelado=None):
+    while cancelado is None or not cancelado.is_set():
+        solucao = gerar_solucao_aleatoria(n)
+        conflitos = contar_conflitos(solucao, n)
+        yield solucao, conflitos
+        if conflitos == 0:
+            return
 
 # Inicia o Pygame
 pygame.init()
 screen = pygame.display.set_mode((LARGURA, ALTURA))
-pygame.display.set_caption("Problema das 8 Rainhas")
-
-# Cores
-BRANCO = (255, 255, 255)
-PRETO = (0, 0, 0)
-VERMELHO = (255, 0, 0)
-AZUL = (0, 0, 255)
-CINZA = (200, 200, 200)
-
-# Gera uma solução válida usando Random Restart
-solucao = random_restart()
-
-# Função para desenhar o tabuleiro
-def desenhar_tabuleiro():
-    for linha in range(NUM_RAINHAS):
-        for coluna in range(NUM_RAINHAS):
-            if (linha + coluna) % 2 == 0:
-                cor = BRANCO
-            else:
-                cor = PRETO
-            rect = pygame.Rect(coluna * TAM_CELULA, linha * TAM_CELULA, TAM_CELULA, TAM_CELULA)
-            pygame.draw.rect(screen, cor, rect)
+pygame.display.set_caption(f"Problema das {NUM_RAINHAS} Rainhas")
 
-# Função para desenhar as rainhas
-def desenhar_rainhas():
-    for coluna, linha in enumerate(solucao):
-        center_x = coluna * TAM_CELULA + TAM_CELULA // 2
-        center_y = linha * TAM_CELULA + TAM_CELULA // 2
-        radius = TAM_CELULA // 3
-        pygame.draw.circle(screen, VERMELHO, (center_x, center_y), radius)
-
-# Função para desenhar o botão
-def desenhar_botao():
-    botao_rect = pygame.Rect(LARGURA // 2 - LARGURA_BOTAO // 2, ALTURA - ALTURA_BOTAO, LARGURA_BOTAO, ALTURA_BOTAO)
-    pygame.draw.rect(screen, AZUL, botao_rect)
-    font = pygame.font.Font(None, 36)
-    texto = font.render("Nova Solução", True, BRANCO)
-    screen.blit(texto, (botao_rect.x + (botao_rect.width - texto.get_width()) // 2, 
-                        botao_rect.y + (botao_rect.height - texto.get_height()) // 2))
+# Solução exibida; preenchida quando a primeira busca em segundo plano termina
+solucao = []
 
 # Função principal para rodar o Pygame
 def main():
     global solucao
-    clock = pygame.time.Clock()
-    
+    # Tabuleiro, rainha e botão pré-renderizados; só há blit quando algo muda
+    renderizador = RenderizadorTabuleiro(NUM_RAINHAS, TAM_CELULA, ALTURA_BOTAO)
+    # A busca roda numa thread, então a janela continua respondendo durante ela
+    trabalhador = TrabalhadorSolver()
+    animar = ANIMAR
+    precisa_redesenhar = True
+
+    def nova_busca():
+        if animar:
+            trabalhador.iniciar(None, passos=lambda cancelado: random_restart_passos(NUM_RAINHAS, cancelado),
+                                intervalo=INTERVALO_ANIMACAO)
+        else:
+            trabalhador.iniciar(lambda cancelado: random_restart(NUM_RAINHAS, cancelado))
+        pygame.display.set_caption(f"Problema das {NUM_RAINHAS} Rainhas (buscando...)")
+
+    def solucao_direta():
+        # Construção O(N), sem busca; passa pelo trabalhador para cancelar a busca em andamento
+        trabalhador.iniciar(lambda cancelado: solucao_construtiva(NUM_RAINHAS))
+
+    nova_busca()
     while True:
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
-            
-            # Detectando clique no botão
-            if event.type == pygame.MOUSEBUTTONDOWN:
-                mouse_x, mouse_y = event.pos
-                botao_rect = pygame.Rect(LARGURA // 2 - LARGURA_BOTAO // 2, ALTURA - ALTURA_BOTAO, LARGURA_BOTAO, ALTURA_BOTAO)
-                if botao_rect.collidepoint(mouse_x, mouse_y):
-                    # Gerar uma nova solução aleatória
-                    solucao = random_restart()
+        if precisa_redesenhar:
+            renderizador.desenhar(screen, solucao)
+            pygame.display.flip()
+            precisa_redesenhar = False
 
-        # Desenhar tabuleiro e rainhas
-        desenhar_tabuleiro()
-        desenhar_rainhas()
-        desenhar_botao()
-        
-        pygame.display.flip()
-        clock.tick(60)
+        # Dorme até o próximo evento em vez de redesenhar 60 vezes por segundo
+        event = pygame.event.wait()
+        if event.type == pygame.QUIT:
+            trabalhador.cancelar()
+            pygame.quit()
+            sys.exit()
+            
+        # Detectando clique no botão: cancela a busca anterior e começa outra
+        if event.type == pygame.MOUSEBUTTONDOWN and renderizador.clicou_botao(event.pos):
+            nova_busca()
+        elif event.type == pygame.KEYDOWN and event.key == pygame.K_a:
+            animar = not animar
+        elif event.type == pygame.KEYDOWN and event.key == pygame.K_c:
+            solucao_direta()
+        elif event.type in (EVENTO_PASSO, EVENTO_SOLUCAO) and event.geracao == trabalhador.geracao:
+            solucao = event.solucao
+            if event.type == EVENTO_PASSO:
+                pygame.display.set_caption(f"Problema das {NUM_RAINHAS} Rainhas (conflitos: {event.conflitos})")
+            else:
+                pygame.display.set_caption(f"Problema das {NUM_RAINHAS} Rainhas")
+            precisa_redesenhar = True
+        elif event.type in EVENTOS_EXPOSICAO:
+            precisa_redesenhar = True
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,78 @@
+"""
+Avaliador incremental de conflitos para as buscas locais do problema das N Rainhas.
+
+Mantém contadores de rainhas por linha e por diagonal, de forma que o número de
+conflitos após mover uma única rainha é obtido em O(1), em vez de recalcular
+o tabuleiro inteiro com contar_conflitos (O(N²)).
+
+conflitos_em_lote faz a contagem completa de muitas permutações de uma vez, em NumPy
+(aptidão da população do Algoritmo Genético, melhor permutação de um lote do Random Restart).
+"""
+import numpy as np
+
+
+class AvaliadorConflitos:
+    def __init__(self, estado):
+        self.n = len(estado)
+        self.estado = list(estado) # estado[coluna] = linha da rainha
+        self.linhas = [0] * self.n
+        self.diag_principal = [0] * (2 * self.n - 1) # indexada por coluna + linha
+        self.diag_secundaria = [0] * (2 * self.n - 1) # indexada por coluna - linha + N - 1
+        for coluna, linha in enumerate(self.estado):
+            self._adicionar(coluna, linha)
+        # Cada linha/diagonal com k rainhas contribui com k*(k-1)/2 pares em conflito
+        self.conflitos = sum(k * (k - 1) // 2 for contadores in
+                             (self.linhas, self.diag_principal, self.diag_secundaria)
+                             for k in contadores)
+
+    def _adicionar(self, coluna, linha):
+        self.linhas[linha] += 1
+        self.diag_principal[coluna + linha] += 1
+        self.diag_secundaria[coluna - linha + self.n - 1] += 1
+
+    def _remover(self, coluna, linha):
+        self.linhas[linha] -= 1
+        self.diag_principal[coluna + linha] -= 1
+        self.diag_secundaria[coluna - linha + self.n - 1] -= 1
+
+    def conflitos_da_rainha(self, coluna, linha):
+        """Quantas rainhas (além dela) atacam a casa (coluna, linha) se ela estiver ocupada."""
+        return (self.linhas[linha] + self.diag_principal[coluna + linha]
+                + self.diag_secundaria[coluna - linha + self.n - 1] - 3)
+
+    def delta(self, coluna, nova_linha):
+        """Variação no número de conflitos ao mover a rainha da coluna para nova_linha."""
+        linha_atual = self.estado[coluna]
+        if nova_linha == linha_atual:
+            return 0
+        # A casa de destino nunca compartilha linha ou diagonal com a de origem
+        # (mesma coluna), então os contadores do destino não mudam com a remoção.
+        ganho = (self.linhas[nova_linha] + self.diag_principal[coluna + nova_linha]
+                 + self.diag_secundaria[coluna - nova_linha + self.n - 1])
+        return ganho - self.conflitos_da_rainha(coluna, linha_atual)
+
+    def mover(self, coluna, nova_linha):
+        """Aplica o movimento, atualizando contadores e o total de conflitos."""
+        linha_atual = self.estado[coluna]
+        if nova_linha == linha_atual:
+            return
+        self.conflitos += self.delta(coluna, nova_linha)
+        self._remover(coluna, linha_atual)
+        self._adicionar(coluna, nova_linha)
+        self.estado[coluna] = nova_linha
+
+
+def conflitos_em_lote(permutacoes):
+    """
+    Número de pares de rainhas em conflito (diagonal) de cada linha de uma matriz
+    (permutações x N). Permutação i, diagonal d -> índice global i * (2N - 1) + d;
+    um único bincount conta tudo.
+    """
+    tamanho, n = permutacoes.shape
+    colunas = np.arange(n)
+    deslocamento = (np.arange(tamanho) * (2 * n - 1))[:, None]
+    conflitos = np.zeros(tamanho, dtype=np.int64)
+    for diagonais in (permutacoes + colunas, permutacoes - colunas + n - 1):
+        contagens = np.bincount((diagonais + deslocamento).ravel(), minlength=tamanho * (2 * n - 1))
+        conflitos += (contagens * (contagens - 1) // 2).reshape(tamanho, 2 * n - 1).sum(axis=1)
+    return conflitos
@@ -4,13 +4,30 @@ Implementação do algoritmo de Backtracking para o problema das 8 Rainhas.
 
 import time
 import tracemalloc # Para medição de memória
+from concurrent.futures import ProcessPoolExecutor
+
+from instrumentacao import medir_fase
+from registro_solvers import Solver, registrar
+
+ENGINES = ("classic", "bitmask")
+
+class _Cancelled(Exception):
+    """Interrompe a recursão quando o `cancel` da busca é acionado."""
 
 class EightQueensBacktracking:
-    def __init__(self, n=8):
+    def __init__(self, n=8, engine="classic", instrumentation=None):
+        if engine not in ENGINES:
+            raise ValueError(f"Engine desconhecida: {engine!r} (esperado um de {ENGINES})")
         self.n = n
+        self.engine = engine
         self.solutions = []
         self.board = [-1] * n # board[col] = linha da rainha na coluna col
         self.nodes_visited = 0 # Custo computacional
+        # Instrumentacao opcional (nós e podas por coluna); None mantém o custo de um teste por nó
+        self.instrumentation = instrumentation
+        # Cancelamento opcional (objeto com is_set(), ex.: prazo.Prazo), usado por find_best_solution
+        self.cancel = None
+        self.best_prefix = [] # Prefixo consistente mais profundo visto antes do cancelamento
 
     def is_safe(self, row, col):
         """Verifica se é seguro colocar uma rainha em board[col] = row."""
@@ -21,14 +38,29 @@ class EightQueensBacktracking:
                 return False
         return True
 
+    def _attacked_rows(self, col):
+        """Linhas da coluna col já atacadas (ramos podados); só usado pela instrumentação."""
+        return sum(1 for row in range(self.n) if not self.is_safe(row, col))
+
+    def _check_cancel(self, col):
+        """Guarda board[:col] se for o prefixo mais profundo e interrompe se `cancel` foi acionado."""
+        if col > len(self.best_prefix):
+            self.best_prefix = self.board[:col]
+        if self.cancel.is_set():
+            raise _Cancelled
+
     def solve_nq_util(self, col, find_all=False):
         """Função utilitária recursiva para resolver o problema."""
         self.nodes_visited += 1
+        if self.cancel is not None: self._check_cancel(col)
         if col >= self.n:
+            if self.instrumentation is not None: self.instrumentation.no(col)
             self.solutions.append(list(self.board))
             return True # Retorna True se uma solução foi encontrada
 
         res = False
+        if self.instrumentation is not None:
+            self.instrumentation.no(col, self._attacked_rows(col))
         for i in range(self.n):
             if self.is_safe(i, col):
                 self.board[col] = i
@@ -40,19 +72,219 @@ class EightQueensBacktracking:
                 self.board[col] = -1 # Backtrack
         return res
 
-    def find_one_solution(self):
+    def solve_nq_bitmask(self, col, rows, diag_desc, diag_asc, find_all=False):
+        """
+        Versão com máscaras de bits: linhas ocupadas e as duas direções de diagonal
+        são inteiros, então as casas livres da coluna saem em O(1) por nó.
+        As linhas são testadas em ordem crescente, visitando a mesma árvore do is_safe.
+        """
+        self.nodes_visited += 1
+        if self.cancel is not None: self._check_cancel(col)
+        if col >= self.n:
+            if self.instrumentation is not None: self.instrumentation.no(col)
+            self.solutions.append(list(self.board))
+            return True
+
+        full = (1 << self.n) - 1
+        free = ~(rows | diag_desc | diag_asc) & full
+        if self.instrumentation is not None:
+            self.instrumentation.no(col, self.n - bin(free).count("1"))
+        res = False
+        while free:
+            bit = free & -free # Bit menos significativo = menor linha livre
+            free ^= bit
+            self.board[col] = bit.bit_length() - 1
+            if self.solve_nq_bitmask(col + 1, rows | bit,
+                                     ((diag_desc | bit) << 1) & full,
+                                     (diag_asc | bit) >> 1, find_all):
+                if not find_all:
+                    return True
+                res = True
+            self.board[col] = -1 # Backtrack
+        return res
+
+    def _iter_classic(self, col):
+        """Versão geradora de solve_nq_util: produz cada solução assim que é completada."""
+        self.nodes_visited += 1
+        if self.cancel is not None: self._check_cancel(col)
+        if col >= self.n:
+            if self.instrumentation is not None: self.instrumentation.no(col)
+            yield list(self.board)
+            return
+        if self.instrumentation is not None:
+            self.instrumentation.no(col, self._attacked_rows(col))
+        for i in range(self.n):
+            if self.is_safe(i, col):
+                self.board[col] = i
+                yield from self._iter_classic(col + 1)
+                self.board[col] = -1 # Backtrack
+
+    def _iter_bitmask(self, col, rows, diag_desc, diag_asc):
+        """Versão geradora de solve_nq_bitmask."""
+        self.nodes_visited += 1
+        if self.cancel is not None: self._check_cancel(col)
+        if col >= self.n:
+            if self.instrumentation is not None: self.instrumentation.no(col)
+            yield list(self.board)
+            return
+        full = (1 << self.n) - 1
+        free = ~(rows | diag_desc | diag_asc) & full
+        if self.instrumentation is not None:
+            self.instrumentation.no(col, self.n - bin(free).count("1"))
+        while free:
+            bit = free & -free
+            free ^= bit
+            self.board[col] = bit.bit_length() - 1
+            yield from self._iter_bitmask(col + 1, rows | bit,
+                                          ((diag_desc | bit) << 1) & full,
+                                          (diag_asc | bit) >> 1)
+            self.board[col] = -1 # Backtrack
+
+    def _count_classic(self, col):
+        """Conta as soluções abaixo de col sem copiar nenhum tabuleiro."""
+        self.nodes_visited += 1
+        if col >= self.n:
+            if self.instrumentation is not None: self.instrumentation.no(col)
+            return 1
+        count = 0
+        if self.instrumentation is not None:
+            self.instrumentation.no(col, self._attacked_rows(col))
+        for i in range(self.n):
+            if self.is_safe(i, col):
+                self.board[col] = i
+                count += self._count_classic(col + 1)
+                self.board[col] = -1 # Backtrack
+        return count
+
+    def _count_bitmask(self, col, rows, diag_desc, diag_asc):
+        """Conta as soluções só com as máscaras; o tabuleiro nem é preenchido."""
+        self.nodes_visited += 1
+        if col >= self.n:
+            if self.instrumentation is not None: self.instrumentation.no(col)
+            return 1
+        full = (1 << self.n) - 1
+        free = ~(rows | diag_desc | diag_asc) & full
+        if self.instrumentation is not None:
+            self.instrumentation.no(col, self.n - bin(free).count("1"))
+        count = 0
+        while free:
+            bit = free & -free
+            free ^= bit
+            count += self._count_bitmask(col + 1, rows | bit,
+                                         ((diag_desc | bit) << 1) & full,
+                                         (diag_asc | bit) >> 1)
+        return count
+
+    def _count(self, col=0):
+        """Executa o caminho só-contagem da engine configurada a partir de col."""
+        if self.engine == "bitmask":
+            return self._count_bitmask(col, *self._masks_for(col))
+        return self._count_classic(col)
+
+    def iter_solutions(self, limit=None, cancel=None):
+        """
+        Gera as soluções uma a uma, na mesma ordem de find_all_solutions, sem acumulá-las
+        em self.solutions. limit=k para nas k primeiras; parar de consumir o gerador
+        também interrompe a busca, assim como cancel.is_set() (consultado a cada nó,
+        mesmo em subárvores sem solução). nodes_visited reflete apenas o que foi explorado.
+        """
+        self.board = [-1] * self.n
+        self.nodes_visited = 0
+        self.best_prefix = []
+        if limit is not None and limit <= 0:
+            return
+        if self.engine == "bitmask":
+            solutions = self._iter_bitmask(0, 0, 0, 0)
+        else:
+            solutions = self._iter_classic(0)
+        self.cancel = cancel
+        try:
+            for index, board in enumerate(solutions, start=1):
+                yield board
+                if limit is not None and index >= limit:
+                    break # Não explora além da k-ésima solução
+        except _Cancelled:
+            pass
+        finally:
+            self.cancel = None
+
+    def count_solutions(self, measure_memory=True):
+        """Conta todas as soluções em memória constante (nenhum tabuleiro é materializado)."""
+        self.solutions = []
+        self.board = [-1] * self.n
+        self.nodes_visited = 0
+        if measure_memory: tracemalloc.start()
+        start_time = time.perf_counter()
+
+        with medir_fase(self.instrumentation, "busca"):
+            count = self._count()
+
+        end_time = time.perf_counter()
+        peak = 0
+        if measure_memory:
+            current, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+        execution_time = end_time - start_time
+        memory_used_peak = peak / 1024  # Convertendo para KB
+
+        return count, execution_time, memory_used_peak, self.nodes_visited
+
+    def _masks_for(self, col):
+        """Máscaras (linhas, diagonal descendente, diagonal ascendente) vistas pela coluna col."""
+        full = (1 << self.n) - 1
+        rows = diag_desc = diag_asc = 0
+        for prev_col in range(col):
+            row = self.board[prev_col]
+            dist = col - prev_col
+            rows |= 1 << row
+            diag_desc |= (1 << (row + dist)) & full
+            if row >= dist:
+                diag_asc |= 1 << (row - dist)
+        return rows, diag_desc, diag_asc
+
+    def _solve(self, find_all, col=0):
+        """Executa a engine configurada a partir de col, com board[:col] já preenchido."""
+        if self.engine == "bitmask":
+            return self.solve_nq_bitmask(col, *self._masks_for(col), find_all)
+        return self.solve_nq_util(col, find_all)
+
+    def _solve_half(self):
+        """
+        Enumera só as soluções com a rainha da primeira coluna na metade superior
+        (e, para N ímpar com a rainha no meio, a da segunda coluna na metade superior).
+        O espelho vertical leva essas soluções exatamente nas restantes.
+        """
+        self.nodes_visited += 1 # Nó raiz (coluna 0), como na busca completa
+        mid = self.n // 2
+        for row in range(mid):
+            self.board[0] = row
+            self._solve(find_all=True, col=1)
+        if self.n % 2 == 1:
+            self.board[0] = mid
+            self.nodes_visited += 1 # Nó da coluna 1
+            for row in range(mid):
+                if self.is_safe(row, 1):
+                    self.board[1] = row
+                    self._solve(find_all=True, col=2)
+        self.board = [-1] * self.n
+
+    def find_one_solution(self, measure_memory=True):
         """Encontra a primeira solução válida."""
         self.solutions = []
         self.board = [-1] * self.n
         self.nodes_visited = 0
-        tracemalloc.start()
+        if measure_memory: tracemalloc.start()
         start_time = time.perf_counter()
 
-        self.solve_nq_util(0, find_all=False)
+        with medir_fase(self.instrumentation, "busca"):
+            self._solve(find_all=False)
 
         end_time = time.perf_counter()
-        current, peak = tracemalloc.get_traced_memory()
-        tracemalloc.stop()
+        peak = 0
+        if measure_memory:
+            current, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
 
         execution_time = end_time - start_time
         memory_used_peak = peak / 1024  # Convertendo para KB
@@ -61,27 +293,192 @@ class EightQueensBacktracking:
             return self.solutions[0], execution_time, memory_used_peak, self.nodes_visited
         return None, execution_time, memory_used_peak, self.nodes_visited
 
-    def find_all_solutions(self):
-        """Encontra todas as 92 soluções."""
+    def find_best_solution(self, cancel):
+        """
+        find_one_solution interrompível: a busca para quando cancel.is_set() (consultado
+        a cada nó). Sem solução até lá, completa o prefixo consistente mais profundo
+        colocando cada rainha restante na linha de menos conflitos.
+        Retorna (tabuleiro, conflitos, nós visitados).
+        """
+        self.solutions = []
+        self.board = [-1] * self.n
+        self.nodes_visited = 0
+        self.best_prefix = []
+        self.cancel = cancel
+        try:
+            self._solve(find_all=False)
+        except _Cancelled:
+            pass
+        finally:
+            self.cancel = None
+        if self.solutions:
+            return self.solutions[0], 0, self.nodes_visited
+        board, conflicts = complete_greedily(self.best_prefix, self.n)
+        return board, conflicts, self.nodes_visited
+
+    def find_all_solutions(self, measure_memory=True):
+        """Encontra todas as soluções (92 para N=8)."""
         self.solutions = []
         self.board = [-1] * self.n
         self.nodes_visited = 0
-        tracemalloc.start()
+        if measure_memory: tracemalloc.start()
         start_time = time.perf_counter()
 
-        self.solve_nq_util(0, find_all=True)
+        with medir_fase(self.instrumentation, "busca"):
+            self._solve(find_all=True)
 
         end_time = time.perf_counter()
-        current, peak = tracemalloc.get_traced_memory()
-        tracemalloc.stop()
+        peak = 0
+        if measure_memory:
+            current, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
 
         execution_time = end_time - start_time
         memory_used_peak = peak / 1024  # Convertendo para KB
 
         return self.solutions, execution_time, memory_used_peak, self.nodes_visited
 
-def get_backtracking_metrics(num_runs=5):
-    solver_bt = EightQueensBacktracking()
+    def find_unique_solutions(self, measure_memory=True):
+        """
+        Enumera com poda por espelhamento e retorna as soluções fundamentais
+        (12 para N=8) junto com o total de soluções (92 para N=8).
+        O conjunto completo pode ser obtido sob demanda com expand_canonical.
+        """
+        self.solutions = []
+        self.board = [-1] * self.n
+        self.nodes_visited = 0
+        if measure_memory: tracemalloc.start()
+        start_time = time.perf_counter()
+
+        if self.n == 1: # Única solução é simétrica a si mesma
+            self.nodes_visited = 2
+            self.solutions.append([0])
+            total = 1
+        else:
+            with medir_fase(self.instrumentation, "busca"):
+                self._solve_half()
+            total = 2 * len(self.solutions)
+        # O menor representante (lexicográfico) de cada classe sempre cai na metade explorada
+        with medir_fase(self.instrumentation, "canonicas"):
+            unique = [s for s in self.solutions if s == min(symmetries(s))]
+
+        end_time = time.perf_counter()
+        peak = 0
+        if measure_memory:
+            current, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+        execution_time = end_time - start_time
+        memory_used_peak = peak / 1024  # Convertendo para KB
+
+        return unique, total, execution_time, memory_used_peak, self.nodes_visited
+
+    def _split_prefixes(self, col, depth, prefixes):
+        """Gera os prefixos seguros das primeiras `depth` colunas, contando os nós desses níveis."""
+        if col == depth:
+            prefixes.append(self.board[:col])
+            return
+        self.nodes_visited += 1
+        for row in range(self.n):
+            if self.is_safe(row, col):
+                self.board[col] = row
+                self._split_prefixes(col + 1, depth, prefixes)
+                self.board[col] = -1
+
+    def find_all_solutions_parallel(self, workers=None, split_depth=2, count_only=False, measure_memory=True):
+        """
+        Encontra todas as soluções dividindo a árvore nas `split_depth` primeiras colunas
+        e resolvendo cada subárvore em um processo do pool. nodes_visited soma os nós do
+        processo principal e dos workers, então é igual ao da busca serial. Com
+        count_only=True o primeiro elemento do retorno é a contagem, não a lista.
+        A memória medida é apenas a do processo principal.
+        """
+        self.solutions = []
+        self.board = [-1] * self.n
+        self.nodes_visited = 0
+        if measure_memory: tracemalloc.start()
+        start_time = time.perf_counter()
+
+        prefixes = []
+        self._split_prefixes(0, min(split_depth, self.n), prefixes)
+        tasks = [(self.n, self.engine, prefix, count_only) for prefix in prefixes]
+        count = 0
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # map preserva a ordem dos prefixos: a lista final sai na mesma ordem da serial
+            for result, nodes in executor.map(_solve_subproblem, tasks):
+                self.nodes_visited += nodes
+                if count_only:
+                    count += result
+                else:
+                    self.solutions.extend(result)
+
+        end_time = time.perf_counter()
+        peak = 0
+        if measure_memory:
+            current, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+        execution_time = end_time - start_time
+        memory_used_peak = peak / 1024  # Convertendo para KB
+
+        result = count if count_only else self.solutions
+        return result, execution_time, memory_used_peak, self.nodes_visited
+
+def _solve_subproblem(task):
+    """Worker do modo paralelo: resolve a subárvore abaixo de um prefixo fixo."""
+    n, engine, prefix, count_only = task
+    solver = EightQueensBacktracking(n, engine=engine)
+    solver.board[:len(prefix)] = prefix
+    if count_only:
+        return solver._count(col=len(prefix)), solver.nodes_visited
+    solver._solve(find_all=True, col=len(prefix))
+    return solver.solutions, solver.nodes_visited
+
+def complete_greedily(prefix, n):
+    """
+    Completa um prefixo (linhas das primeiras colunas) até N colunas, cada rainha na
+    linha que menos ataca as já colocadas. Contadores por linha e diagonal dão os
+    ataques de cada casa em O(1), então o custo é O(N²). Retorna (tabuleiro, pares em conflito).
+    """
+    rows, diag_sum, diag_diff = [0] * n, [0] * (2 * n - 1), [0] * (2 * n - 1)
+    board = []
+    conflicts = 0
+    for col in range(n):
+        if col < len(prefix):
+            row = prefix[col]
+        else:
+            row = min(range(n), key=lambda r: rows[r] + diag_sum[col + r] + diag_diff[col - r + n - 1])
+        conflicts += rows[row] + diag_sum[col + row] + diag_diff[col - row + n - 1]
+        rows[row] += 1; diag_sum[col + row] += 1; diag_diff[col - row + n - 1] += 1
+        board.append(row)
+    return board, conflicts
+
+def symmetries(board):
+    """As 8 imagens de uma solução pelo grupo diedral do tabuleiro (podem se repetir)."""
+    n = len(board)
+    images = []
+    current = list(board)
+    for _ in range(4):
+        images.append(current)
+        images.append([n - 1 - row for row in current]) # Espelho vertical
+        rotated = [0] * n # Rotação de 90°: (col, row) -> (row, n - 1 - col)
+        for col, row in enumerate(current):
+            rotated[row] = n - 1 - col
+        current = rotated
+    return images
+
+def expand_canonical(unique_solutions):
+    """Gera, sob demanda, todas as soluções a partir das fundamentais."""
+    for board in unique_solutions:
+        seen = set()
+        for image in symmetries(board):
+            key = tuple(image)
+            if key not in seen:
+                seen.add(key)
+                yield image
+
+def get_backtracking_metrics(num_runs=5, n=8, engine="classic", workers=None, store_path=None):
+    solver_bt = EightQueensBacktracking(n, engine=engine)
     
     # Metrics for finding one solution
     times_one, mems_one, costs_one = [], [], []
@@ -112,8 +509,36 @@ def get_backtracking_metrics(num_runs=5):
     avg_time_all = sum(times_all) / len(times_all) if times_all else 0
     avg_mem_all = sum(mems_all) / len(mems_all) if mems_all else 0
     avg_cost_all = sum(costs_all) / len(costs_all) if costs_all else 0
-            
-    return {
+
+    # Metrics for the count-only path (sem materializar tabuleiros)
+    times_cnt, mems_cnt, costs_cnt = [], [], []
+    solutions_count_cnt = 0
+    for _ in range(num_runs):
+        count, time_val, mem_val, cost_val = solver_bt.count_solutions()
+        solutions_count_cnt = count
+        times_cnt.append(time_val)
+        mems_cnt.append(mem_val)
+        costs_cnt.append(cost_val)
+
+    avg_time_cnt = sum(times_cnt) / len(times_cnt) if times_cnt else 0
+    avg_mem_cnt = sum(mems_cnt) / len(mems_cnt) if mems_cnt else 0
+    avg_cost_cnt = sum(costs_cnt) / len(costs_cnt) if costs_cnt else 0
+
+    # Metrics for symmetry-reduced enumeration
+    times_sym, mems_sym, costs_sym = [], [], []
+    total_count_sym = unique_count_sym = 0
+    for _ in range(num_runs):
+        unique, total, time_val, mem_val, cost_val = solver_bt.find_unique_solutions()
+        total_count_sym, unique_count_sym = total, len(unique)
+        times_sym.append(time_val)
+        mems_sym.append(mem_val)
+        costs_sym.append(cost_val)
+
+    avg_time_sym = sum(times_sym) / len(times_sym) if times_sym else 0
+    avg_mem_sym = sum(mems_sym) / len(mems_sym) if mems_sym else 0
+    avg_cost_sym = sum(costs_sym) / len(costs_sym) if costs_sym else 0
+
+    metrics = {
         "find_one": {
             "avg_time_s": avg_time_one,
             "avg_mem_peak_kb": avg_mem_one,
@@ -125,11 +550,95 @@ def get_backtracking_metrics(num_runs=5):
             "avg_mem_peak_kb": avg_mem_all,
             "avg_cost_nodes": avg_cost_all,
             "solutions_count": solutions_count_example
+        },
+        "count_all": {
+            "avg_time_s": avg_time_cnt,
+            "avg_mem_peak_kb": avg_mem_cnt,
+            "avg_cost_nodes": avg_cost_cnt,
+            "solutions_count": solutions_count_cnt
+        },
+        "find_all_symmetric": {
+            "avg_time_s": avg_time_sym,
+            "avg_mem_peak_kb": avg_mem_sym,
+            "avg_cost_nodes": avg_cost_sym,
+            "solutions_count": total_count_sym,
+            "unique_solutions_count": unique_count_sym
         }
     }
 
+    # Metrics for the process-pool enumeration (opcional: o pool custa caro para N pequeno)
+    if workers:
+        times_par, costs_par = [], []
+        solutions_count_par = 0
+        for _ in range(num_runs):
+            solutions, time_val, mem_val, cost_val = solver_bt.find_all_solutions_parallel(workers=workers)
+            solutions_count_par = len(solutions)
+            times_par.append(time_val)
+            costs_par.append(cost_val)
+        metrics["find_all_parallel"] = {
+            "workers": workers,
+            "avg_time_s": sum(times_par) / len(times_par) if times_par else 0,
+            "avg_cost_nodes": sum(costs_par) / len(costs_par) if costs_par else 0,
+            "solutions_count": solutions_count_par
+        }
+
+    # Metrics for the on-disk store: frio (enumera e grava) vs quente (abre mapeado)
+    if store_path:
+        import solution_store # Importado aqui: solution_store depende deste módulo
+        metrics["find_all_store"] = solution_store.measure_store(n, store_path, num_runs, engine)
+
+    return metrics
+
+@registrar("backtracking")
+class BacktrackingSolver(Solver):
+    """Solver do registro para o backtracking; solve_many reaproveita a mesma instância."""
+    engine = "classic"
+    chave_custo = "avg_cost_nodes"
+    rotulo_custo = "Nós Visitados"
+    estocastico = False
+    runs_padrao = 5
+
+    def __init__(self, n=8):
+        super().__init__(n)
+        self.solver = None
+
+    def single_run(self, medir_memoria=True, instrumentacao=None):
+        solver = self.solver
+        if solver is None or instrumentacao is not None:
+            solver = EightQueensBacktracking(self.n, engine=self.engine, instrumentation=instrumentacao)
+        solution, time_val, mem_val, cost_val = solver.find_one_solution(measure_memory=medir_memoria)
+        return solution, time_val, mem_val, cost_val, solution is not None
+
+    def iter_solutions(self, limite=None, cancelado=None):
+        return EightQueensBacktracking(self.n, engine=self.engine).iter_solutions(limite, cancelado)
+
+    def _find_best(self, cancelado, instrumentacao=None):
+        solver = self.solver
+        if solver is None or instrumentacao is not None:
+            solver = EightQueensBacktracking(self.n, engine=self.engine, instrumentation=instrumentacao)
+        return solver.find_best_solution(cancelado)
+
+    def warm_up(self):
+        self.solver = EightQueensBacktracking(self.n, engine=self.engine)
+
+    def metrics(self, num_runs=None):
+        return get_backtracking_metrics(self._num_runs(num_runs), self.n, self.engine)
+
+@registrar("backtracking_bitmask")
+class BitmaskBacktrackingSolver(BacktrackingSolver):
+    engine = "bitmask"
+    rotulo = "Backtracking (bitmask)"
+
+    def metrics(self, num_runs=None):
+        import solution_store # Importado aqui: solution_store depende deste módulo
+        return get_backtracking_metrics(self._num_runs(num_runs), self.n, self.engine,
+                                        store_path=solution_store.default_store_path(self.n))
+
 if __name__ == '__main__':
-    metrics = get_backtracking_metrics(num_runs=5)
+    import sys
+    engine = sys.argv[1] if len(sys.argv) > 1 else "classic"
+    metrics = get_backtracking_metrics(num_runs=5, engine=engine)
+    print(f"Engine: {engine}")
     print("Backtracking Metrics (Find One):")
     print(f"  Avg Time: {metrics['find_one']['avg_time_s']:.6f} s")
     print(f"  Avg Peak Memory: {metrics['find_one']['avg_mem_peak_kb']:.2f} KB")
@@ -140,4 +649,15 @@ if __name__ == '__main__':
     print(f"  Avg Peak Memory: {metrics['find_all']['avg_mem_peak_kb']:.2f} KB")
     print(f"  Avg Cost (Nodes Visited): {metrics['find_all']['avg_cost_nodes']:.2f}")
     print(f"  Solutions Count: {metrics['find_all']['solutions_count']}")
+    print("\nBacktracking Metrics (Count All, no boards kept):")
+    print(f"  Avg Time: {metrics['count_all']['avg_time_s']:.6f} s")
+    print(f"  Avg Peak Memory: {metrics['count_all']['avg_mem_peak_kb']:.2f} KB")
+    print(f"  Avg Cost (Nodes Visited): {metrics['count_all']['avg_cost_nodes']:.2f}")
+    print(f"  Solutions Count: {metrics['count_all']['solutions_count']}")
+    print("\nBacktracking Metrics (Find All, symmetry-reduced):")
+    print(f"  Avg Time: {metrics['find_all_symmetric']['avg_time_s']:.6f} s")
+    print(f"  Avg Peak Memory: {metrics['find_all_symmetric']['avg_mem_peak_kb']:.2f} KB")
+    print(f"  Avg Cost (Nodes Visited): {metrics['find_all_symmetric']['avg_cost_nodes']:.2f}")
+    print(f"  Solutions Count: {metrics['find_all_symmetric']['solutions_count']}")
+    print(f"  Unique Solutions Count: {metrics['find_all_symmetric']['unique_solutions_count']}")
 
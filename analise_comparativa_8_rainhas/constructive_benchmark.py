@@ -0,0 +1,113 @@
+"""
+Solução construtiva, sem busca, para o problema das N Rainhas (versão para benchmark).
+
+Usa a construção explícita clássica (Hoffman, Loessi e Moser): listar as linhas
+pares e depois as ímpares (numeração a partir de 1) já dá uma solução, exceto quando
+N mod 6 é 2 ou 3, casos corrigidos reposicionando alguns poucos valores. Cada coluna
+recebe sua linha diretamente, então o custo é O(N) em tempo e memória e serve de
+referência para os métodos de busca de uma solução até N=10⁶.
+"""
+import time
+import tracemalloc
+
+from instrumentacao import medir_fase
+from min_conflicts_benchmark import verificar_solucao
+from registro_solvers import Solver, registrar
+
+NUM_RAINHAS = 8
+
+def solucao_construtiva(n=NUM_RAINHAS):
+    """
+    Solução para N rainhas em O(N) (solucao[coluna] = linha, linhas a partir de 0),
+    ou None para N=2 e N=3, que não têm solução.
+    """
+    if n < 1 or n in (2, 3):
+        return None
+    resto = n % 6
+    # Em numeração 0-based, os "pares" 2, 4, ... são as linhas 1, 3, ... e vice-versa
+    if resto == 2:
+        pares = list(range(1, n, 2))
+        impares = [2, 0] + list(range(6, n, 2)) + [4] # 3, 1, 7, 9, ..., 5
+    elif resto == 3:
+        pares = list(range(3, n, 2)) + [1] # 4, 6, ..., N-1, 2
+        impares = list(range(4, n, 2)) + [0, 2] # 5, 7, ..., N, 1, 3
+    else:
+        pares = list(range(1, n, 2))
+        impares = list(range(0, n, 2))
+    return pares + impares
+
+def constructive_single_run(n=NUM_RAINHAS, medir_memoria=True, instrumentacao=None):
+    """
+    Constrói e verifica uma solução. O custo é o número de rainhas posicionadas (N),
+    comparável às avaliações/nós das buscas.
+    """
+    if medir_memoria: tracemalloc.start()
+    start_time = time.perf_counter()
+
+    with medir_fase(instrumentacao, "construcao"):
+        solucao = solucao_construtiva(n)
+    with medir_fase(instrumentacao, "verificacao"):
+        is_solution = solucao is not None and verificar_solucao(solucao)
+
+    end_time = time.perf_counter()
+    peak_mem = 0
+    if medir_memoria:
+        current_mem, peak_mem = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    return solucao if is_solution else None, end_time - start_time, peak_mem / 1024, n, is_solution  # KB
+
+def get_constructive_metrics(num_runs=5, n=NUM_RAINHAS, medir_memoria=True):
+    times, mems = [], []
+    solution_example = None
+    found = False
+
+    for _ in range(num_runs):
+        solution, time_val, mem_val, _, found = constructive_single_run(n, medir_memoria=medir_memoria)
+        times.append(time_val)
+        mems.append(mem_val)
+        if found and solution_example is None and n <= 64:
+            solution_example = solution
+
+    return {
+        "find_one": {
+            "n": n,
+            "avg_time_s": sum(times) / len(times) if times else 0,
+            "avg_mem_peak_kb": sum(mems) / len(mems) if mems else 0,
+            "cost_placements": n,
+            "success_rate": 1.0 if found else 0.0,
+            "solution_example": solution_example
+        }
+    }
+
+@registrar("constructive")
+class ConstructiveSolver(Solver):
+    rotulo = "Solução Construtiva"
+    chave_custo = "cost_placements"
+    rotulo_custo = "Rainhas Posicionadas"
+    estocastico = False
+    runs_padrao = 5
+
+    def single_run(self, medir_memoria=True, instrumentacao=None):
+        return constructive_single_run(self.n, medir_memoria, instrumentacao)
+
+    def iter_solutions(self, limite=None, cancelado=None):
+        """A construção é determinística e O(N): no máximo uma solução, sem cancelamento."""
+        solucao = solucao_construtiva(self.n)
+        if solucao is not None and (limite is None or limite > 0):
+            yield solucao
+
+    def metrics(self, num_runs=None):
+        return get_constructive_metrics(self._num_runs(num_runs), self.n)
+
+if __name__ == '__main__':
+    import sys
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else NUM_RAINHAS
+    medir_memoria = "--sem-memoria" not in sys.argv
+    metrics_c = get_constructive_metrics(n=n, medir_memoria=medir_memoria)
+    print(f"Constructive Metrics (Find One, N={n}):")
+    print(f"  Avg Time: {metrics_c['find_one']['avg_time_s']:.6f} s")
+    print(f"  Avg Peak Memory: {metrics_c['find_one']['avg_mem_peak_kb']:.2f} KB")
+    print(f"  Valid: {metrics_c['find_one']['success_rate'] == 1.0}")
+    if metrics_c['find_one']['solution_example']:
+        print(f"  Solution Example: {metrics_c['find_one']['solution_example']}")
@@ -1,12 +1,39 @@
 """
 Script para gerar gráficos comparativos do desempenho dos algoritmos para o problema das 8 Rainhas,
 utilizando Matplotlib e os dados do arquivo benchmark_metrics.json.
+
+Cada gráfico é descrito por uma tarefa (arquivo, função de desenho, fatia das métricas que
+ele usa). A impressão digital da tarefa (fatia + código do módulo que desenha) é gravada em
+ARQUIVO_IMPRESSOES no diretório de saída, e os gráficos cuja impressão não mudou e cujo PNG
+ainda existe não são redesenhados. O código entra como o fonte do módulo inteiro, já que as
+funções de desenho dependem de auxiliares e constantes compartilhados. Os pendentes são
+desenhados em processos separados, com o backend Agg (sem janela); o Matplotlib só é
+importado dentro de quem desenha.
+
+Se houver execuções individuais gravadas por run_benchmarks.py (ARQUIVO_EXECUCOES), também
+são gerados, sem rodar nada de novo, histogramas e CDFs empíricas de tempo e custo por
+algoritmo, com os percentis p50/p95/p99 marcados.
 """
+import argparse
+import hashlib
+import inspect
 import json
-import matplotlib.pyplot as plt
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
 import numpy as np
 
-def load_metrics(filepath="/home/ubuntu/benchmark_metrics.json"):
+from historico_benchmarks import (ARQUIVO_EXECUCOES, ARQUIVO_METRICAS, DIRETORIO_RESULTADOS, SECOES_IGNORADAS,
+                                  carregar_execucoes)
+import registro_solvers
+
+ARQUIVO_IMPRESSOES = ".impressoes_graficos.json" # Impressões digitais dos gráficos já gerados
+PERCENTIS = (50, 95, 99)
+ESTILOS_PERCENTIS = {50: ("green", "--", "o"), 95: ("orange", "-.", "s"), 99: ("red", ":", "^")}
+CORES = ["skyblue", "lightcoral", "lightgreen", "plum", "khaki", "lightsalmon", "paleturquoise", "silver"]
+
+def load_metrics(filepath=ARQUIVO_METRICAS):
     """Carrega as métricas do arquivo JSON."""
     try:
         with open(filepath, "r") as f:
@@ -19,132 +46,338 @@ def load_metrics(filepath="/home/ubuntu/benchmark_metrics.json"):
         print(f"Erro: Falha ao decodificar o JSON do arquivo {filepath}")
         return None
 
-def plot_comparison_charts(metrics, output_dir="/home/ubuntu/"):
-    """Gera e salva os gráficos comparativos."""
-    if not metrics:
-        print("Nenhuma métrica para plotar.")
-        return
+@lru_cache(maxsize=None)
+def _pyplot():
+    """Importa o pyplot com backend sem janela, uma vez por processo."""
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    return plt
+
+def _desenhar_barras(dados, caminho):
+    """Gráfico de barras com o valor escrito sobre cada barra."""
+    plt = _pyplot()
+    plt.figure(figsize=dados["figsize"])
+    bars = plt.bar(dados["labels"], dados["values"], color=dados["colors"])
+    plt.ylabel(dados["ylabel"])
+    plt.title(dados["title"])
+    if len(dados["labels"]) > 4: # Muitos algoritmos: rótulos inclinados para não se sobreporem
+        plt.xticks(rotation=30, ha="right")
+    if dados.get("log"):
+        plt.yscale("log") # Usar escala logarítmica devido a grandes variações
+    for bar in bars:
+        yval = bar.get_height()
+        plt.text(bar.get_x() + bar.get_width()/2.0, yval, dados["format"].format(yval), va="bottom", ha="center",
+                 fontsize="small" if len(bars) > 4 else None)
+    plt.tight_layout()
+    plt.savefig(caminho)
+    plt.close()
+
+def _desenhar_curvas(dados, caminho):
+    """Curvas de escala (valor em função de N, eixo Y log), uma por algoritmo."""
+    plt = _pyplot()
+    plt.figure(figsize=(10, 6))
+    for nome, xs, ys in dados["series"]:
+        plt.plot(xs, ys, marker="o", markersize=3, label=nome)
+    plt.yscale("log")
+    plt.xlabel("N (tamanho do tabuleiro)")
+    plt.ylabel(f"{dados['ylabel']} - Escala Logarítmica")
+    plt.title(dados["title"])
+    plt.grid(True, which="both", alpha=0.3)
+    plt.legend()
+    plt.savefig(caminho)
+    plt.close()
+
+def _ecdf(valores):
+    """Pontos (x, y) da CDF empírica."""
+    x = np.sort(valores)
+    return x, np.arange(1, x.size + 1) / x.size
+
+def _desenhar_distribuicao(dados, caminho):
+    """Histograma e CDF empírica de cada medida (uma linha por medida), com os percentis."""
+    plt = _pyplot()
+    fig, eixos = plt.subplots(len(dados["rows"]), 2, figsize=(12, 4.5 * len(dados["rows"])), squeeze=False)
+    for (ax_hist, ax_cdf), linha in zip(eixos, dados["rows"]):
+        valores = np.asarray(linha["values"], dtype=float)
+        # Caudas longas (tentativas geométricas do Random Restart) só são legíveis em escala log
+        log = valores.min() > 0 and valores.max() / valores.min() > 10
+        bins = np.geomspace(valores.min(), valores.max(), 30) if log else 30
+        ax_hist.hist(valores, bins=bins, color="skyblue", edgecolor="gray")
+        ax_hist.set_ylabel("Execuções")
+        x, y = _ecdf(valores)
+        ax_cdf.step(x, y, where="post", color="steelblue")
+        ax_cdf.set_ylabel("Fração das execuções")
+        for ax in (ax_hist, ax_cdf):
+            if log:
+                ax.set_xscale("log")
+            ax.set_xlabel(linha["label"])
+            for p, valor in linha["percentiles"].items():
+                cor, estilo, _ = ESTILOS_PERCENTIS[int(p)]
+                ax.axvline(valor, color=cor, linestyle=estilo, label=f"p{p} = {valor:.4g}")
+            ax.grid(True, which="both", alpha=0.3)
+        ax_cdf.legend(loc="lower right")
+    fig.suptitle(dados["title"])
+    fig.tight_layout()
+    fig.savefig(caminho)
+    plt.close(fig)
+
+def _desenhar_cdfs(dados, caminho):
+    """CDFs empíricas de todos os algoritmos sobrepostas, com marcadores nos percentis."""
+    plt = _pyplot()
+    plt.figure(figsize=(10, 6))
+    for nome, valores, percentis in dados["series"]:
+        x, y = _ecdf(valores)
+        linha, = plt.step(x, y, where="post", label=nome)
+        for p, valor in percentis.items():
+            _, _, marcador = ESTILOS_PERCENTIS[int(p)]
+            plt.plot([valor], [int(p) / 100], marker=marcador, color=linha.get_color(), linestyle="none")
+    plt.xscale("log")
+    plt.xlabel(f"{dados['xlabel']} - Escala Logarítmica")
+    plt.ylabel("Fração das execuções bem-sucedidas")
+    plt.title(dados["title"])
+    plt.grid(True, which="both", alpha=0.3)
+    plt.legend(fontsize="small")
+    plt.savefig(caminho)
+    plt.close()
+
+def _barras(labels, values, ylabel, title, formato, figsize=None, log=False, cores=None):
+    figsize = figsize or (max(10, 1.1 * len(labels)), 6)
+    return {"labels": labels, "values": values, "ylabel": ylabel, "title": title, "format": formato,
+            "figsize": figsize, "log": log, "colors": cores or [CORES[i % len(CORES)] for i in range(len(labels))]}
+
+@lru_cache(maxsize=None)
+def _impressao_codigo(funcao):
+    # O módulo inteiro, não só a função: ela depende de _pyplot, _ecdf, estilos e constantes
+    return hashlib.sha256(inspect.getsource(inspect.getmodule(funcao)).encode()).hexdigest()
+
+def impressao_digital(funcao, dados):
+    """Hash da fatia de métricas do gráfico e do código do módulo que o desenha."""
+    conteudo = json.dumps(dados, sort_keys=True, default=str)
+    return hashlib.sha256((_impressao_codigo(funcao) + conteudo).encode()).hexdigest()
+
+def _renderizar(tarefa):
+    nome_arquivo, funcao, dados, caminho = tarefa
+    funcao(dados, caminho)
+    return nome_arquivo
+
+def gerar_graficos(tarefas, output_dir=DIRETORIO_RESULTADOS + os.sep, forcar=False, processos=None):
+    """
+    Desenha as tarefas (nome_arquivo, funcao, dados) desatualizadas em `output_dir`.
+    `forcar` ignora as impressões gravadas; `processos` limita os processos de desenho
+    (padrão: um por CPU). Retorna os nomes dos arquivos (re)gerados.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    caminho_impressoes = os.path.join(output_dir, ARQUIVO_IMPRESSOES)
+    try:
+        with open(caminho_impressoes) as f:
+            impressoes = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        impressoes = {}
+
+    pendentes = []
+    for nome_arquivo, funcao, dados in tarefas:
+        impressao = impressao_digital(funcao, dados)
+        caminho = os.path.join(output_dir, nome_arquivo)
+        if not forcar and impressoes.get(nome_arquivo) == impressao and os.path.exists(caminho):
+            continue
+        impressoes[nome_arquivo] = impressao
+        pendentes.append((nome_arquivo, funcao, dados, caminho))
+
+    if len(tarefas) > len(pendentes):
+        print(f"{len(tarefas) - len(pendentes)} gráfico(s) já atualizados em {output_dir}")
+    processos = min(processos or os.cpu_count() or 1, len(pendentes))
+    if processos > 1:
+        with ProcessPoolExecutor(max_workers=processos) as executor:
+            gerados = list(executor.map(_renderizar, pendentes))
+    else:
+        gerados = [_renderizar(tarefa) for tarefa in pendentes] # Sem custo de subir processos
+    for nome_arquivo in gerados:
+        print(f"Gráfico '{nome_arquivo}' salvo em {output_dir}")
 
-    labels = []
+    # Só grava depois de desenhar: uma falha no meio não deixa impressões de PNGs inexistentes
+    with open(caminho_impressoes, "w") as f:
+        json.dump(impressoes, f, indent=2, sort_keys=True)
+    return gerados
+
+@lru_cache(maxsize=None)
+def _solvers():
+    """Registro de solvers (rótulos e chaves de custo), importado só quando um gráfico precisa dele."""
+    return registro_solvers.descobrir()
+
+def _rotulo(nome):
+    """Nome do algoritmo para os gráficos, vindo do registro de solvers."""
+    classe = _solvers().get(nome)
+    return classe.rotulo if classe else nome.replace("_", " ").title()
+
+def _custo(nome, valores):
+    """(chave, rótulo) do custo médio de `valores`; a chave vem do registro ou, para algoritmos fora dele, é a primeira avg_cost*."""
+    classe = _solvers().get(nome)
+    if classe and classe.chave_custo in valores:
+        return classe.chave_custo, classe.rotulo_custo
+    chave = next((chave for chave in valores if chave.startswith("avg_cost")), None)
+    return chave, "Custo"
+
+def comparison_tasks(metrics):
+    """Tarefas dos gráficos de barras de ponto único (N fixo), para cada algoritmo das métricas."""
+    tarefas = []
+    nomes, labels = [], []
     times_one_solution = []
     mems_one_solution = []
-    costs_one_solution = [] # Custo normalizado ou interpretado
+    costs_one_solution = []
     cost_labels = []
 
-    # Coletar dados para "encontrar uma solução"
-    if "backtracking" in metrics and "find_one" in metrics["backtracking"]:
-        labels.append("Backtracking")
-        times_one_solution.append(metrics["backtracking"]["find_one"]["avg_time_s"])
-        mems_one_solution.append(metrics["backtracking"]["find_one"]["avg_mem_peak_kb"])
-        costs_one_solution.append(metrics["backtracking"]["find_one"]["avg_cost_nodes"])
-        cost_labels.append("Nós Visitados (Backtracking)")
-        
-    if "hill_climbing" in metrics and "find_one" in metrics["hill_climbing"]:
-        # Apenas se successful_rate > 0
-        if metrics["hill_climbing"]["find_one"].get("success_rate", 0) > 0:
-            labels.append("Hill Climbing")
-            times_one_solution.append(metrics["hill_climbing"]["find_one"]["avg_time_s"])
-            mems_one_solution.append(metrics["hill_climbing"]["find_one"]["avg_mem_peak_kb"])
-            costs_one_solution.append(metrics["hill_climbing"]["find_one"]["avg_cost_conflict_evals"])
-            cost_labels.append("Avaliações de Conflito (Hill Climbing)")
-        else:
-            print("Hill Climbing não encontrou soluções, não será incluído nos gráficos de 'uma solução'.")
-
-    if "random_restart" in metrics and "find_one" in metrics["random_restart"]:
-        if metrics["random_restart"]["find_one"].get("success_rate", 0) > 0:
-            labels.append("Random Restart")
-            times_one_solution.append(metrics["random_restart"]["find_one"]["avg_time_s"])
-            mems_one_solution.append(metrics["random_restart"]["find_one"]["avg_mem_peak_kb"])
-            costs_one_solution.append(metrics["random_restart"]["find_one"]["avg_cost_attempts"])
-            cost_labels.append("Tentativas (Random Restart)")
-        else:
-            print("Random Restart não encontrou soluções, não será incluído nos gráficos de 'uma solução'.")
+    # Coletar dados para "encontrar uma solução" (as métricas determinísticas não têm success_rate)
+    for nome, secoes in metrics.items():
+        if nome in SECOES_IGNORADAS or not isinstance(secoes, dict) or "find_one" not in secoes:
+            continue
+        find_one = secoes["find_one"]
+        if find_one.get("success_rate", 1) <= 0:
+            print(f"{_rotulo(nome)} não encontrou soluções, não será incluído nos gráficos de 'uma solução'.")
+            continue
+        chave_custo, rotulo_custo = _custo(nome, find_one)
+        nomes.append(nome)
+        labels.append(_rotulo(nome))
+        times_one_solution.append(find_one["avg_time_s"])
+        mems_one_solution.append(find_one["avg_mem_peak_kb"])
+        costs_one_solution.append(find_one.get(chave_custo) if chave_custo else None)
+        cost_labels.append(rotulo_custo)
 
     # Gráfico 1: Tempo para encontrar UMA solução
     if times_one_solution:
-        plt.figure(figsize=(10, 6))
-        bars = plt.bar(labels, times_one_solution, color=["skyblue", "lightcoral", "lightgreen"])
-        plt.ylabel("Tempo Médio (segundos) - Escala Logarítmica")
-        plt.title("Comparativo: Tempo Médio para Encontrar UMA Solução Válida")
-        plt.yscale("log") # Usar escala logarítmica devido a grandes variações
-        for bar in bars:
-            yval = bar.get_height()
-            plt.text(bar.get_x() + bar.get_width()/2.0, yval, f"{yval:.6f}s", va="bottom", ha="center")
-        plt.savefig(f"{output_dir}comparativo_tempo_uma_solucao.png")
-        plt.close()
-        print(f"Gráfico 'comparativo_tempo_uma_solucao.png' salvo em {output_dir}")
+        tarefas.append(("comparativo_tempo_uma_solucao.png", _desenhar_barras, _barras(
+            labels, times_one_solution, "Tempo Médio (segundos) - Escala Logarítmica",
+            "Comparativo: Tempo Médio para Encontrar UMA Solução Válida", "{:.6f}s", log=True)))
 
     # Gráfico 2: Custo de Memória para UMA solução
     if mems_one_solution:
-        plt.figure(figsize=(10, 6))
-        bars = plt.bar(labels, mems_one_solution, color=["skyblue", "lightcoral", "lightgreen"])
-        plt.ylabel("Pico Médio de Memória (KB)")
-        plt.title("Comparativo: Pico Médio de Memória para Encontrar UMA Solução")
-        for bar in bars:
-            yval = bar.get_height()
-            plt.text(bar.get_x() + bar.get_width()/2.0, yval, f"{yval:.2f} KB", va="bottom", ha="center")
-        plt.savefig(f"{output_dir}comparativo_memoria_uma_solucao.png")
-        plt.close()
-        print(f"Gráfico 'comparativo_memoria_uma_solucao.png' salvo em {output_dir}")
+        tarefas.append(("comparativo_memoria_uma_solucao.png", _desenhar_barras, _barras(
+            labels, mems_one_solution, "Pico Médio de Memória (KB)",
+            "Comparativo: Pico Médio de Memória para Encontrar UMA Solução", "{:.2f} KB")))
 
     # Gráfico 3: Custo Computacional para UMA solução
-    # Como as métricas de custo são diferentes, plotaremos separadamente ou em subplots se necessário.
-    # Por simplicidade, vamos criar gráficos individuais para cada tipo de custo se as unidades forem muito diferentes.
-    # Ou um gráfico de barras agrupadas se forem comparáveis de alguma forma (aqui são diferentes)
-    # Vamos fazer um gráfico com barras para cada um, mas o eixo Y terá descrições diferentes.
-    # Para este caso, é melhor apresentar os dados em uma tabela no relatório e talvez um gráfico para cada.
-    # Vamos criar um gráfico de barras para cada um dos custos, pois são unidades diferentes.
-    
-    for i in range(len(labels)):
-        if i < len(costs_one_solution):
-            plt.figure(figsize=(6, 4))
-            plt.bar([labels[i]], [costs_one_solution[i]], color=["skyblue", "lightcoral", "lightgreen"][i])
-            plt.ylabel(cost_labels[i].split(" (")[0]) # Pega só a unidade principal
-            plt.title(f"Custo Computacional: {labels[i]}")
-            plt.text(0, costs_one_solution[i], f"{costs_one_solution[i]:.0f}", va="bottom", ha="center")
-            plt.savefig(f"{output_dir}comparativo_custo_{labels[i].lower().replace(' ', '_')}.png")
-            plt.close()
-            print(f"Gráfico 'comparativo_custo_{labels[i].lower().replace(' ', '_')}.png' salvo em {output_dir}")
-
-    # Gráfico 4: Tempo para encontrar TODAS as 92 soluções (apenas Backtracking)
-    if "backtracking" in metrics and "find_all" in metrics["backtracking"]:
-        bt_time_all = metrics["backtracking"]["find_all"]["avg_time_s"]
-        bt_mem_all = metrics["backtracking"]["find_all"]["avg_mem_peak_kb"]
-        bt_cost_all = metrics["backtracking"]["find_all"]["avg_cost_nodes"]
-        bt_solutions_count = metrics["backtracking"]["find_all"]["solutions_count"]
-
-        plt.figure(figsize=(8, 5))
-        plt.bar(["Backtracking"], [bt_time_all], color="gold")
-        plt.ylabel("Tempo Médio (segundos)")
-        plt.title(f"Backtracking: Tempo para Encontrar TODAS as {bt_solutions_count} Soluções")
-        plt.text(0, bt_time_all, f"{bt_time_all:.4f}s", va="bottom", ha="center")
-        plt.savefig(f"{output_dir}backtracking_tempo_todas_solucoes.png")
-        plt.close()
-        print(f"Gráfico 'backtracking_tempo_todas_solucoes.png' salvo em {output_dir}")
-
-        # Poderia adicionar gráficos para memória e custo de todas as soluções do BT também
-        plt.figure(figsize=(8, 5))
-        plt.bar(["Backtracking"], [bt_mem_all], color="gold")
-        plt.ylabel("Pico Médio de Memória (KB)")
-        plt.title(f"Backtracking: Memória para Encontrar TODAS as {bt_solutions_count} Soluções")
-        plt.text(0, bt_mem_all, f"{bt_mem_all:.2f} KB", va="bottom", ha="center")
-        plt.savefig(f"{output_dir}backtracking_memoria_todas_solucoes.png")
-        plt.close()
-        print(f"Gráfico 'backtracking_memoria_todas_solucoes.png' salvo em {output_dir}")
-
-        plt.figure(figsize=(8, 5))
-        plt.bar(["Backtracking"], [bt_cost_all], color="gold")
-        plt.ylabel("Nós Visitados")
-        plt.title(f"Backtracking: Custo para Encontrar TODAS as {bt_solutions_count} Soluções")
-        plt.text(0, bt_cost_all, f"{bt_cost_all:.0f}", va="bottom", ha="center")
-        plt.savefig(f"{output_dir}backtracking_custo_todas_solucoes.png")
-        plt.close()
-        print(f"Gráfico 'backtracking_custo_todas_solucoes.png' salvo em {output_dir}")
+    # As métricas de custo têm unidades diferentes (nós, avaliações, tentativas), então
+    # cada algoritmo ganha o seu gráfico em vez de barras lado a lado.
+    for i, nome in enumerate(nomes):
+        if costs_one_solution[i] is None:
+            continue
+        tarefas.append((f"comparativo_custo_{nome}.png", _desenhar_barras, _barras(
+            [labels[i]], [costs_one_solution[i]], cost_labels[i], f"Custo Computacional: {labels[i]}", "{:.0f}",
+            figsize=(6, 4), cores=[CORES[i % len(CORES)]])))
+
+    # Gráfico 4: Tempo, memória e custo para encontrar TODAS as soluções (algoritmos com enumeração)
+    for nome, secoes in metrics.items():
+        if nome in SECOES_IGNORADAS or not isinstance(secoes, dict) or "find_all" not in secoes:
+            continue
+        find_all = secoes["find_all"]
+        chave_custo, rotulo_custo = _custo(nome, find_all)
+        solutions_count = find_all["solutions_count"]
+        for chave, sufixo, ylabel, titulo, formato in (
+                ("avg_time_s", "tempo", "Tempo Médio (segundos)", "Tempo", "{:.4f}s"),
+                ("avg_mem_peak_kb", "memoria", "Pico Médio de Memória (KB)", "Memória", "{:.2f} KB"),
+                (chave_custo, "custo", rotulo_custo, "Custo", "{:.0f}")):
+            if chave is None:
+                continue
+            tarefas.append((f"{nome}_{sufixo}_todas_solucoes.png", _desenhar_barras, _barras(
+                [_rotulo(nome)], [find_all[chave]], ylabel,
+                f"{_rotulo(nome)}: {titulo} para Encontrar TODAS as {solutions_count} Soluções", formato,
+                figsize=(8, 5), cores=["gold"])))
+    return tarefas
+
+def scaling_tasks(metrics):
+    """Tarefas das curvas de escala (tempo, memória e custo em função de N) da varredura."""
+    tarefas = []
+    series = [
+        ("avg_time_s", "Tempo Médio (segundos)", "tempo"),
+        ("mem_peak_kb", "Pico de Memória (KB)", "memoria"),
+        ("avg_cost", "Custo (nós / avaliações / tentativas)", "custo"),
+    ]
+    titulos = {"find_one": "Encontrar UMA Solução", "find_all": "Encontrar TODAS as Soluções"}
+
+    for tipo, algoritmos in metrics["sweep"].items():
+        if tipo not in titulos:
+            continue
+        for chave, ylabel, sufixo in series:
+            curvas = []
+            for nome, pontos in algoritmos.items():
+                validos = [p for p in pontos if p.get(chave)]
+                if validos:
+                    curvas.append((_rotulo(nome), [p["n"] for p in validos],
+                                   [p[chave] for p in validos]))
+            tarefas.append((f"escala_{sufixo}_{tipo}.png", _desenhar_curvas, {
+                "series": curvas, "ylabel": ylabel,
+                "title": f"Escala com N: {ylabel.split(' (')[0]} para {titulos[tipo]}"}))
+    return tarefas
+
+def distribution_tasks(execucoes):
+    """
+    Tarefas dos gráficos de distribuição a partir das execuções individuais
+    ({algoritmo: {coluna: array}}, ver historico_benchmarks.carregar_execucoes).
+    Só entram as execuções bem-sucedidas: o tempo das falhas é o de desistir.
+    """
+    tarefas = []
+    medidas = (("time_s", "Tempo até a solução (s)", "tempo"), ("cost", "Custo até a solução", "custo"))
+    cdfs = {sufixo: [] for _, _, sufixo in medidas}
+    for nome, colunas in execucoes.items():
+        sucesso = colunas["found"]
+        if not sucesso.any():
+            print(f"{nome} não encontrou soluções, sem gráfico de distribuição.")
+            continue
+        titulo = _rotulo(nome)
+        linhas = []
+        for coluna, label, sufixo in medidas:
+            valores = colunas[coluna][sucesso]
+            percentis = {p: float(v) for p, v in zip(PERCENTIS, np.percentile(valores, PERCENTIS))}
+            linhas.append({"label": label, "values": valores.tolist(), "percentiles": percentis})
+            if valores.min() > 0:
+                cdfs[sufixo].append((titulo, valores.tolist(), percentis))
+        tarefas.append((f"distribuicao_{nome}.png", _desenhar_distribuicao, {
+            "rows": linhas,
+            "title": f"{titulo}: distribuição em {sucesso.size} execuções (sucesso {sucesso.mean():.0%})"}))
+    for _, label, sufixo in medidas:
+        if cdfs[sufixo]:
+            tarefas.append((f"distribuicao_cdf_{sufixo}.png", _desenhar_cdfs, {
+                "series": cdfs[sufixo], "xlabel": label,
+                "title": f"CDF empírica: {label.split(' (')[0]} (marcadores em p50 ●, p95 ■, p99 ▲)"}))
+    return tarefas
 
+def plot_distribution_charts(execucoes, output_dir=DIRETORIO_RESULTADOS + os.sep, forcar=False, processos=None):
+    """Gera histogramas e CDFs empíricas com percentis a partir das execuções individuais."""
+    if not execucoes:
+        print("Nenhuma execução individual para plotar (rode run_benchmarks.py com --seed ou --workers).")
+        return
+    gerar_graficos(distribution_tasks(execucoes), output_dir, forcar, processos)
+
+def plot_comparison_charts(metrics, output_dir=DIRETORIO_RESULTADOS + os.sep, forcar=False, processos=None):
+    """Gera e salva os gráficos comparativos."""
+    if not metrics:
+        print("Nenhuma métrica para plotar.")
+        return
+    gerar_graficos(comparison_tasks(metrics), output_dir, forcar, processos)
     print("Geração de gráficos concluída.")
 
+def plot_scaling_charts(metrics, output_dir=DIRETORIO_RESULTADOS + os.sep, forcar=False, processos=None):
+    """Gera curvas de escala (tempo, memória e custo em função de N, eixo Y log) da varredura."""
+    if not metrics or not metrics.get("sweep"):
+        print("Nenhuma varredura em N para plotar.")
+        return
+    gerar_graficos(scaling_tasks(metrics), output_dir, forcar, processos)
+
 if __name__ == "__main__":
-    metrics_data = load_metrics()
-    if metrics_data:
-        plot_comparison_charts(metrics_data)
+    parser = argparse.ArgumentParser(description="Gera os gráficos a partir das métricas dos benchmarks")
+    parser.add_argument("--metricas", default=ARQUIVO_METRICAS, help="Arquivo JSON de métricas")
+    parser.add_argument("--execucoes", default=ARQUIVO_EXECUCOES, help="Arquivo .npz das execuções individuais")
+    parser.add_argument("--saida", default=DIRETORIO_RESULTADOS + os.sep, help="Diretório dos gráficos")
+    parser.add_argument("--forcar", action="store_true", help="Redesenha mesmo os gráficos atualizados")
+    parser.add_argument("--processos", type=int, default=None, help="Processos de desenho (padrão: um por CPU)")
+    args = parser.parse_args()
 
+    metrics_data = load_metrics(args.metricas)
+    if metrics_data:
+        # Com varredura em N, as curvas de escala substituem as barras de ponto único
+        if "sweep" in metrics_data:
+            plot_scaling_charts(metrics_data, args.saida, args.forcar, args.processos)
+        else:
+            plot_comparison_charts(metrics_data, args.saida, args.forcar, args.processos)
+    execucoes = carregar_execucoes(args.execucoes)
+    if execucoes:
+        plot_distribution_charts(execucoes, args.saida, args.forcar, args.processos)
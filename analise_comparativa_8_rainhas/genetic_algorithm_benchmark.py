@@ -0,0 +1,213 @@
+"""
+Algoritmo Genético para o problema das N Rainhas (versão para benchmark).
+
+A população inteira é uma matriz NumPy (indivíduos x N) de permutações, então só há
+conflitos diagonais. A aptidão de todos os indivíduos é calculada de uma vez por
+avaliador_conflitos.conflitos_em_lote (um único np.bincount para a população inteira).
+Seleção por torneio, cruzamento de ordem (OX1) e mutação por troca também são
+vetorizados sobre a população, o que torna viáveis populações de milhares de indivíduos.
+
+O GA serve para N pequeno (até ~12): com os parâmetros padrão resolve todas as execuções
+em N=8 e N=12, cerca de 90% em N=16 e 60% a 65% em N=20 e N=25, e quase nunca em N=50. Mais
+indivíduos ou gerações não resolvem isso: a população converge para ótimos locais com
+poucos conflitos que OX1 e a troca não desfazem (N=50: 0/5 com população 1024, 2/5 com 5000
+gerações). Para N grande, use Min-Conflicts ou Simulated Annealing.
+"""
+import random
+import time
+import tracemalloc
+
+import numpy as np
+
+from avaliador_conflitos import conflitos_em_lote
+from instrumentacao import medir_fase
+from registro_solvers import Solver, registrar
+
+NUM_RAINHAS = 8
+TAMANHO_POPULACAO = 256
+MAX_GERACOES = 1000
+TAXA_MUTACAO = 0.2 # Probabilidade de cada filho sofrer uma troca
+TAMANHO_TORNEIO = 3
+NUM_ELITE = 2 # Melhores indivíduos copiados sem alteração para a próxima geração
+
+def selecao_torneio(aptidoes, quantidade, rng):
+    """Índices dos vencedores de `quantidade` torneios (menos conflitos vence)."""
+    competidores = rng.integers(0, aptidoes.size, size=(quantidade, TAMANHO_TORNEIO))
+    vencedores = np.argmin(aptidoes[competidores], axis=1)
+    return competidores[np.arange(quantidade), vencedores]
+
+def cruzamento_ordem(pais1, pais2, rng):
+    """
+    OX1 vetorizado: o filho herda pais1[a:b] na mesma posição e recebe os genes
+    restantes na ordem em que aparecem em pais2, a partir da posição b (circular).
+    """
+    quantidade, n = pais1.shape
+    linhas = np.arange(quantidade)[:, None]
+    cortes = np.sort(rng.integers(0, n + 1, size=(quantidade, 2)), axis=1)
+    a, b = cortes[:, :1], cortes[:, 1:]
+    posicoes = np.arange(n)
+    no_segmento = (posicoes >= a) & (posicoes < b)
+
+    herdado = np.zeros((quantidade, n), dtype=bool) # herdado[i, gene]: gene já veio de pais1
+    herdado[linhas, pais1] = no_segmento
+
+    rotacao = (b + posicoes) % n # Posições a partir de b, circularmente
+    genes_pais2 = np.take_along_axis(pais2, rotacao, axis=1)
+    # Sort estável leva os genes ainda livres (na ordem de pais2) e as posições livres
+    # (na ordem a partir de b) para o início; os dois grupos têm o mesmo tamanho.
+    genes_livres = np.take_along_axis(genes_pais2, np.argsort(herdado[linhas, genes_pais2], axis=1, kind="stable"), axis=1)
+    posicoes_livres = np.take_along_axis(rotacao, np.argsort(np.take_along_axis(no_segmento, rotacao, axis=1),
+                                                             axis=1, kind="stable"), axis=1)
+
+    filhos = np.empty_like(pais1)
+    filhos[linhas, posicoes_livres] = genes_livres
+    filhos[no_segmento] = pais1[no_segmento] # Sobrescreve o excesso escrito no segmento
+    return filhos
+
+def mutacao_troca(populacao, rng, taxa=TAXA_MUTACAO):
+    """Troca duas posições aleatórias dos indivíduos sorteados com probabilidade `taxa`."""
+    quantidade, n = populacao.shape
+    mutantes = np.flatnonzero(rng.random(quantidade) < taxa)
+    i = rng.integers(0, n, size=mutantes.size)
+    j = rng.integers(0, n, size=mutantes.size)
+    populacao[mutantes, i], populacao[mutantes, j] = populacao[mutantes, j], populacao[mutantes, i]
+    return populacao
+
+def algoritmo_genetico(n=NUM_RAINHAS, tamanho_populacao=TAMANHO_POPULACAO, max_geracoes=MAX_GERACOES, rng=None,
+                       instrumentacao=None, cancelado=None):
+    """
+    Evolui a população até surgir um indivíduo sem conflitos, esgotar as gerações ou
+    `cancelado.is_set()` (consultado a cada geração).
+    Retorna (melhor indivíduo visto, seus conflitos, gerações, avaliações de aptidão).
+    """
+    # Sem rng explícito, a semente vem do módulo random: random.seed(s) reproduz a execução
+    rng = rng if rng is not None else np.random.default_rng(random.getrandbits(64))
+    populacao = rng.permuted(np.broadcast_to(np.arange(n), (tamanho_populacao, n)), axis=1)
+    num_elite = min(NUM_ELITE, tamanho_populacao)
+    num_filhos = tamanho_populacao - num_elite
+    avaliacoes = 0
+    melhor_individuo, melhores_conflitos = None, None
+
+    for geracao in range(max_geracoes + 1):
+        with medir_fase(instrumentacao, "aptidao"):
+            aptidoes = conflitos_em_lote(populacao)
+        avaliacoes += tamanho_populacao
+        if instrumentacao is not None:
+            instrumentacao.contar("avaliacoes", tamanho_populacao)
+            instrumentacao.contar("geracoes")
+        melhor = int(np.argmin(aptidoes))
+        if melhores_conflitos is None or aptidoes[melhor] < melhores_conflitos:
+            melhor_individuo, melhores_conflitos = populacao[melhor].tolist(), int(aptidoes[melhor])
+        if melhores_conflitos == 0:
+            return melhor_individuo, 0, geracao, avaliacoes
+        if geracao == max_geracoes or (cancelado is not None and cancelado.is_set()):
+            return melhor_individuo, melhores_conflitos, geracao, avaliacoes
+
+        elite = populacao[np.argpartition(aptidoes, num_elite - 1)[:num_elite]] if num_elite else populacao[:0]
+        with medir_fase(instrumentacao, "reproducao"):
+            pais1 = populacao[selecao_torneio(aptidoes, num_filhos, rng)]
+            pais2 = populacao[selecao_torneio(aptidoes, num_filhos, rng)]
+            filhos = mutacao_troca(cruzamento_ordem(pais1, pais2, rng), rng)
+        populacao = np.concatenate((elite, filhos))
+
+def _executar_medido(n, medir_memoria, tamanho_populacao, instrumentacao=None):
+    if medir_memoria: tracemalloc.start()
+    start_time = time.perf_counter()
+
+    melhor, conflitos, geracoes, avaliacoes = algoritmo_genetico(n, tamanho_populacao, instrumentacao=instrumentacao)
+    solucao = melhor if conflitos == 0 else None
+
+    end_time = time.perf_counter()
+    peak_mem = 0
+    if medir_memoria:
+        current_mem, peak_mem = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    return solucao, geracoes, avaliacoes, end_time - start_time, peak_mem / 1024  # KB
+
+def genetic_algorithm_single_run(n=NUM_RAINHAS, medir_memoria=True, tamanho_populacao=TAMANHO_POPULACAO,
+                                 instrumentacao=None):
+    """Executa uma única tentativa do Algoritmo Genético. O custo são as avaliações de aptidão."""
+    solucao, _, avaliacoes, tempo, memoria = _executar_medido(n, medir_memoria, tamanho_populacao, instrumentacao)
+    return solucao, tempo, memoria, avaliacoes, solucao is not None
+
+def get_genetic_algorithm_metrics(num_runs=100, n=NUM_RAINHAS, tamanho_populacao=TAMANHO_POPULACAO):
+    times, mems, costs, generations = [], [], [], []
+    solutions_found = 0
+    solution_example = None
+
+    for _ in range(num_runs):
+        solution, gens, cost_val, time_val, mem_val = _executar_medido(n, True, tamanho_populacao)
+        if solution is not None:
+            if solution_example is None: solution_example = solution
+            times.append(time_val)
+            mems.append(mem_val)
+            costs.append(cost_val)
+            generations.append(gens)
+            solutions_found += 1
+
+    avg_time = sum(times) / len(times) if times else 0
+    avg_mem = sum(mems) / len(mems) if mems else 0
+    avg_cost = sum(costs) / len(costs) if costs else 0
+    avg_generations = sum(generations) / len(generations) if generations else 0
+    success_rate = solutions_found / num_runs if num_runs > 0 else 0
+
+    return {
+        "find_one": {
+            "avg_time_s": avg_time,
+            "avg_mem_peak_kb": avg_mem,
+            "avg_cost_conflict_evals": avg_cost,
+            "avg_generations": avg_generations,
+            "success_rate": success_rate,
+            "solutions_found_count": solutions_found,
+            "solution_example": solution_example,
+            "population_size": tamanho_populacao
+        }
+    }
+
+@registrar("genetic_algorithm")
+class GeneticAlgorithmSolver(Solver):
+    """
+    solve_many reaproveita um único gerador NumPy em vez de criar um por execução.
+    Só para N pequeno (ver a docstring do módulo).
+    """
+    rotulo = "Algoritmo Genético"
+    rotulo_custo = "Avaliações de Aptidão"
+
+    def __init__(self, n=NUM_RAINHAS):
+        super().__init__(n)
+        self.rng = None
+
+    def warm_up(self):
+        self.rng = np.random.default_rng(random.getrandbits(64))
+
+    def single_run(self, medir_memoria=True, instrumentacao=None):
+        return genetic_algorithm_single_run(self.n, medir_memoria, instrumentacao=instrumentacao)
+
+    def find_one(self, instrumentacao=None):
+        if self.rng is None:
+            return super().find_one(instrumentacao)
+        melhor, conflitos, _, avaliacoes = algoritmo_genetico(self.n, rng=self.rng, instrumentacao=instrumentacao)
+        return (melhor if conflitos == 0 else None), avaliacoes
+
+    def _find_best(self, cancelado, instrumentacao=None):
+        melhor, conflitos, _, avaliacoes = algoritmo_genetico(self.n, rng=self.rng, instrumentacao=instrumentacao,
+                                                              cancelado=cancelado)
+        return melhor, conflitos, avaliacoes
+
+    def metrics(self, num_runs=None):
+        return get_genetic_algorithm_metrics(self._num_runs(num_runs), self.n)
+
+if __name__ == '__main__':
+    import sys
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else NUM_RAINHAS
+    tamanho_populacao = int(sys.argv[2]) if len(sys.argv) > 2 else TAMANHO_POPULACAO
+    metrics_ga = get_genetic_algorithm_metrics(num_runs=20, n=n, tamanho_populacao=tamanho_populacao)
+    print(f"Genetic Algorithm Metrics (Find One, N={n}, população {tamanho_populacao}):")
+    print(f"  Avg Time (successful runs): {metrics_ga['find_one']['avg_time_s']:.6f} s")
+    print(f"  Avg Peak Memory (successful runs): {metrics_ga['find_one']['avg_mem_peak_kb']:.2f} KB")
+    print(f"  Avg Cost (Fitness Evaluations for successful runs): {metrics_ga['find_one']['avg_cost_conflict_evals']:.2f}")
+    print(f"  Avg Generations: {metrics_ga['find_one']['avg_generations']:.2f}")
+    print(f"  Success Rate: {metrics_ga['find_one']['success_rate']:.2%}")
+    if metrics_ga['find_one']['solution_example'] and n <= 64:
+        print(f"  Solution Example: {metrics_ga['find_one']['solution_example']}")
@@ -0,0 +1,112 @@
+"""
+Harness de execuções múltiplas para os algoritmos das 8 Rainhas.
+
+Cada execução recebe uma semente própria derivada de uma semente mestre, de modo que
+qualquer execução lenta ou que falhou pode ser repetida exatamente com reproduzir().
+As execuções podem ser distribuídas num pool de processos; como cada uma depende
+apenas da sua semente, o resultado (soluções, custos, sucessos) é o mesmo em série
+ou em paralelo, e só o tempo de parede muda.
+"""
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+import registro_solvers
+
+NUM_RAINHAS = 8
+
+# nome -> classe do solver registrado (os determinísticos ignoram a semente). O solver é
+# instanciado dentro de cada execução, para o N da tarefa.
+ALGORITMOS = registro_solvers.descobrir()
+
+def derivar_sementes(semente_mestre, num_runs):
+    """Sementes independentes e determinísticas (SeedSequence.spawn) para cada execução."""
+    filhas = np.random.SeedSequence(semente_mestre).spawn(num_runs)
+    return [int(filha.generate_state(1)[0]) for filha in filhas]
+
+def executar_run(tarefa):
+    """Executa uma única run de `algoritmo` com `semente` em N = `n`. Precisa ser global para o pool."""
+    algoritmo, semente, n = tarefa
+    random.seed(semente)
+    solucao, tempo, memoria, custo, found = ALGORITMOS[algoritmo](n).single_run()
+    # Min-Conflicts devolve array('i'); lista para o resultado ir para o JSON de métricas
+    return {"seed": semente, "solution": list(solucao) if solucao is not None else None, "time_s": tempo,
+            "mem_peak_kb": memoria, "cost": custo, "found": found}
+
+def reproduzir(algoritmo, semente, n=NUM_RAINHAS):
+    """Repete exatamente a execução de `algoritmo` identificada por `semente`."""
+    return executar_run((algoritmo, semente, n))
+
+def executar_runs(algoritmo, num_runs, semente_mestre=0, workers=1, n=NUM_RAINHAS):
+    """
+    Executa `num_runs` runs independentes. workers=1 roda em série no processo atual;
+    qualquer outro valor (None = todos os núcleos) usa um ProcessPoolExecutor.
+    Os resultados vêm na ordem das sementes nos dois casos.
+    """
+    tarefas = [(algoritmo, semente, n) for semente in derivar_sementes(semente_mestre, num_runs)]
+    if workers == 1:
+        return [executar_run(tarefa) for tarefa in tarefas]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(executar_run, tarefas, chunksize=max(1, num_runs // 64)))
+
+def agregar(algoritmo, resultados, semente_mestre):
+    """Consolida as runs no mesmo formato de get_*_metrics, mais as sementes para replay."""
+    chave_custo = ALGORITMOS[algoritmo].chave_custo
+    sucessos = [r for r in resultados if r["found"]]
+    num_runs = len(resultados)
+    mais_lenta = max(resultados, key=lambda r: r["time_s"]) if resultados else None
+    return {
+        "find_one": {
+            "avg_time_s": sum(r["time_s"] for r in sucessos) / len(sucessos) if sucessos else 0,
+            "avg_mem_peak_kb": sum(r["mem_peak_kb"] for r in sucessos) / len(sucessos) if sucessos else 0,
+            chave_custo: sum(r["cost"] for r in sucessos) / len(sucessos) if sucessos else 0,
+            "success_rate": len(sucessos) / num_runs if num_runs > 0 else 0,
+            "solutions_found_count": len(sucessos),
+            "solution_example": sucessos[0]["solution"] if sucessos else None,
+            "master_seed": semente_mestre,
+            "failed_seeds": [r["seed"] for r in resultados if not r["found"]],
+            "slowest_seed": mais_lenta["seed"] if mais_lenta else None
+        }
+    }
+
+def get_parallel_metrics(algoritmo, num_runs=100, semente_mestre=0, workers=None, n=NUM_RAINHAS):
+    """Métricas de `algoritmo` calculadas com o harness (paralelo por padrão)."""
+    resultados = executar_runs(algoritmo, num_runs, semente_mestre, workers, n)
+    return agregar(algoritmo, resultados, semente_mestre)
+
+def medir_speedup(algoritmo, num_runs=100, semente_mestre=0, workers=None, n=NUM_RAINHAS):
+    """Compara o tempo de parede das mesmas runs em série e no pool."""
+    inicio = time.perf_counter()
+    serial = executar_runs(algoritmo, num_runs, semente_mestre, 1, n)
+    tempo_serial = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    paralelo = executar_runs(algoritmo, num_runs, semente_mestre, workers, n)
+    tempo_paralelo = time.perf_counter() - inicio
+
+    return {
+        "algorithm": algoritmo,
+        "n": n,
+        "num_runs": num_runs,
+        "workers": workers,
+        "serial_wall_s": tempo_serial,
+        "parallel_wall_s": tempo_paralelo,
+        "speedup": tempo_serial / tempo_paralelo if tempo_paralelo > 0 else 0,
+        # Mesmas sementes => mesmas soluções e custos, independentemente do pool
+        "reproducible": [(r["solution"], r["cost"]) for r in serial] ==
+                        [(r["solution"], r["cost"]) for r in paralelo]
+    }
+
+if __name__ == '__main__':
+    import sys
+    algoritmo = sys.argv[1] if len(sys.argv) > 1 else "random_restart"
+    num_runs = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    semente_mestre = int(sys.argv[3]) if len(sys.argv) > 3 else 0
+    speedup = medir_speedup(algoritmo, num_runs, semente_mestre)
+    print(f"Harness paralelo: {algoritmo} ({num_runs} execuções, semente mestre {semente_mestre})")
+    print(f"  Serial: {speedup['serial_wall_s']:.4f} s")
+    print(f"  Paralelo: {speedup['parallel_wall_s']:.4f} s")
+    print(f"  Speedup: {speedup['speedup']:.2f}x")
+    print(f"  Reprodutível: {speedup['reproducible']}")
@@ -5,95 +5,196 @@ import random
 import time
 import tracemalloc
 
+import numpy as np
+
+from avaliador_conflitos import AvaliadorConflitos
+from registro_solvers import Solver, registrar
+
 NUM_RAINHAS = 8
+# Perturbar e melhorar de volta zera o contador sem melhora, então o laço pode ciclar
+# para sempre (acontece a partir de N=9); este teto total de passos garante o término.
+MAX_PASSOS_POR_RAINHA = 1000
 
-def contar_conflitos(solucao):
+def contar_conflitos(solucao, n=NUM_RAINHAS):
     """Calcula o número de conflitos entre rainhas."""
-    if not solucao or len(solucao) != NUM_RAINHAS: # Adiciona verificação para evitar erros com soluções incompletas
+    if not solucao or len(solucao) != n: # Adiciona verificação para evitar erros com soluções incompletas
         return float('inf') # Retorna infinito se a solução for inválida/incompleta
     conflitos = 0
-    for i in range(NUM_RAINHAS):
-        for j in range(i + 1, NUM_RAINHAS):
+    for i in range(n):
+        for j in range(i + 1, n):
             if solucao[i] == solucao[j] or abs(solucao[i] - solucao[j]) == abs(i - j):
                 conflitos += 1
     return conflitos
 
-def hill_climbing_single_run():
-    """Executa uma única tentativa de Hill Climbing para encontrar uma solução."""
-    tracemalloc.start()
-    start_time = time.perf_counter()
-    
-    estado_atual = [random.randint(0, NUM_RAINHAS - 1) for _ in range(NUM_RAINHAS)]
+def subida(n, estado, conflitos_atuais, melhor_vizinho, mover, instrumentacao=None, cancelado=None):
+    """
+    Laço de controle comum de hill_climbing e hill_climbing_vetorizado. A cada passo,
+    `melhor_vizinho()` avalia os N·(N−1) vizinhos de `estado` e devolve (menor delta,
+    coluna, nova linha, delta), onde delta(coluna, linha) é a variação de conflitos de
+    qualquer movimento do estado avaliado; `mover(coluna, linha)` aplica um movimento.
+    Para ao resolver, ao esgotar os passos ou quando `cancelado.is_set()`.
+    Retorna (melhor estado visto, seus conflitos, conflitos avaliados).
+    """
+    melhor_estado, melhores_conflitos = [int(linha) for linha in estado], conflitos_atuais
     conflitos_avaliados = 0
 
     max_iter_sem_melhora = 50 # Para evitar ficar preso em platôs muito longos
     iter_sem_melhora_count = 0
+    passos_restantes = MAX_PASSOS_POR_RAINHA * n
 
-    while True:
-        conflitos_atuais = contar_conflitos(estado_atual)
+    while passos_restantes > 0:
+        if cancelado is not None and cancelado.is_set():
+            break
+        passos_restantes -= 1
         conflitos_avaliados +=1
-        
+        if instrumentacao is not None:
+            instrumentacao.contar("avaliacoes")
         if conflitos_atuais == 0:
-            break 
+            break
 
-        melhor_vizinho = list(estado_atual)
-        melhores_conflitos_vizinho = conflitos_atuais
+        melhor_delta, coluna, nova_linha, delta = melhor_vizinho()
+        conflitos_avaliados += n * (n - 1)
+        if instrumentacao is not None:
+            instrumentacao.contar("avaliacoes", n * (n - 1))
 
-        # Explora vizinhos
-        for coluna_idx in range(NUM_RAINHAS):
-            posicao_original_na_coluna = estado_atual[coluna_idx]
-            for nova_linha in range(NUM_RAINHAS):
-                if nova_linha == posicao_original_na_coluna:
-                    continue
-                
-                estado_atual[coluna_idx] = nova_linha
-                novos_conflitos = contar_conflitos(estado_atual)
-                conflitos_avaliados +=1
-                
-                if novos_conflitos < melhores_conflitos_vizinho:
-                    melhores_conflitos_vizinho = novos_conflitos
-                    melhor_vizinho = list(estado_atual)
-            
-            estado_atual[coluna_idx] = posicao_original_na_coluna # Restaura
-
-        if melhores_conflitos_vizinho >= conflitos_atuais:
+        if melhor_delta >= 0:
             iter_sem_melhora_count += 1
             if iter_sem_melhora_count > max_iter_sem_melhora:
                  # Preso em ótimo local ou platô por muitas iterações
                 break
-            # Se não houve melhora, mas ainda não atingiu o limite, pode tentar perturbar ou reiniciar
-            # Para este benchmark, vamos apenas continuar e ver se sai do platô ou atinge o limite
-            # Se for um platô e houver movimentos laterais que não pioram, ele pode continuar explorando.
-            # Se for um ótimo local, ele vai parar aqui na próxima checagem de `melhores_conflitos_vizinho >= conflitos_atuais`
-            # Para simplificar, se não melhora, consideramos que pode ficar preso.
-            if melhores_conflitos_vizinho == conflitos_atuais: # Movimento lateral ou platô
-                 # Tenta um movimento aleatório para escapar de platôs simples
-                 col_perturbar = random.randint(0, NUM_RAINHAS -1)
-                 nova_pos_perturbar = random.randint(0, NUM_RAINHAS -1)
-                 estado_atual[col_perturbar] = nova_pos_perturbar
-            else: # Ótimo local
-                break
+            # Sem vizinho melhor: tenta um movimento aleatório para escapar de platôs simples
+            col_perturbar = random.randint(0, n - 1)
+            nova_pos_perturbar = random.randint(0, n - 1)
+            if nova_pos_perturbar != estado[col_perturbar]:
+                conflitos_atuais += delta(col_perturbar, nova_pos_perturbar)
+                mover(col_perturbar, nova_pos_perturbar)
         else:
-            estado_atual = melhor_vizinho
+            mover(coluna, nova_linha)
+            conflitos_atuais += melhor_delta
             iter_sem_melhora_count = 0 # Reset contador se houve melhora
-            
+        if conflitos_atuais < melhores_conflitos: # A perturbação também pode melhorar
+            melhor_estado, melhores_conflitos = [int(linha) for linha in estado], conflitos_atuais
+        if instrumentacao is not None:
+            instrumentacao.contar("movimentos")
+
+    return melhor_estado, melhores_conflitos, conflitos_avaliados
+
+def hill_climbing(n=NUM_RAINHAS, instrumentacao=None, cancelado=None):
+    """
+    Uma subida de Hill Climbing a partir de um estado aleatório. Para ao resolver, ao
+    esgotar os passos ou quando `cancelado.is_set()` (ex.: um prazo.Prazo vencido).
+    Retorna (melhor estado visto, seus conflitos, conflitos avaliados).
+    """
+    avaliador = AvaliadorConflitos([random.randint(0, n - 1) for _ in range(n)])
+
+    def melhor_vizinho():
+        melhor_movimento = (None, None)
+        melhor_delta = 0
+        # Explora vizinhos: cada um é avaliado em O(1) pelo delta incremental
+        for coluna_idx in range(n):
+            posicao_original_na_coluna = avaliador.estado[coluna_idx]
+            for nova_linha in range(n):
+                if nova_linha == posicao_original_na_coluna:
+                    continue
+                delta = avaliador.delta(coluna_idx, nova_linha)
+                if delta < melhor_delta:
+                    melhor_delta = delta
+                    melhor_movimento = (coluna_idx, nova_linha)
+        return (melhor_delta, *melhor_movimento, avaliador.delta)
+
+    return subida(n, avaliador.estado, avaliador.conflitos, melhor_vizinho, avaliador.mover, instrumentacao,
+                  cancelado)
+
+def hill_climbing_single_run(n=NUM_RAINHAS, medir_memoria=True, instrumentacao=None, cancelado=None):
+    """Executa uma única tentativa de Hill Climbing para encontrar uma solução."""
+    if medir_memoria: tracemalloc.start()
+    start_time = time.perf_counter()
+
+    estado_atual, _, conflitos_avaliados = hill_climbing(n, instrumentacao, cancelado)
+
     end_time = time.perf_counter()
-    current_mem, peak_mem = tracemalloc.get_traced_memory()
-    tracemalloc.stop()
+    peak_mem = 0
+    if medir_memoria:
+        current_mem, peak_mem = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
 
     execution_time = end_time - start_time
     memory_used_peak = peak_mem / 1024  # KB
     
-    is_solution = (contar_conflitos(estado_atual) == 0)
+    is_solution = (contar_conflitos(estado_atual, n) == 0)
     return estado_atual if is_solution else None, execution_time, memory_used_peak, conflitos_avaliados, is_solution
 
-def get_hill_climbing_metrics(num_runs=100): # Hill climbing pode falhar, então mais runs
+def deltas_vizinhanca(estado, linhas, diag_principal, diag_secundaria):
+    """
+    Matriz N x N com a variação de conflitos de cada movimento (coluna, nova linha),
+    calculada de uma vez a partir dos vetores de ocupação. Os movimentos nulos
+    (rainha fica onde está) recebem um valor grande para nunca serem escolhidos.
+    """
+    n = estado.shape[0]
+    colunas = np.arange(n)
+    col = colunas[:, None]
+    lin = colunas[None, :]
+    ganho = linhas[lin] + diag_principal[col + lin] + diag_secundaria[col - lin + n - 1]
+    perda = linhas[estado] + diag_principal[colunas + estado] + diag_secundaria[colunas - estado + n - 1] - 3
+    deltas = ganho - perda[:, None]
+    deltas[colunas, estado] = 3 * n # Maior que qualquer delta possível
+    return deltas
+
+def hill_climbing_vetorizado(n=NUM_RAINHAS, instrumentacao=None, cancelado=None):
+    """
+    Mesma busca de hill_climbing, mas cada passo avalia os N·(N−1) vizinhos numa única
+    operação NumPy e escolhe o melhor com argmin (empates: primeira coluna, depois menor
+    linha, como no laço em Python). Mesmo retorno de hill_climbing.
+    """
+    estado = np.array([random.randint(0, n - 1) for _ in range(n)])
+    linhas = np.bincount(estado, minlength=n)
+    diag_principal = np.bincount(estado + np.arange(n), minlength=2 * n - 1)
+    diag_secundaria = np.bincount(np.arange(n) - estado + n - 1, minlength=2 * n - 1)
+    conflitos_atuais = int(sum(k * (k - 1) // 2 for contadores in (linhas, diag_principal, diag_secundaria)
+                               for k in contadores.tolist()))
+
+    def mover(coluna, nova_linha):
+        linha = estado[coluna]
+        linhas[linha] -= 1; diag_principal[coluna + linha] -= 1; diag_secundaria[coluna - linha + n - 1] -= 1
+        linhas[nova_linha] += 1; diag_principal[coluna + nova_linha] += 1; diag_secundaria[coluna - nova_linha + n - 1] += 1
+        estado[coluna] = nova_linha
+
+    def melhor_vizinho():
+        deltas = deltas_vizinhanca(estado, linhas, diag_principal, diag_secundaria)
+        melhor = int(deltas.argmin())
+        return (int(deltas.flat[melhor]), *divmod(melhor, n), lambda coluna, linha: int(deltas[coluna, linha]))
+
+    return subida(n, estado, conflitos_atuais, melhor_vizinho, mover, instrumentacao, cancelado)
+
+def hill_climbing_vetorizado_single_run(n=NUM_RAINHAS, medir_memoria=True, instrumentacao=None, cancelado=None):
+    """hill_climbing_single_run com a vizinhança avaliada por hill_climbing_vetorizado."""
+    if medir_memoria: tracemalloc.start()
+    start_time = time.perf_counter()
+
+    estado, conflitos, conflitos_avaliados = hill_climbing_vetorizado(n, instrumentacao, cancelado)
+
+    end_time = time.perf_counter()
+    peak_mem = 0
+    if medir_memoria:
+        current_mem, peak_mem = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    execution_time = end_time - start_time
+    memory_used_peak = peak_mem / 1024  # KB
+
+    is_solution = conflitos == 0
+    return estado if is_solution else None, execution_time, memory_used_peak, conflitos_avaliados, is_solution
+
+def get_hill_climbing_metrics(num_runs=100, vetorizado=False, n=NUM_RAINHAS): # Hill climbing pode falhar, então mais runs
     times, mems, costs = [], [], []
     solutions_found = 0
     solution_example = None
 
     for _ in range(num_runs):
-        solution, time_val, mem_val, cost_val, found = hill_climbing_single_run()
+        if vetorizado:
+            solution, time_val, mem_val, cost_val, found = hill_climbing_vetorizado_single_run(n)
+        else:
+            solution, time_val, mem_val, cost_val, found = hill_climbing_single_run(n)
         if found:
             if solution_example is None: solution_example = solution
             times.append(time_val)
@@ -117,9 +218,32 @@ def get_hill_climbing_metrics(num_runs=100): # Hill climbing pode falhar, então
         }
     }
 
+@registrar("hill_climbing")
+class HillClimbingSolver(Solver):
+    rotulo = "Hill Climbing"
+    vetorizado = False
+
+    def single_run(self, medir_memoria=True, instrumentacao=None):
+        executar = hill_climbing_vetorizado_single_run if self.vetorizado else hill_climbing_single_run
+        return executar(self.n, medir_memoria, instrumentacao)
+
+    def _find_best(self, cancelado, instrumentacao=None):
+        executar = hill_climbing_vetorizado if self.vetorizado else hill_climbing
+        return executar(self.n, instrumentacao, cancelado)
+
+    def metrics(self, num_runs=None):
+        return get_hill_climbing_metrics(self._num_runs(num_runs), self.vetorizado, self.n)
+
+@registrar("hill_climbing_vectorized")
+class HillClimbingVetorizadoSolver(HillClimbingSolver):
+    rotulo = "Hill Climbing (vetorizado)"
+    vetorizado = True
+
 if __name__ == '__main__':
-    metrics_hc = get_hill_climbing_metrics(num_runs=20)
-    print("Hill Climbing Metrics (Find One):")
+    import sys
+    vetorizado = "--vetorizado" in sys.argv
+    metrics_hc = get_hill_climbing_metrics(num_runs=20, vetorizado=vetorizado)
+    print(f"Hill Climbing Metrics (Find One{', vetorizado' if vetorizado else ''}):")
     print(f"  Avg Time (successful runs): {metrics_hc['find_one']['avg_time_s']:.6f} s")
     print(f"  Avg Peak Memory (successful runs): {metrics_hc['find_one']['avg_mem_peak_kb']:.2f} KB")
     print(f"  Avg Cost (Conflict Evaluations for successful runs): {metrics_hc['find_one']['avg_cost_conflict_evals']:.2f}")
@@ -0,0 +1,197 @@
+"""
+Hill Climbing com movimentos laterais, lista tabu e reinício automático (versão para benchmark).
+
+Diferente de hill_climbing_single_run, que para no primeiro ótimo local (ou aplica uma
+perturbação aleatória), esta variante:
+  * aceita até `max_laterais` movimentos laterais consecutivos (delta 0) para atravessar platôs;
+  * proíbe mover de novo as `tamanho_tabu` colunas movidas mais recentemente, o que evita
+    ficar oscilando entre os mesmos estados do platô (exceto se o movimento resolve o tabuleiro);
+  * reinicia de um estado aleatório ao atingir um ótimo local estrito, esgotar os laterais
+    ou passar de MAX_PASSOS_POR_RAINHA * N movimentos.
+Os contadores de reinícios, movimentos e avaliações permitem ajustar os parâmetros pelo
+menor tempo até a solução.
+"""
+import random
+import time
+import tracemalloc
+from collections import deque
+
+from avaliador_conflitos import AvaliadorConflitos
+from registro_solvers import Solver, registrar
+
+NUM_RAINHAS = 8
+MAX_LATERAIS = 100 # Movimentos laterais consecutivos permitidos
+TAMANHO_TABU = 3 # Colunas movidas recentemente que ficam proibidas
+MAX_PASSOS_POR_RAINHA = 20 # Passos de cada subida (x N) antes de forçar reinício
+
+def hill_climbing_tabu_passos(n=NUM_RAINHAS, max_laterais=MAX_LATERAIS, tamanho_tabu=TAMANHO_TABU,
+                              max_reinicios=None, cancelado=None, rng=random, instrumentacao=None):
+    """
+    Gera (avaliador, estatisticas) no início de cada subida e após cada movimento.
+    Termina após produzir um estado sem conflitos, ao ser cancelado ou ao exceder
+    `max_reinicios` (None = sem limite). O avaliador é o objeto vivo: copie
+    avaliador.estado se precisar guardá-lo.
+    """
+    estatisticas = {"reinicios": 0, "movimentos": 0, "avaliacoes": 0}
+    tamanho_tabu = min(tamanho_tabu, n - 1) # Sempre sobra ao menos uma coluna móvel
+    max_passos = MAX_PASSOS_POR_RAINHA * n
+
+    while max_reinicios is None or estatisticas["reinicios"] <= max_reinicios:
+        avaliador = AvaliadorConflitos([rng.randrange(n) for _ in range(n)])
+        tabu = deque(maxlen=tamanho_tabu) if tamanho_tabu > 0 else ()
+        laterais = 0
+        yield avaliador, estatisticas
+
+        for _ in range(max_passos):
+            if avaliador.conflitos == 0:
+                return
+            if cancelado is not None and cancelado.is_set():
+                return
+
+            melhor_delta = None
+            melhores = []
+            for coluna in range(n):
+                proibida = coluna in tabu
+                original = avaliador.estado[coluna]
+                for linha in range(n):
+                    if linha == original:
+                        continue
+                    delta = avaliador.delta(coluna, linha)
+                    estatisticas["avaliacoes"] += 1
+                    # Critério de aspiração: movimento tabu só vale se zera os conflitos
+                    if proibida and avaliador.conflitos + delta > 0:
+                        continue
+                    if melhor_delta is None or delta < melhor_delta:
+                        melhor_delta = delta
+                        melhores = [(coluna, linha)]
+                    elif delta == melhor_delta:
+                        melhores.append((coluna, linha))
+            if instrumentacao is not None:
+                instrumentacao.contar("avaliacoes", n * (n - 1))
+
+            if melhor_delta is None or melhor_delta > 0:
+                break # Ótimo local estrito: reinicia
+            if melhor_delta == 0:
+                laterais += 1
+                if laterais > max_laterais:
+                    break # Platô longo demais: reinicia
+            else:
+                laterais = 0
+
+            coluna, linha = rng.choice(melhores) # Desempate aleatório evita ciclos no platô
+            avaliador.mover(coluna, linha)
+            if tamanho_tabu > 0:
+                tabu.append(coluna)
+            estatisticas["movimentos"] += 1
+            if instrumentacao is not None:
+                instrumentacao.contar("movimentos")
+            yield avaliador, estatisticas
+
+        if avaliador.conflitos == 0:
+            return
+        estatisticas["reinicios"] += 1
+        if instrumentacao is not None:
+            instrumentacao.contar("reinicios")
+
+def hill_climbing_tabu(n=NUM_RAINHAS, max_laterais=MAX_LATERAIS, tamanho_tabu=TAMANHO_TABU,
+                       max_reinicios=None, cancelado=None, rng=random, instrumentacao=None):
+    """Executa a busca até resolver. Retorna (solução ou None, estatisticas)."""
+    avaliador, estatisticas = None, None
+    for avaliador, estatisticas in hill_climbing_tabu_passos(n, max_laterais, tamanho_tabu,
+                                                             max_reinicios, cancelado, rng, instrumentacao):
+        pass
+    if avaliador is not None and avaliador.conflitos == 0:
+        return list(avaliador.estado), estatisticas
+    return None, estatisticas
+
+def _executar_medido(n, medir_memoria, max_laterais, tamanho_tabu, max_reinicios, instrumentacao=None):
+    if medir_memoria: tracemalloc.start()
+    start_time = time.perf_counter()
+
+    solucao, estatisticas = hill_climbing_tabu(n, max_laterais, tamanho_tabu, max_reinicios,
+                                               instrumentacao=instrumentacao)
+
+    end_time = time.perf_counter()
+    peak_mem = 0
+    if medir_memoria:
+        current_mem, peak_mem = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    return solucao, estatisticas, end_time - start_time, peak_mem / 1024  # KB
+
+def hill_climbing_tabu_single_run(n=NUM_RAINHAS, medir_memoria=True, max_laterais=MAX_LATERAIS,
+                                  tamanho_tabu=TAMANHO_TABU, max_reinicios=1000, instrumentacao=None):
+    """Mesmo formato de retorno de hill_climbing_single_run; o custo são as avaliações."""
+    solucao, estatisticas, tempo, memoria = _executar_medido(n, medir_memoria, max_laterais,
+                                                             tamanho_tabu, max_reinicios, instrumentacao)
+    return solucao, tempo, memoria, estatisticas["avaliacoes"], solucao is not None
+
+def get_hill_climbing_tabu_metrics(num_runs=100, n=NUM_RAINHAS, max_laterais=MAX_LATERAIS,
+                                   tamanho_tabu=TAMANHO_TABU, max_reinicios=1000):
+    times, mems, costs, restarts, moves = [], [], [], [], []
+    solutions_found = 0
+    solution_example = None
+
+    for _ in range(num_runs):
+        solution, stats, time_val, mem_val = _executar_medido(n, True, max_laterais, tamanho_tabu, max_reinicios)
+        if solution is not None:
+            if solution_example is None: solution_example = solution
+            times.append(time_val)
+            mems.append(mem_val)
+            costs.append(stats["avaliacoes"])
+            restarts.append(stats["reinicios"])
+            moves.append(stats["movimentos"])
+            solutions_found += 1
+
+    avg_time = sum(times) / len(times) if times else 0
+    avg_mem = sum(mems) / len(mems) if mems else 0
+    avg_cost = sum(costs) / len(costs) if costs else 0
+    avg_restarts = sum(restarts) / len(restarts) if restarts else 0
+    avg_moves = sum(moves) / len(moves) if moves else 0
+    success_rate = solutions_found / num_runs if num_runs > 0 else 0
+
+    return {
+        "find_one": {
+            "avg_time_s": avg_time,
+            "avg_mem_peak_kb": avg_mem,
+            "avg_cost_conflict_evals": avg_cost,
+            "avg_restarts": avg_restarts,
+            "avg_moves": avg_moves,
+            "success_rate": success_rate,
+            "solutions_found_count": solutions_found,
+            "solution_example": solution_example,
+            "params": {"max_laterais": max_laterais, "tamanho_tabu": tamanho_tabu}
+        }
+    }
+
+@registrar("hill_climbing_tabu")
+class HillClimbingTabuSolver(Solver):
+    rotulo = "Hill Climbing (laterais + tabu)"
+
+    def single_run(self, medir_memoria=True, instrumentacao=None):
+        return hill_climbing_tabu_single_run(self.n, medir_memoria, instrumentacao=instrumentacao)
+
+    def _find_best(self, cancelado, instrumentacao=None):
+        melhor, melhores_conflitos, estatisticas = None, None, None
+        for avaliador, estatisticas in hill_climbing_tabu_passos(self.n, max_reinicios=1000, cancelado=cancelado,
+                                                                 instrumentacao=instrumentacao):
+            if melhores_conflitos is None or avaliador.conflitos < melhores_conflitos:
+                melhor, melhores_conflitos = list(avaliador.estado), avaliador.conflitos
+        return melhor, melhores_conflitos, estatisticas["avaliacoes"]
+
+    def metrics(self, num_runs=None):
+        return get_hill_climbing_tabu_metrics(self._num_runs(num_runs), self.n)
+
+if __name__ == '__main__':
+    import sys
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else NUM_RAINHAS
+    metrics_tabu = get_hill_climbing_tabu_metrics(num_runs=20, n=n)
+    print(f"Hill Climbing (laterais + tabu + reinícios) Metrics (Find One, N={n}):")
+    print(f"  Avg Time (successful runs): {metrics_tabu['find_one']['avg_time_s']:.6f} s")
+    print(f"  Avg Peak Memory (successful runs): {metrics_tabu['find_one']['avg_mem_peak_kb']:.2f} KB")
+    print(f"  Avg Cost (Conflict Evaluations for successful runs): {metrics_tabu['find_one']['avg_cost_conflict_evals']:.2f}")
+    print(f"  Avg Restarts: {metrics_tabu['find_one']['avg_restarts']:.2f}")
+    print(f"  Avg Moves: {metrics_tabu['find_one']['avg_moves']:.2f}")
+    print(f"  Success Rate: {metrics_tabu['find_one']['success_rate']:.2%}")
+    if metrics_tabu['find_one']['solution_example']:
+        print(f"  Solution Example: {metrics_tabu['find_one']['solution_example']}")
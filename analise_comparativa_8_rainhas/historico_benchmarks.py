@@ -0,0 +1,240 @@
+"""
+Histórico local dos benchmarks e detecção de regressões.
+
+Cada execução de run_benchmarks.py é anexada, como uma linha JSON, a um arquivo
+append-only (HISTORICO_PADRAO), junto com data/hora, revisão do git, versão do Python
+e dados da máquina. comparar() confronta duas execuções, ou uma execução e um JSON de
+métricas como o benchmark_metrics.json versionado, e marca regressões de tempo,
+memória e custo:
+  * com medição robusta (--robusto) nos dois lados, a regressão só é marcada quando
+    os intervalos de confiança de 95% da mediana não se sobrepõem;
+  * com apenas médias, quando a piora relativa passa do limiar do tipo da métrica
+    (LIMIARES) e a absoluta passa de MINIMOS_ABSOLUTOS, já que sem as amostras não
+    há como testar significância.
+
+Uso:
+    python historico_benchmarks.py listar
+    python historico_benchmarks.py comparar [--base REF] [--atual REF]
+REF é um caminho de JSON de métricas, um índice do histórico (-1 = última execução)
+ou um prefixo de revisão do git.
+
+As médias do JSON escondem a cauda da distribuição; por isso as execuções individuais
+(tempo, memória, custo, semente e sucesso) são gravadas à parte, em colunas NumPy
+(ARQUIVO_EXECUCOES), por salvar_execucoes().
+"""
+import argparse
+import datetime
+import json
+import os
+import platform
+import subprocess
+import sys
+
+import numpy as np
+
+DIRETORIO_PACOTE = os.path.dirname(os.path.abspath(__file__))
+DIRETORIO_RESULTADOS = os.path.join(DIRETORIO_PACOTE, "resultados")
+ARQUIVO_METRICAS = os.path.join(DIRETORIO_RESULTADOS, "benchmark_metrics.json")
+HISTORICO_PADRAO = os.path.join(DIRETORIO_RESULTADOS, "historico.jsonl")
+ARQUIVO_EXECUCOES = os.path.join(DIRETORIO_RESULTADOS, "execucoes.npz")
+LINHA_DE_BASE_PADRAO = os.path.join(DIRETORIO_PACOTE, "benchmark_metrics.json") # Versionado no repositório
+
+# Piora relativa a partir da qual uma métrica só com média é marcada como regressão
+LIMIARES = {"time": 0.25, "memory": 0.10, "cost": 0.10}
+# Diferença absoluta mínima para contar como regressão (evita marcar ruído em valores minúsculos)
+MINIMOS_ABSOLUTOS = {"time": 0.0005, "memory": 1.0, "cost": 0}
+# Seções que não são métricas de um algoritmo em N fixo
+SECOES_IGNORADAS = ("robust", "sweep", "baseline", "throughput", "budget", "portfolio")
+# Colunas por execução (mesmas chaves dos resultados de harness_paralelo.executar_run) e seus tipos
+COLUNAS_EXECUCOES = {"seed": np.uint64, "time_s": np.float64, "mem_peak_kb": np.float64,
+                     "cost": np.float64, "found": np.bool_}
+
+def _revisao_git():
+    """Hash do HEAD e se há alterações não commitadas, ou None fora de um repositório git."""
+    try:
+        revisao = subprocess.run(["git", "rev-parse", "HEAD"], cwd=DIRETORIO_PACOTE, capture_output=True,
+                                 text=True, check=True).stdout.strip()
+        status = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], cwd=DIRETORIO_PACOTE,
+                                capture_output=True, text=True, check=True).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return {"revision": revisao, "dirty": bool(status.strip())}
+
+def metadados_execucao():
+    """Contexto da execução gravado junto com as métricas."""
+    return {
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+        "git": _revisao_git(),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": {
+            "node": platform.node(),
+            "system": platform.system(),
+            "release": platform.release(),
+            "arch": platform.machine(),
+            "processor": platform.processor(),
+            "cpu_count": os.cpu_count()
+        },
+        "argv": sys.argv[1:]
+    }
+
+def registrar(metricas, caminho=HISTORICO_PADRAO, meta=None):
+    """Anexa uma execução ao histórico e devolve o registro gravado."""
+    os.makedirs(os.path.dirname(os.path.abspath(caminho)), exist_ok=True)
+    registro = {"meta": meta or metadados_execucao(), "metrics": metricas}
+    with open(caminho, "a") as f:
+        f.write(json.dumps(registro) + "\n")
+    return registro
+
+def carregar_historico(caminho=HISTORICO_PADRAO):
+    """Todas as execuções gravadas, da mais antiga para a mais recente."""
+    if not os.path.exists(caminho):
+        return []
+    with open(caminho) as f:
+        return [json.loads(linha) for linha in f if linha.strip()]
+
+def carregar_referencia(referencia, caminho=HISTORICO_PADRAO):
+    """
+    Métricas de `referencia`: caminho de um JSON de métricas, índice do histórico
+    (ex.: "-1", "0") ou prefixo de revisão do git (a execução mais recente dela).
+    Devolve (descrição, métricas).
+    """
+    if os.path.exists(referencia):
+        with open(referencia) as f:
+            return referencia, json.load(f)
+    historico = carregar_historico(caminho)
+    try:
+        indice = int(referencia)
+    except ValueError:
+        for registro in reversed(historico):
+            git = registro["meta"].get("git") or {}
+            if git.get("revision", "").startswith(referencia):
+                return f"{git['revision'][:10]} ({registro['meta']['timestamp']})", registro["metrics"]
+        raise ValueError(f"Referência {referencia!r} não é arquivo, índice nem revisão do histórico")
+    if not -len(historico) <= indice < len(historico):
+        raise ValueError(f"Índice {indice} fora do histórico ({len(historico)} execuções)")
+    registro = historico[indice]
+    return f"histórico[{indice}] ({registro['meta']['timestamp']})", registro["metrics"]
+
+def salvar_execucoes(execucoes, caminho=ARQUIVO_EXECUCOES):
+    """
+    Grava {algoritmo: [resultado por execução]} em um .npz colunar: uma coluna
+    "algorithm" e uma por chave de COLUNAS_EXECUCOES, todas com uma linha por execução.
+    """
+    os.makedirs(os.path.dirname(os.path.abspath(caminho)), exist_ok=True)
+    linhas = [(nome, r) for nome, resultados in execucoes.items() for r in resultados]
+    colunas = {"algorithm": np.array([nome for nome, _ in linhas], dtype=str)}
+    for coluna, tipo in COLUNAS_EXECUCOES.items():
+        colunas[coluna] = np.array([r[coluna] for _, r in linhas], dtype=tipo)
+    np.savez_compressed(caminho, **colunas)
+
+def carregar_execucoes(caminho=ARQUIVO_EXECUCOES):
+    """{algoritmo: {coluna: array}} gravado por salvar_execucoes, ou {} se o arquivo não existe."""
+    if not os.path.exists(caminho):
+        return {}
+    with np.load(caminho) as arquivo:
+        colunas = {coluna: arquivo[coluna] for coluna in arquivo.files}
+    algoritmos = colunas.pop("algorithm")
+    return {nome: {coluna: valores[algoritmos == nome] for coluna, valores in colunas.items()}
+            for nome in dict.fromkeys(algoritmos.tolist())} # Mantém a ordem de gravação
+
+def _tipo_metrica(chave):
+    if chave == "avg_time_s":
+        return "time"
+    if chave == "avg_mem_peak_kb":
+        return "memory"
+    if chave.startswith("avg_cost"):
+        return "cost"
+    return None
+
+def _medias(metricas):
+    """(algoritmo/seção/chave, tipo, valor) de cada média numérica das métricas."""
+    for algoritmo, secoes in metricas.items():
+        if algoritmo in SECOES_IGNORADAS or not isinstance(secoes, dict):
+            continue
+        for secao, valores in secoes.items():
+            if not isinstance(valores, dict):
+                continue
+            for chave, valor in valores.items():
+                tipo = _tipo_metrica(chave)
+                if tipo and isinstance(valor, (int, float)):
+                    yield f"{algoritmo}/{secao}/{chave}", tipo, valor
+
+def _robustas(metricas):
+    """(robust/algoritmo/medida, tipo, resumo) dos resumos estatísticos da medição robusta."""
+    tipos = {"time_s": "time", "mem_peak_kb": "memory", "cost": "cost"}
+    for algoritmo, medidas in (metricas.get("robust") or {}).items():
+        for medida, tipo in tipos.items():
+            resumo = medidas.get(medida)
+            if resumo:
+                yield f"robust/{algoritmo}/{medida}", tipo, resumo
+
+def comparar(atual, base, limiares=None):
+    """
+    Compara as métricas `atual` com `base`. Devolve uma lista de dicionários (um por
+    métrica presente nos dois lados) com base, atual, variação relativa, método e
+    se é uma regressão.
+    """
+    limiares = {**LIMIARES, **(limiares or {})}
+    resultados = []
+
+    medias_base = {nome: valor for nome, _, valor in _medias(base)}
+    for nome, tipo, valor in _medias(atual):
+        valor_base = medias_base.get(nome)
+        if valor_base is None:
+            continue
+        variacao = (valor - valor_base) / valor_base if valor_base else None
+        resultados.append({
+            "metric": nome, "kind": tipo, "base": valor_base, "current": valor, "change": variacao,
+            "method": f"threshold {limiares[tipo]:.0%}",
+            "regression": (variacao is not None and variacao > limiares[tipo]
+                           and valor - valor_base > MINIMOS_ABSOLUTOS[tipo])
+        })
+
+    robustas_base = {nome: resumo for nome, _, resumo in _robustas(base)}
+    for nome, tipo, resumo in _robustas(atual):
+        resumo_base = robustas_base.get(nome)
+        if resumo_base is None:
+            continue
+        variacao = (resumo["median"] - resumo_base["median"]) / resumo_base["median"] if resumo_base["median"] else None
+        resultados.append({
+            "metric": nome, "kind": tipo, "base": resumo_base["median"], "current": resumo["median"],
+            "change": variacao, "method": "ci95 median",
+            # ICs disjuntos, com o atual inteiramente acima da base
+            "regression": resumo["ci95_median"][0] > resumo_base["ci95_median"][1]
+        })
+    return resultados
+
+def imprimir_comparacao(resultados, descricao_base, descricao_atual):
+    regressoes = [r for r in resultados if r["regression"]]
+    print(f"Comparando {descricao_atual} com a linha de base {descricao_base}: "
+          f"{len(resultados)} métricas, {len(regressoes)} regressões")
+    for r in resultados:
+        variacao = f"{r['change']:+.1%}" if r["change"] is not None else "n/a"
+        marca = "REGRESSÃO" if r["regression"] else ""
+        print(f"  {r['metric']:60s} {r['base']:>14.6g} -> {r['current']:<14.6g} {variacao:>8s}  [{r['method']}] {marca}")
+    return regressoes
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Histórico de benchmarks e detecção de regressões")
+    parser.add_argument("--historico", default=HISTORICO_PADRAO, help="Arquivo JSONL do histórico")
+    subcomandos = parser.add_subparsers(dest="comando", required=True)
+    subcomandos.add_parser("listar", help="Lista as execuções gravadas")
+    comparar_parser = subcomandos.add_parser("comparar", help="Compara duas execuções e marca regressões")
+    comparar_parser.add_argument("--base", default=LINHA_DE_BASE_PADRAO,
+                                 help="Linha de base (padrão: benchmark_metrics.json versionado)")
+    comparar_parser.add_argument("--atual", default="-1", help="Execução comparada (padrão: a última do histórico)")
+    args = parser.parse_args()
+
+    if args.comando == "listar":
+        for indice, registro in enumerate(carregar_historico(args.historico)):
+            meta = registro["meta"]
+            git = meta.get("git") or {}
+            revisao = git.get("revision", "sem git")[:10] + ("+" if git.get("dirty") else "")
+            print(f"[{indice}] {meta['timestamp']}  {revisao}  Python {meta['python']}  "
+                  f"{meta['machine']['node']} ({meta['machine']['arch']})  {' '.join(meta.get('argv', []))}")
+    else:
+        descricao_base, base = carregar_referencia(args.base, args.historico)
+        descricao_atual, atual = carregar_referencia(args.atual, args.historico)
+        regressoes = imprimir_comparacao(comparar(atual, base), descricao_base, descricao_atual)
+        sys.exit(1 if regressoes else 0)
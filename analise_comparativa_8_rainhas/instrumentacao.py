@@ -0,0 +1,68 @@
+"""
+Instrumentação compartilhada pelos solvers das N Rainhas.
+
+Os solvers recebem `instrumentacao=None` por padrão e, nesse caso, o único custo é
+um teste `is not None` por nó/passo. Com uma Instrumentacao ligada, eles reportam:
+  * contadores: nós, avaliações, reinícios e movimentos (CONTADORES), além de
+    contadores próprios de cada solver (ex.: gerações do algoritmo genético);
+  * podas por profundidade (ramos descartados em cada coluna do backtracking);
+  * tempo acumulado por fase (medir_fase);
+e um callback de progresso opcional é chamado a cada `intervalo` eventos contados,
+permitindo acompanhar uma execução longa enquanto ela acontece.
+"""
+import time
+from collections import defaultdict
+from contextlib import contextmanager, nullcontext
+
+CONTADORES = ("nos", "avaliacoes", "reinicios", "movimentos")
+INTERVALO_PROGRESSO = 100000 # Eventos contados entre duas chamadas do callback
+
+class Instrumentacao:
+    def __init__(self, progresso=None, intervalo=INTERVALO_PROGRESSO):
+        self.contadores = dict.fromkeys(CONTADORES, 0)
+        self.podas_por_profundidade = defaultdict(int)
+        self.fases = defaultdict(float) # nome -> segundos acumulados
+        self.progresso = progresso # progresso(instrumentacao)
+        self.intervalo = intervalo
+        self._eventos = 0
+        self._proximo_progresso = intervalo
+
+    def contar(self, nome, quantidade=1):
+        self.contadores[nome] = self.contadores.get(nome, 0) + quantidade
+        self._eventos += quantidade
+        if self._eventos >= self._proximo_progresso:
+            self._proximo_progresso = self._eventos + self.intervalo
+            if self.progresso is not None:
+                self.progresso(self)
+
+    def no(self, profundidade, podas=0):
+        """Um nó visitado na profundidade dada, com `podas` ramos descartados nele."""
+        if podas:
+            self.podas_por_profundidade[profundidade] += podas
+        self.contar("nos")
+
+    @contextmanager
+    def fase(self, nome):
+        inicio = time.perf_counter()
+        try:
+            yield self
+        finally:
+            self.fases[nome] += time.perf_counter() - inicio
+
+    def relatorio(self):
+        """Resumo serializável em JSON, no mesmo estilo das métricas."""
+        return {
+            "counters": dict(self.contadores),
+            "prunes_by_depth": {profundidade: self.podas_por_profundidade[profundidade]
+                                for profundidade in sorted(self.podas_por_profundidade)},
+            "phases_s": dict(self.fases)
+        }
+
+def medir_fase(instrumentacao, nome):
+    """Context manager de fase que não faz nada quando a instrumentação está desligada."""
+    return nullcontext() if instrumentacao is None else instrumentacao.fase(nome)
+
+def imprimir_progresso(instrumentacao):
+    """Callback de progresso simples, para uso na linha de comando."""
+    contadores = ", ".join(f"{nome}={valor}" for nome, valor in instrumentacao.contadores.items() if valor)
+    print(f"  [progresso] {contadores}", flush=True)
@@ -0,0 +1,136 @@
+"""
+Modo de benchmark com medição robusta para os algoritmos das 8 Rainhas.
+
+O tempo é medido num passe sem tracemalloc (que encarece cada alocação), após
+execuções de aquecimento e com o coletor de lixo desligado durante a região
+cronometrada. A memória de pico é medida num passe separado, com as mesmas
+sementes, de modo que os dois passes percorrem exatamente as mesmas execuções.
+Os resultados trazem mediana, p95, mínimo e intervalos de confiança em vez de
+apenas a média das execuções bem-sucedidas.
+"""
+import gc
+import math
+import random
+
+import numpy as np
+
+import backtracking_8_queens
+import harness_paralelo
+import registro_solvers
+
+NUM_RAINHAS = 8
+NUM_AQUECIMENTO = 3
+NUM_REAMOSTRAS_BOOTSTRAP = 1000
+
+def _backtracking(engine, metodo="find_one_solution"):
+    def executar(medir_memoria, n=NUM_RAINHAS, instrumentacao=None):
+        solver = backtracking_8_queens.EightQueensBacktracking(n, engine=engine, instrumentation=instrumentacao)
+        resultado, tempo, memoria, nos = getattr(solver, metodo)(measure_memory=medir_memoria)
+        return tempo, memoria, nos, resultado is not None
+    return executar
+
+def _registrado(classe):
+    def executar(medir_memoria, n=NUM_RAINHAS, instrumentacao=None):
+        _, tempo, memoria, custo, found = classe(n).single_run(medir_memoria, instrumentacao)
+        return tempo, memoria, custo, found
+    return executar
+
+# nome -> executar(medir_memoria, n, instrumentacao=None) que devolve (tempo, memória, custo, sucesso),
+# para todos os solvers do registro
+ALGORITMOS = {nome: _registrado(classe) for nome, classe in registro_solvers.descobrir().items()}
+
+# Enumeração completa: o "custo" é o total de nós da árvore
+ALGORITMOS_ENUMERACAO = {
+    "backtracking_find_all": _backtracking("classic", "find_all_solutions"),
+    "backtracking_count_all_bitmask": _backtracking("bitmask", "count_solutions"),
+}
+
+def resumo_estatistico(valores, semente=0):
+    """Média, mediana, p95, mínimo, máximo e IC de 95% (média: normal; mediana: bootstrap)."""
+    if not valores:
+        return None
+    amostras = np.asarray(valores, dtype=float)
+    n = amostras.size
+    media = float(amostras.mean())
+    desvio = float(amostras.std(ddof=1)) if n > 1 else 0.0
+    margem = 1.96 * desvio / math.sqrt(n)
+    reamostras = np.random.default_rng(semente).choice(amostras, size=(NUM_REAMOSTRAS_BOOTSTRAP, n))
+    medianas = np.median(reamostras, axis=1)
+    return {
+        "n": n,
+        "mean": media,
+        "median": float(np.median(amostras)),
+        "p95": float(np.percentile(amostras, 95)),
+        "min": float(amostras.min()),
+        "max": float(amostras.max()),
+        "stdev": desvio,
+        "ci95_mean": [media - margem, media + margem],
+        "ci95_median": [float(np.percentile(medianas, 2.5)), float(np.percentile(medianas, 97.5))]
+    }
+
+def _executar_sem_gc(executar):
+    """Roda uma execução cronometrada com o GC desligado, restaurando o estado anterior."""
+    gc_estava_ligado = gc.isenabled()
+    gc.collect()
+    gc.disable()
+    try:
+        return executar(False)
+    finally:
+        if gc_estava_ligado:
+            gc.enable()
+
+def medir(algoritmo, num_runs=100, aquecimento=NUM_AQUECIMENTO, semente_mestre=0):
+    """Mede `algoritmo` com passes separados de tempo e memória."""
+    executar = ALGORITMOS[algoritmo]
+    sementes = harness_paralelo.derivar_sementes(semente_mestre, aquecimento + num_runs)
+
+    for semente in sementes[:aquecimento]:
+        random.seed(semente)
+        executar(False)
+
+    tempos, custos, sucessos = [], [], []
+    for semente in sementes[aquecimento:]:
+        random.seed(semente)
+        tempo, _, custo, found = _executar_sem_gc(executar)
+        sucessos.append(found)
+        if found:
+            tempos.append(tempo)
+            custos.append(custo)
+
+    # Mesmas sementes => mesmas execuções, agora com tracemalloc ligado
+    memorias = []
+    for semente, found in zip(sementes[aquecimento:], sucessos):
+        random.seed(semente)
+        _, memoria, _, _ = executar(True)
+        if found:
+            memorias.append(memoria)
+
+    return {
+        "runs": num_runs,
+        "warmup": aquecimento,
+        "master_seed": semente_mestre,
+        "success_rate": sum(sucessos) / num_runs if num_runs > 0 else 0,
+        "time_s": resumo_estatistico(tempos),
+        "mem_peak_kb": resumo_estatistico(memorias),
+        "cost": resumo_estatistico(custos)
+    }
+
+def get_robust_metrics(num_runs=100, aquecimento=NUM_AQUECIMENTO, semente_mestre=0, algoritmos=None):
+    """Medição robusta de todos (ou dos `algoritmos` indicados) os algoritmos registrados."""
+    return {nome: medir(nome, num_runs, aquecimento, semente_mestre)
+            for nome in (algoritmos or ALGORITMOS)}
+
+if __name__ == '__main__':
+    import sys
+    num_runs = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    for nome, metricas in get_robust_metrics(num_runs=num_runs).items():
+        tempo = metricas["time_s"]
+        print(f"{nome}:")
+        if tempo is None:
+            print("  Nenhuma execução bem-sucedida")
+            continue
+        print(f"  Tempo mediano: {tempo['median']:.6f} s (p95 {tempo['p95']:.6f} s, mín {tempo['min']:.6f} s)")
+        print(f"  IC95 da mediana: [{tempo['ci95_median'][0]:.6f}, {tempo['ci95_median'][1]:.6f}] s")
+        print(f"  Pico de memória mediano: {metricas['mem_peak_kb']['median']:.2f} KB")
+        print(f"  Custo mediano: {metricas['cost']['median']:.2f}")
+        print(f"  Taxa de sucesso: {metricas['success_rate']:.2%}")
@@ -0,0 +1,223 @@
+"""
+Implementação de busca local Min-Conflicts para o problema das N Rainhas (versão para benchmark).
+
+O estado é uma permutação (uma rainha por linha e por coluna), de modo que só há
+conflitos diagonais. Os contadores de diagonais ficam em arrays de inteiros, o
+posicionamento inicial é guloso e o reparo escolhe aleatoriamente uma rainha em
+conflito e a troca com outra coluna quando isso reduz os conflitos. Tempo e memória
+crescem linearmente com N, o que permite resolver N=10⁵–10⁶ em segundos.
+"""
+import random
+import time
+import tracemalloc
+from array import array
+
+from instrumentacao import medir_fase
+from registro_solvers import Solver, registrar
+
+NUM_RAINHAS = 8
+TENTATIVAS_GULOSAS_POR_RAINHA = 3.08 # Orçamento do posicionamento guloso (Sosič & Gu)
+MAX_TROCAS_POR_RAINHA = 32 # Limite de trocas (proporcional a N) antes de reiniciar
+VERIFICAR_CANCELAMENTO = 1024 # Trocas do reparo entre consultas a `cancelado`
+
+def verificar_solucao(solucao):
+    """Verifica em O(N), com conjuntos de linhas e diagonais, se nenhuma rainha se ataca."""
+    n = len(solucao)
+    if n == 0:
+        return False
+    linhas, diag_principal, diag_secundaria = set(), set(), set()
+    for coluna, linha in enumerate(solucao):
+        if linha in linhas or (coluna + linha) in diag_principal or (coluna - linha) in diag_secundaria:
+            return False
+        linhas.add(linha)
+        diag_principal.add(coluna + linha)
+        diag_secundaria.add(coluna - linha)
+    return True
+
+def posicionamento_guloso(n, rng):
+    """
+    Constrói uma permutação colocando, coluna a coluna, uma linha ainda livre escolhida
+    ao acaso que não tenha conflito diagonal. Esgotado o orçamento de tentativas, as
+    colunas restantes ficam com a linha sorteada mesmo em conflito.
+    Retorna (linhas, diag_principal, diag_secundaria, tentativas).
+    """
+    linhas = array('i', range(n))
+    diag_principal = array('i', bytes(4 * (2 * n - 1))) # indexada por coluna + linha
+    diag_secundaria = array('i', bytes(4 * (2 * n - 1))) # indexada por coluna - linha + N - 1
+    sorteio = rng.random
+    orcamento = int(TENTATIVAS_GULOSAS_POR_RAINHA * n)
+    tentativas = 0
+
+    for coluna in range(n):
+        livres = n - coluna
+        while True:
+            escolhida = coluna + int(sorteio() * livres)
+            linha = linhas[escolhida]
+            tentativas += 1
+            if tentativas > orcamento or livres == 1 or \
+               (diag_principal[coluna + linha] == 0 and diag_secundaria[coluna - linha + n - 1] == 0):
+                break
+        linhas[coluna], linhas[escolhida] = linha, linhas[coluna]
+        diag_principal[coluna + linha] += 1
+        diag_secundaria[coluna - linha + n - 1] += 1
+    return linhas, diag_principal, diag_secundaria, tentativas
+
+def min_conflicts(n=NUM_RAINHAS, rng=random, instrumentacao=None, cancelado=None):
+    """
+    Min-Conflicts com reinícios até encontrar uma solução ou `cancelado.is_set()`
+    (consultado ao fim de cada tentativa e a cada VERIFICAR_CANCELAMENTO trocas do reparo).
+    Retorna (melhor permutação vista, seus conflitos, avaliações); a permutação é
+    None para N=2 e N=3, que não têm solução e não são tentados.
+    """
+    avaliacoes = 0
+    melhor, melhores_conflitos = None, None
+    sorteio = rng.random
+    while melhores_conflitos != 0 and n not in (2, 3): # N=2 e N=3 não têm solução
+        with medir_fase(instrumentacao, "posicionamento"):
+            linhas, diag_principal, diag_secundaria, tentativas = posicionamento_guloso(n, rng)
+        avaliacoes += tentativas
+        if instrumentacao is not None:
+            instrumentacao.contar("avaliacoes", tentativas)
+        deslocamento = n - 1
+        conflitos = sum(k * (k - 1) // 2 for k in diag_principal if k > 1) + \
+                    sum(k * (k - 1) // 2 for k in diag_secundaria if k > 1)
+        em_conflito = [c for c in range(n) if diag_principal[c + linhas[c]] > 1
+                       or diag_secundaria[c - linhas[c] + deslocamento] > 1]
+
+        trocas_restantes = MAX_TROCAS_POR_RAINHA * n
+        with medir_fase(instrumentacao, "reparo"):
+            while conflitos > 0 and trocas_restantes > 0 and em_conflito:
+                trocas_restantes -= 1
+                if cancelado is not None and trocas_restantes % VERIFICAR_CANCELAMENTO == 0 and cancelado.is_set():
+                    break
+                # Rainha em conflito escolhida ao acaso; entradas obsoletas são descartadas
+                idx = int(sorteio() * len(em_conflito))
+                i = em_conflito[idx]
+                li = linhas[i]
+                if diag_principal[i + li] <= 1 and diag_secundaria[i - li + deslocamento] <= 1:
+                    em_conflito[idx] = em_conflito[-1]
+                    em_conflito.pop()
+                    continue
+                j = int(sorteio() * n)
+                if j == i:
+                    continue
+                lj = linhas[j]
+                avaliacoes += 1
+                if instrumentacao is not None:
+                    instrumentacao.contar("avaliacoes")
+
+                # Delta da troca em O(1): retira as duas rainhas e recoloca trocadas
+                diag_principal[i + li] -= 1; diag_secundaria[i - li + deslocamento] -= 1
+                diag_principal[j + lj] -= 1; diag_secundaria[j - lj + deslocamento] -= 1
+                delta = -(diag_principal[i + li] + diag_secundaria[i - li + deslocamento]
+                          + diag_principal[j + lj] + diag_secundaria[j - lj + deslocamento])
+                delta += diag_principal[i + lj] + diag_secundaria[i - lj + deslocamento]
+                diag_principal[i + lj] += 1; diag_secundaria[i - lj + deslocamento] += 1
+                delta += diag_principal[j + li] + diag_secundaria[j - li + deslocamento]
+                diag_principal[j + li] += 1; diag_secundaria[j - li + deslocamento] += 1
+
+                if delta < 0:
+                    linhas[i], linhas[j] = lj, li
+                    conflitos += delta
+                    em_conflito.append(j)
+                    if instrumentacao is not None:
+                        instrumentacao.contar("movimentos")
+                else: # Desfaz a troca
+                    diag_principal[i + lj] -= 1; diag_secundaria[i - lj + deslocamento] -= 1
+                    diag_principal[j + li] -= 1; diag_secundaria[j - li + deslocamento] -= 1
+                    diag_principal[i + li] += 1; diag_secundaria[i - li + deslocamento] += 1
+                    diag_principal[j + lj] += 1; diag_secundaria[j - lj + deslocamento] += 1
+
+        # O reparo só aceita trocas que reduzem conflitos: o fim de cada tentativa é o seu melhor estado
+        if melhores_conflitos is None or conflitos < melhores_conflitos:
+            melhor, melhores_conflitos = linhas, conflitos
+        if conflitos > 0 and instrumentacao is not None:
+            instrumentacao.contar("reinicios")
+        if cancelado is not None and cancelado.is_set():
+            break
+
+    return melhor, melhores_conflitos, avaliacoes
+
+def min_conflicts_single_run(n=NUM_RAINHAS, rng=random, medir_memoria=True, instrumentacao=None, cancelado=None):
+    """
+    Executa Min-Conflicts (com reinícios) até encontrar uma solução para N rainhas.
+    Com medir_memoria=False o tracemalloc não é ligado: para N=10⁶ ele multiplica o tempo
+    por ~10, e a memória reportada passa a ser 0.
+    """
+    if medir_memoria: tracemalloc.start()
+    start_time = time.perf_counter()
+
+    melhor, conflitos, avaliacoes = min_conflicts(n, rng, instrumentacao, cancelado)
+    solucao = melhor if conflitos == 0 else None
+
+    end_time = time.perf_counter()
+    peak_mem = 0
+    if medir_memoria:
+        current_mem, peak_mem = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    execution_time = end_time - start_time
+    memory_used_peak = peak_mem / 1024  # KB
+
+    is_solution = solucao is not None and verificar_solucao(solucao)
+    return solucao if is_solution else None, execution_time, memory_used_peak, avaliacoes, is_solution
+
+def get_min_conflicts_metrics(num_runs=100, n=NUM_RAINHAS, medir_memoria=True):
+    times, mems, costs = [], [], []
+    solutions_found = 0
+    solution_example = None
+
+    for _ in range(num_runs):
+        solution, time_val, mem_val, cost_val, found = min_conflicts_single_run(n, medir_memoria=medir_memoria)
+        if found:
+            # Para N grande o exemplo completo não cabe no JSON de métricas
+            if solution_example is None and n <= 64: solution_example = list(solution)
+            times.append(time_val)
+            mems.append(mem_val)
+            costs.append(cost_val)
+            solutions_found += 1
+
+    avg_time = sum(times) / len(times) if times else 0
+    avg_mem = sum(mems) / len(mems) if mems else 0
+    avg_cost = sum(costs) / len(costs) if costs else 0
+    success_rate = solutions_found / num_runs if num_runs > 0 else 0
+
+    return {
+        "find_one": {
+            "n": n,
+            "avg_time_s": avg_time,
+            "avg_mem_peak_kb": avg_mem,
+            "avg_cost_conflict_evals": avg_cost,
+            "success_rate": success_rate,
+            "solutions_found_count": solutions_found,
+            "solution_example": solution_example
+        }
+    }
+
+@registrar("min_conflicts")
+class MinConflictsSolver(Solver):
+    rotulo = "Min-Conflicts"
+
+    def single_run(self, medir_memoria=True, instrumentacao=None):
+        return min_conflicts_single_run(self.n, medir_memoria=medir_memoria, instrumentacao=instrumentacao)
+
+    def _find_best(self, cancelado, instrumentacao=None):
+        return min_conflicts(self.n, instrumentacao=instrumentacao, cancelado=cancelado)
+
+    def metrics(self, num_runs=None):
+        return get_min_conflicts_metrics(self._num_runs(num_runs), self.n)
+
+if __name__ == '__main__':
+    import sys
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else NUM_RAINHAS
+    num_runs = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    medir_memoria = "--sem-memoria" not in sys.argv
+    metrics_mc = get_min_conflicts_metrics(num_runs=num_runs, n=n, medir_memoria=medir_memoria)
+    print(f"Min-Conflicts Metrics (Find One, N={n}):")
+    print(f"  Avg Time (successful runs): {metrics_mc['find_one']['avg_time_s']:.6f} s")
+    print(f"  Avg Peak Memory (successful runs): {metrics_mc['find_one']['avg_mem_peak_kb']:.2f} KB")
+    print(f"  Avg Cost (Conflict Evaluations for successful runs): {metrics_mc['find_one']['avg_cost_conflict_evals']:.2f}")
+    print(f"  Success Rate: {metrics_mc['find_one']['success_rate']:.2%}")
+    print(f"  Solutions Found: {metrics_mc['find_one']['solutions_found_count']}")
+    if metrics_mc['find_one']['solution_example']:
+        print(f"  Solution Example: {metrics_mc['find_one']['solution_example']}")
@@ -0,0 +1,126 @@
+"""
+Portfólio de solvers para as N Rainhas: vários algoritmos correm em paralelo.
+
+O solver mais rápido depende de N e da sorte: Random Restart é ótimo em N=8 e inútil
+em N=30, e o tempo até a primeira solução do backtracking oscila muito entre valores
+de N. correr() inicia cada solver de COMPETIDORES num processo próprio (find_best com o
+prazo da corrida), devolve a primeira solução verificada e encerra os demais. Quando
+um competidor determinístico (busca completa) termina sem solução, não existe solução
+para aquele N e a corrida acaba na hora.
+
+correr_por_n() repete a corrida em vários N e registra quem venceu em cada um, o que
+dá a latência do melhor solver em cada tamanho sem escolhê-lo à mão.
+"""
+import multiprocessing
+import queue
+import random
+import statistics
+import time
+from collections import Counter
+
+import registro_solvers
+from harness_paralelo import derivar_sementes
+from min_conflicts_benchmark import verificar_solucao
+from prazo import Prazo
+
+NUM_RAINHAS = 8
+COMPETIDORES = ("backtracking_bitmask", "hill_climbing_tabu", "min_conflicts", "random_restart")
+PRAZO_CORRIDA_S = 10.0 # Sem vencedor até aqui, a corrida termina sem solução
+MARGEM_RELATO_S = 1.0 # Tempo extra para os processos relatarem o resultado do prazo
+NS_PORTFOLIO = (4, 6, 8, 10, 12, 16, 20, 25, 30, 50, 100)
+CORRIDAS_POR_N = 5
+
+def _competir(nome, n, semente, prazo_s, fila):
+    """Processo de um competidor: resolve com find_best e envia o resultado para `fila`."""
+    random.seed(semente)
+    inicio = time.perf_counter()
+    try:
+        solver = registro_solvers.criar(nome, n)
+        estado, conflitos, custo = solver.find_best(prazo_s)
+        tempo = time.perf_counter() - inicio
+        # Busca completa que termina antes do prazo sem solução prova que não há solução
+        sem_solucao = not solver.estocastico and conflitos != 0 and tempo < prazo_s
+        fila.put((nome, estado, conflitos, custo, tempo, sem_solucao, None))
+    except Exception as erro: # Ex.: RecursionError do backtracking em N grande
+        fila.put((nome, None, None, 0, time.perf_counter() - inicio, False, repr(erro)))
+
+def correr(n=NUM_RAINHAS, competidores=COMPETIDORES, prazo_s=PRAZO_CORRIDA_S, semente_mestre=None):
+    """
+    Corre `competidores` (nomes do registro) em processos separados e devolve o primeiro
+    resultado com solução verificada; os processos restantes são encerrados. O tempo de
+    parede inclui a criação dos processos, que faz parte da latência do portfólio.
+    """
+    registro_solvers.descobrir() # Importa os módulos antes do fork, para os filhos herdarem
+    contexto = multiprocessing.get_context()
+    fila = contexto.Queue()
+    processos = {nome: contexto.Process(target=_competir, args=(nome, n, semente, prazo_s, fila), daemon=True)
+                 for nome, semente in zip(competidores, derivar_sementes(semente_mestre, len(competidores)))}
+
+    inicio = time.perf_counter()
+    for processo in processos.values():
+        processo.start()
+    vencedor, sem_solucao, relatos = None, False, {}
+    try:
+        prazo = Prazo(prazo_s + MARGEM_RELATO_S)
+        while vencedor is None and not sem_solucao and len(relatos) < len(processos):
+            try:
+                nome, estado, conflitos, custo, tempo, prova, erro = fila.get(timeout=prazo.restante())
+            except queue.Empty:
+                break
+            verificada = estado is not None and len(estado) == n and conflitos == 0 and verificar_solucao(estado)
+            relatos[nome] = {"time_s": tempo, "conflicts": conflitos, "cost": custo, "verified": verificada,
+                             "error": erro}
+            if verificada:
+                vencedor = (nome, estado)
+            sem_solucao = prova
+        tempo_parede = time.perf_counter() - inicio
+    finally:
+        # Quem já relatou está só saindo; encerrados são os que ainda buscavam
+        encerrados = [nome for nome, processo in processos.items() if nome not in relatos and processo.is_alive()]
+        for nome in encerrados:
+            processos[nome].terminate()
+        for processo in processos.values():
+            processo.join()
+
+    return {
+        "n": n,
+        "winner": vencedor[0] if vencedor else None,
+        "solution": vencedor[1] if vencedor else None,
+        "wall_s": tempo_parede,
+        "no_solution": sem_solucao,
+        "reports": relatos,
+        "killed": encerrados
+    }
+
+def correr_por_n(ns=NS_PORTFOLIO, corridas=CORRIDAS_POR_N, competidores=COMPETIDORES, prazo_s=PRAZO_CORRIDA_S,
+                 semente_mestre=0):
+    """
+    `corridas` corridas do portfólio em cada N. Retorna {N: vitórias por solver, solver que
+    mais venceu, taxa de sucesso e latência mediana}, com N como string (chave de JSON).
+    """
+    resultados = {}
+    for n in ns:
+        rodadas = [correr(n, competidores, prazo_s, semente)
+                   for semente in derivar_sementes([semente_mestre, n], corridas)]
+        tempos = [r["wall_s"] for r in rodadas if r["winner"]]
+        vitorias = Counter(r["winner"] for r in rodadas if r["winner"])
+        resultados[str(n)] = {
+            "runs": corridas,
+            "wins": dict(vitorias.most_common()),
+            "winner": vitorias.most_common(1)[0][0] if vitorias else None,
+            "success_rate": len(tempos) / corridas if corridas > 0 else 0,
+            "median_wall_s": statistics.median(tempos) if tempos else None,
+            "max_wall_s": max(tempos) if tempos else None,
+            "no_solution": any(r["no_solution"] for r in rodadas)
+        }
+    return resultados
+
+if __name__ == '__main__':
+    import sys
+    ns = [int(arg) for arg in sys.argv[1:]] or NS_PORTFOLIO
+    for n, registro in correr_por_n(ns).items():
+        if registro["no_solution"]:
+            print(f"N={n}: sem solução")
+            continue
+        print(f"N={n}: vencedor {registro['winner']} {registro['wins']}, "
+              f"mediana {registro['median_wall_s'] * 1000:.1f} ms, sucesso {registro['success_rate']:.0%}")
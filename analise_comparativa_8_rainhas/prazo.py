@@ -0,0 +1,31 @@
+"""
+Prazo de execução no formato de cancelamento das buscas.
+
+As buscas interrompíveis recebem `cancelado`, um objeto com is_set() (nas interfaces
+gráficas, o threading.Event do trabalhador). Prazo tem a mesma interface: is_set() fica
+verdadeiro quando o tempo acaba ou quando o `cancelado` opcional é acionado, então toda
+busca que aceita cancelamento também aceita um orçamento de tempo.
+"""
+import time
+
+
+class Prazo:
+    def __init__(self, segundos=None, cancelado=None):
+        # segundos=None: sem limite de tempo, só o `cancelado` (se houver)
+        self.limite = None if segundos is None else time.perf_counter() + segundos
+        self.cancelado = cancelado
+
+    def restante(self):
+        """
+        Segundos até o prazo (nunca negativo; infinito sem prazo). Um `cancelado` que também
+        é um Prazo (ex.: o de find_best envolvendo o de medir_orcamento) limita o restante.
+        """
+        restante = float("inf") if self.limite is None else max(0.0, self.limite - time.perf_counter())
+        if isinstance(self.cancelado, Prazo):
+            return min(restante, self.cancelado.restante())
+        return restante
+
+    def is_set(self):
+        if self.cancelado is not None and self.cancelado.is_set():
+            return True
+        return self.limite is not None and time.perf_counter() >= self.limite
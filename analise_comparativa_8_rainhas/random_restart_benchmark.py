@@ -5,56 +5,169 @@ import random
 import time
 import tracemalloc
 
+import numpy as np
+
+from avaliador_conflitos import AvaliadorConflitos, conflitos_em_lote
+from registro_solvers import Solver, registrar
+
 NUM_RAINHAS = 8
+TAMANHO_LOTE = 4096 # Permutações geradas e validadas por operação vetorizada
+MAX_TENTATIVAS = 200000 # Limite de segurança para 8-rainhas, geralmente encontra bem antes
+VERIFICAR_CANCELAMENTO = 64 # Tentativas entre consultas a `cancelado`
 
-def eh_valida(solucao):
+def eh_valida(solucao, n=NUM_RAINHAS):
     """Verifica se uma solução é válida (nenhuma rainha se ataca)."""
-    if not solucao or len(solucao) != NUM_RAINHAS:
+    if not solucao or len(solucao) != n:
         return False
-    for i in range(NUM_RAINHAS):
-        for j in range(i + 1, NUM_RAINHAS):
+    for i in range(n):
+        for j in range(i + 1, n):
             if solucao[i] == solucao[j] or abs(solucao[i] - solucao[j]) == abs(i - j):
                 return False
     return True
 
-def gerar_solucao_aleatoria():
+def gerar_solucao_aleatoria(n=NUM_RAINHAS):
     """Gera uma permutação aleatória das posições das rainhas."""
-    solucao = list(range(NUM_RAINHAS))
+    solucao = list(range(n))
     random.shuffle(solucao)
     return solucao
 
-def random_restart_single_run():
+def random_restart(n=NUM_RAINHAS, instrumentacao=None, cancelado=None):
+    """
+    Sorteia permutações até achar uma válida, esgotar MAX_TENTATIVAS ou `cancelado.is_set()`
+    (verificado a cada VERIFICAR_CANCELAMENTO tentativas). Retorna (melhor permutação, seus
+    conflitos, tentativas); a melhor só é acompanhada quando há `cancelado`, já que sem ele
+    a busca só termina sem solução ao esgotar as tentativas.
+    """
+    tentativas = 0
+    melhor, melhores_conflitos = None, None
+
+    while tentativas < MAX_TENTATIVAS:
+        tentativas += 1
+        if instrumentacao is not None:
+            instrumentacao.contar("reinicios")
+        solucao_atual = gerar_solucao_aleatoria(n)
+        if eh_valida(solucao_atual, n):
+            return solucao_atual, 0, tentativas
+        if cancelado is not None:
+            conflitos = AvaliadorConflitos(solucao_atual).conflitos
+            if melhores_conflitos is None or conflitos < melhores_conflitos:
+                melhor, melhores_conflitos = solucao_atual, conflitos
+            if tentativas % VERIFICAR_CANCELAMENTO == 0 and cancelado.is_set():
+                break
+
+    return melhor, melhores_conflitos, tentativas
+
+def random_restart_single_run(n=NUM_RAINHAS, medir_memoria=True, instrumentacao=None, cancelado=None):
     """Executa uma única tentativa de Random Restart para encontrar uma solução."""
-    tracemalloc.start()
+    if medir_memoria: tracemalloc.start()
     start_time = time.perf_counter()
     
-    tentativas = 0 
-    solucao_encontrada = None
-    max_tentativas = 200000 # Limite de segurança para 8-rainhas, geralmente encontra bem antes
-
-    while tentativas < max_tentativas:
-        tentativas += 1
-        solucao_atual = gerar_solucao_aleatoria()
-        if eh_valida(solucao_atual):
-            solucao_encontrada = solucao_atual
-            break
+    solucao, conflitos, tentativas = random_restart(n, instrumentacao, cancelado)
+    solucao_encontrada = solucao if conflitos == 0 else None
             
     end_time = time.perf_counter()
-    current_mem, peak_mem = tracemalloc.get_traced_memory()
-    tracemalloc.stop()
+    peak_mem = 0
+    if medir_memoria:
+        current_mem, peak_mem = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
 
     execution_time = end_time - start_time
     memory_used_peak = peak_mem / 1024  # KB
     
     return solucao_encontrada, execution_time, memory_used_peak, tentativas, (solucao_encontrada is not None)
 
-def get_random_restart_metrics(num_runs=100): # Random Restart pode ter variabilidade
+def validar_lote(lote):
+    """
+    Valida de uma vez uma matriz (tentativas x N) de permutações: cada linha
+    é válida se os valores de coluna+linha e de coluna-linha não se repetem.
+    As linhas já são distintas por construção (permutação).
+    """
+    colunas = np.arange(lote.shape[1])
+    validas = np.ones(lote.shape[0], dtype=bool)
+    for diagonais in (lote + colunas, lote - colunas):
+        diagonais.sort(axis=1)
+        validas &= (np.diff(diagonais, axis=1) != 0).all(axis=1)
+    return validas
+
+def random_restart_batch(n=NUM_RAINHAS, tamanho_lote=TAMANHO_LOTE, rng=None, instrumentacao=None, cancelado=None):
+    """
+    Random Restart em lote: sorteia `tamanho_lote` permutações como uma matriz NumPy,
+    valida todas vetorizadamente e devolve a primeira válida. As tentativas contam
+    até a primeira válida do lote, como se o lote fosse percorrido em sequência.
+    `cancelado` é consultado a cada lote; se for um Prazo, os lotes começam pequenos e no
+    máximo dobram, limitados ao que cabe no tempo restante pela vazão do lote anterior
+    (o custo por permutação cresce com o lote, então a estimativa sozinha subestimaria).
+    Mesmo retorno de random_restart.
+    """
+    # Sem rng explícito, a semente vem do módulo random: random.seed(s) reproduz também o lote
+    rng = rng if rng is not None else np.random.default_rng(random.getrandbits(64))
+    base = np.arange(n)
+    tentativas = 0
+    melhor, melhores_conflitos = None, None
+    restante = getattr(cancelado, "restante", None)
+    segundos_por_tentativa, tamanho = None, VERIFICAR_CANCELAMENTO // 2
+
+    while tentativas < MAX_TENTATIVAS:
+        if restante is None:
+            tamanho = min(tamanho_lote, MAX_TENTATIVAS - tentativas)
+        else:
+            cabe = 2 * tamanho
+            if segundos_por_tentativa: # Sem limite de tempo, restante() é infinito e só o dobro limita
+                cabe = min(cabe, restante() / segundos_por_tentativa)
+            tamanho = max(1, int(min(tamanho_lote, MAX_TENTATIVAS - tentativas, cabe)))
+        inicio_lote = time.perf_counter()
+        lote = rng.permuted(np.broadcast_to(base, (tamanho, n)), axis=1)
+        indices_validos = np.flatnonzero(validar_lote(lote))
+        if indices_validos.size:
+            primeira = indices_validos[0]
+            tentativas += int(primeira) + 1
+            if instrumentacao is not None:
+                instrumentacao.contar("reinicios", int(primeira) + 1)
+            return lote[primeira].tolist(), 0, tentativas
+        tentativas += tamanho
+        if instrumentacao is not None:
+            instrumentacao.contar("reinicios", tamanho)
+        if cancelado is not None:
+            conflitos = conflitos_em_lote(lote)
+            indice = int(conflitos.argmin())
+            if melhores_conflitos is None or conflitos[indice] < melhores_conflitos:
+                melhor, melhores_conflitos = lote[indice].tolist(), int(conflitos[indice])
+            segundos_por_tentativa = (time.perf_counter() - inicio_lote) / tamanho
+            if cancelado.is_set():
+                break
+
+    return melhor, melhores_conflitos, tentativas
+
+def random_restart_batch_single_run(n=NUM_RAINHAS, tamanho_lote=TAMANHO_LOTE, rng=None, medir_memoria=True,
+                                    instrumentacao=None, cancelado=None):
+    """random_restart_single_run com as permutações sorteadas e validadas por random_restart_batch."""
+    if medir_memoria: tracemalloc.start()
+    start_time = time.perf_counter()
+
+    solucao, conflitos, tentativas = random_restart_batch(n, tamanho_lote, rng, instrumentacao, cancelado)
+    solucao_encontrada = solucao if conflitos == 0 else None
+
+    end_time = time.perf_counter()
+    peak_mem = 0
+    if medir_memoria:
+        current_mem, peak_mem = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    execution_time = end_time - start_time
+    memory_used_peak = peak_mem / 1024  # KB
+
+    return solucao_encontrada, execution_time, memory_used_peak, tentativas, (solucao_encontrada is not None)
+
+def get_random_restart_metrics(num_runs=100, em_lote=False, n=NUM_RAINHAS): # Random Restart pode ter variabilidade
     times, mems, costs = [], [], []
     solutions_found_count = 0
     solution_example = None
 
     for i in range(num_runs):
-        solucao, tempo, memoria, custo, found = random_restart_single_run()
+        if em_lote:
+            solucao, tempo, memoria, custo, found = random_restart_batch_single_run(n)
+        else:
+            solucao, tempo, memoria, custo, found = random_restart_single_run(n)
         # print(f"Run {i+1}: Found: {found}, Time: {tempo:.4f}s, Mem: {memoria:.2f}KB, Attempts: {custo}")
         if found:
             if solution_example is None: solution_example = solucao
@@ -79,9 +192,49 @@ def get_random_restart_metrics(num_runs=100): # Random Restart pode ter variabil
         }
     }
 
+@registrar("random_restart")
+class RandomRestartSolver(Solver):
+    rotulo = "Random Restart"
+    chave_custo = "avg_cost_attempts"
+    rotulo_custo = "Tentativas"
+
+    def single_run(self, medir_memoria=True, instrumentacao=None):
+        return random_restart_single_run(self.n, medir_memoria, instrumentacao)
+
+    def _find_best(self, cancelado, instrumentacao=None):
+        return random_restart(self.n, instrumentacao, cancelado)
+
+    def metrics(self, num_runs=None):
+        return get_random_restart_metrics(self._num_runs(num_runs), False, self.n)
+
+@registrar("random_restart_batch")
+class RandomRestartLoteSolver(RandomRestartSolver):
+    """solve_many reaproveita um único gerador NumPy em vez de criar um por execução."""
+    rotulo = "Random Restart (lote NumPy)"
+
+    def __init__(self, n=NUM_RAINHAS):
+        super().__init__(n)
+        self.rng = None
+
+    def warm_up(self):
+        # Semente do módulo random, como no caminho sem rng: random.seed(s) reproduz o lote
+        self.rng = np.random.default_rng(random.getrandbits(64))
+
+    def single_run(self, medir_memoria=True, instrumentacao=None):
+        return random_restart_batch_single_run(self.n, rng=self.rng, medir_memoria=medir_memoria,
+                                               instrumentacao=instrumentacao)
+
+    def _find_best(self, cancelado, instrumentacao=None):
+        return random_restart_batch(self.n, rng=self.rng, instrumentacao=instrumentacao, cancelado=cancelado)
+
+    def metrics(self, num_runs=None):
+        return get_random_restart_metrics(self._num_runs(num_runs), True, self.n)
+
 if __name__ == '__main__':
-    metrics_rr = get_random_restart_metrics(num_runs=20) # Menos runs para teste rápido no main
-    print("Random Restart Metrics (Find One):")
+    import sys
+    em_lote = "--lote" in sys.argv
+    metrics_rr = get_random_restart_metrics(num_runs=20, em_lote=em_lote) # Menos runs para teste rápido no main
+    print(f"Random Restart Metrics (Find One{', em lote' if em_lote else ''}):")
     # Correção: Usar aspas simples para o f-string ou variáveis intermediárias
     avg_time_s = metrics_rr['find_one']['avg_time_s']
     avg_mem_peak_kb = metrics_rr['find_one']['avg_mem_peak_kb']
@@ -0,0 +1,263 @@
+"""
+Interface comum dos solvers das N Rainhas e registro descoberto automaticamente.
+
+Cada algoritmo registra, no próprio módulo, uma subclasse de Solver com @registrar(nome).
+descobrir() importa os módulos de algoritmos do pacote (PADROES_MODULOS), o que popula
+SOLVERS; run_benchmarks, harness_paralelo, medicao_robusta e generate_charts percorrem
+esse registro em vez de listar os algoritmos. Um algoritmo novo só precisa do seu módulo.
+
+A interface:
+  * single_run(medir_memoria, instrumentacao): uma execução medida, no formato
+    (solução, tempo, memória, custo, sucesso) de *_single_run — o único método obrigatório;
+  * find_one(): (solução ou None, custo), sem medição;
+  * iter_solutions(limite): soluções distintas (exaustivo no backtracking; amostragem
+    até parar de aparecer soluções novas nos estocásticos);
+  * solve_many(k): k execuções de find_one que reaproveitam o estado preparado por
+    warm_up() (instância, gerador de números aleatórios...), para medir vazão;
+  * find_best(prazo_s, cancelado): modo anytime — busca até resolver ou até o prazo e
+    devolve o melhor estado visto com seus conflitos;
+  * metrics(num_runs): {"find_one": {...}}, com o custo médio em `chave_custo`.
+
+medir_orcamento() e qualidade_no_prazo() medem os solvers por orçamento de tempo
+(soluções distintas em um tempo fixo, conflitos restantes após um prazo curto), que
+importam mais para um SLO de latência do que o tempo médio até uma solução.
+"""
+import abc
+import fnmatch
+import importlib
+import os
+import pkgutil
+import statistics
+import time
+
+from prazo import Prazo
+
+NUM_RAINHAS = 8
+PADROES_MODULOS = ("*_benchmark", "backtracking_8_queens") # Módulos importados por descobrir()
+MAX_REPETIDAS = 1000 # find_one seguidos sem solução nova antes de iter_solutions desistir
+K_VAZAO = 200 # Execuções de solve_many em medir_vazao
+ORCAMENTO_S = 1.0 # Tempo de relógio de medir_orcamento
+PRAZO_QUALIDADE_S = 0.01 # Prazo de cada find_best em qualidade_no_prazo
+EXECUCOES_QUALIDADE = 50
+
+SOLVERS = {} # nome -> subclasse de Solver, na ordem de registro
+
+class Solver(abc.ABC):
+    nome = None # Definido por @registrar
+    rotulo = None # Nome para mensagens e gráficos
+    chave_custo = "avg_cost_conflict_evals" # Chave do custo médio em metrics()["find_one"]
+    rotulo_custo = "Avaliações de Conflito"
+    estocastico = True # Execuções dependem da semente (entra no harness paralelo)
+    runs_padrao = 100 # Execuções usadas por run_benchmarks
+
+    def __init__(self, n=NUM_RAINHAS):
+        self.n = n
+        self.aquecido = False
+
+    def _num_runs(self, num_runs):
+        return self.runs_padrao if num_runs is None else num_runs
+
+    @abc.abstractmethod
+    def single_run(self, medir_memoria=True, instrumentacao=None):
+        """Uma execução medida: (solução, tempo, memória, custo, sucesso)."""
+
+    def find_one(self, instrumentacao=None):
+        solucao, _, _, custo, found = self.single_run(False, instrumentacao)
+        return (list(solucao) if found else None), custo
+
+    def iter_solutions(self, limite=None, cancelado=None):
+        """
+        Soluções distintas, até `limite`. Padrão para buscas estocásticas: repete find_one
+        e descarta as já vistas, parando após MAX_REPETIDAS execuções seguidas sem novidade.
+        Com `cancelado` (ex.: um Prazo), cada execução é um find_best interrompível e a
+        iteração só para quando ele é acionado.
+        """
+        vistas = set()
+        repetidas = 0
+        while (limite is None or len(vistas) < limite) and \
+              (repetidas < MAX_REPETIDAS if cancelado is None else not cancelado.is_set()):
+            if cancelado is None:
+                solucao, _ = self.find_one()
+            else:
+                solucao, conflitos, _ = self.find_best(cancelado=cancelado)
+                solucao = solucao if conflitos == 0 else None
+            chave = tuple(solucao) if solucao is not None else None
+            if chave is None or chave in vistas:
+                repetidas += 1
+                continue
+            repetidas = 0
+            vistas.add(chave)
+            yield list(chave)
+
+    def warm_up(self):
+        """Prepara o estado reaproveitado entre as execuções de solve_many (padrão: nada)."""
+
+    def solve_many(self, k, instrumentacao=None):
+        """k execuções independentes de find_one sobre o estado aquecido: [(solução ou None, custo)]."""
+        if not self.aquecido:
+            self.warm_up()
+            self.aquecido = True
+        return [self.find_one(instrumentacao) for _ in range(k)]
+
+    def find_best(self, prazo_s=None, cancelado=None, instrumentacao=None):
+        """
+        Modo anytime: busca até resolver, até `prazo_s` segundos ou até `cancelado.is_set()`.
+        Buscas estocásticas reiniciam enquanto houver prazo ou cancelamento. Retorna
+        (melhor estado visto, seus conflitos, custo total); o estado é None se nada foi
+        construído (ex.: N=2 e N=3). Uma busca que não devolve estado encerra os reinícios:
+        repeti-la até o prazo só gastaria a CPU sem chance de melhora.
+        """
+        prazo = Prazo(prazo_s, cancelado)
+        reiniciar = self.estocastico and (prazo_s is not None or cancelado is not None)
+        melhor, melhores_conflitos, custo_total = None, None, 0
+        while True:
+            estado, conflitos, custo = self._find_best(prazo, instrumentacao)
+            custo_total += custo
+            if conflitos is not None and (melhores_conflitos is None or conflitos < melhores_conflitos):
+                melhor, melhores_conflitos = list(estado), conflitos
+            if estado is None or melhores_conflitos == 0 or not reiniciar or prazo.is_set():
+                return melhor, melhores_conflitos, custo_total
+
+    def _find_best(self, cancelado, instrumentacao=None):
+        """
+        Uma busca de find_best, interrompida por `cancelado`: (estado, conflitos, custo).
+        Padrão para buscas que não são interrompíveis: um find_one completo.
+        """
+        solucao, custo = self.find_one(instrumentacao)
+        return solucao, (0 if solucao is not None else None), custo
+
+    def metrics(self, num_runs=None):
+        """
+        Métricas de `num_runs` execuções medidas (padrão: runs_padrao). Os módulos com
+        get_*_metrics próprios sobrescrevem isto para manter os campos específicos.
+        """
+        num_runs = self._num_runs(num_runs)
+        times, mems, costs = [], [], []
+        solution_example = None
+        for _ in range(num_runs):
+            solution, time_val, mem_val, cost_val, found = self.single_run()
+            if found:
+                if solution_example is None and self.n <= 64: solution_example = list(solution)
+                times.append(time_val)
+                mems.append(mem_val)
+                costs.append(cost_val)
+        return {
+            "find_one": {
+                "avg_time_s": sum(times) / len(times) if times else 0,
+                "avg_mem_peak_kb": sum(mems) / len(mems) if mems else 0,
+                self.chave_custo: sum(costs) / len(costs) if costs else 0,
+                "success_rate": len(times) / num_runs if num_runs > 0 else 0,
+                "solutions_found_count": len(times),
+                "solution_example": solution_example
+            }
+        }
+
+def registrar(nome):
+    """Decorador de classe: registra a subclasse de Solver sob `nome`."""
+    def decorador(classe):
+        classe.nome = nome
+        if classe.rotulo is None:
+            classe.rotulo = nome.replace("_", " ").title()
+        SOLVERS[nome] = classe
+        return classe
+    return decorador
+
+def descobrir():
+    """
+    Importa os módulos de algoritmos do pacote (registrando seus solvers) e devolve SOLVERS,
+    ordenado por nome de módulo e, dentro dele, pela ordem de definição — independente de
+    quem importou o quê primeiro.
+    """
+    diretorio = os.path.dirname(os.path.abspath(__file__))
+    modulos = [info.name for info in pkgutil.iter_modules([diretorio])
+               if any(fnmatch.fnmatch(info.name, padrao) for padrao in PADROES_MODULOS)]
+    modulos.sort()
+    for modulo in modulos:
+        importlib.import_module(modulo)
+    posicao = {modulo: i for i, modulo in enumerate(modulos)}
+    ordenados = sorted(SOLVERS.items(), key=lambda item: posicao.get(item[1].__module__, len(posicao)))
+    SOLVERS.clear()
+    SOLVERS.update(ordenados)
+    return SOLVERS
+
+def criar(nome, n=NUM_RAINHAS):
+    """Instancia o solver registrado como `nome`."""
+    solvers = descobrir()
+    if nome not in solvers:
+        raise ValueError(f"Solver desconhecido: {nome!r} (use um de {tuple(solvers)})")
+    return solvers[nome](n)
+
+def medir_vazao(nome, k=K_VAZAO, n=NUM_RAINHAS):
+    """Soluções por segundo de solve_many(k), com o aquecimento fora do tempo medido."""
+    solver = criar(nome, n)
+    solver.solve_many(1) # warm_up e a primeira execução (imports tardios, caches) ficam de fora
+    inicio = time.perf_counter()
+    resultados = solver.solve_many(k)
+    tempo = time.perf_counter() - inicio
+    sucessos = sum(1 for solucao, _ in resultados if solucao is not None)
+    return {
+        "n": n,
+        "k": k,
+        "wall_s": tempo,
+        "solves_per_s": k / tempo if tempo > 0 else 0,
+        "success_rate": sucessos / k if k > 0 else 0
+    }
+
+def _aquecer(solver):
+    """warm_up e uma primeira execução limitada ao prazo de qualidade (um find_one pode não terminar em N grande)."""
+    solver.solve_many(0)
+    solver.find_best(PRAZO_QUALIDADE_S)
+
+def medir_orcamento(nome, orcamento_s=ORCAMENTO_S, n=NUM_RAINHAS):
+    """
+    Soluções válidas distintas que iter_solutions produz em `orcamento_s` segundos de
+    relógio, com o aquecimento fora do orçamento. A taxa é sempre sobre o orçamento
+    inteiro, mesmo quando uma enumeração exaustiva termina antes ("exhausted").
+    """
+    solver = criar(nome, n)
+    _aquecer(solver)
+    prazo = Prazo(orcamento_s)
+    inicio = time.perf_counter()
+    distintas = sum(1 for _ in solver.iter_solutions(cancelado=prazo))
+    tempo = time.perf_counter() - inicio
+    return {
+        "n": n,
+        "budget_s": orcamento_s,
+        "wall_s": tempo, # Passa do orçamento pelo intervalo entre consultas ao prazo
+        "distinct_solutions": distintas,
+        "exhausted": tempo < orcamento_s,
+        "solutions_per_s": distintas / orcamento_s if orcamento_s > 0 else 0
+    }
+
+def qualidade_no_prazo(nome, prazo_s=PRAZO_QUALIDADE_S, execucoes=EXECUCOES_QUALIDADE, n=NUM_RAINHAS):
+    """Conflitos do melhor estado de find_best(prazo_s) em `execucoes` execuções independentes."""
+    solver = criar(nome, n)
+    _aquecer(solver)
+    conflitos, tempos = [], []
+    for _ in range(execucoes):
+        inicio = time.perf_counter()
+        _, conflitos_execucao, _ = solver.find_best(prazo_s)
+        tempos.append(time.perf_counter() - inicio)
+        if conflitos_execucao is not None:
+            conflitos.append(conflitos_execucao)
+    return {
+        "n": n,
+        "deadline_s": prazo_s,
+        "runs": execucoes,
+        "success_rate": conflitos.count(0) / execucoes if execucoes > 0 else 0,
+        "median_conflicts": statistics.median(conflitos) if conflitos else None,
+        "max_conflicts": max(conflitos) if conflitos else None,
+        "max_time_s": max(tempos) if tempos else 0 # Quanto o prazo é respeitado
+    }
+
+if __name__ == '__main__':
+    import sys
+    # Os módulos registram no registro_solvers importado, não neste __main__
+    import registro_solvers
+    k = int(sys.argv[1]) if len(sys.argv) > 1 else K_VAZAO
+    for nome, classe in registro_solvers.descobrir().items():
+        vazao = registro_solvers.medir_vazao(nome, k)
+        qualidade = registro_solvers.qualidade_no_prazo(nome)
+        print(f"{classe.rotulo}: {vazao['solves_per_s']:.1f} soluções/s "
+              f"({k} execuções, sucesso {vazao['success_rate']:.0%}); "
+              f"em {PRAZO_QUALIDADE_S * 1000:.0f} ms resolve {qualidade['success_rate']:.0%}")
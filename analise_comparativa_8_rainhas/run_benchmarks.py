@@ -2,50 +2,309 @@
 Script principal para executar os benchmarks dos algoritmos para o problema das 8 Rainhas
 e coletar/consolidar as métricas de desempenho.
 """
+import argparse
+import cProfile
 import json
-import backtracking_8_queens
-import hill_climbing_benchmark
-import random_restart_benchmark
+import os
+import pstats
+import random
+import time
 
-NUM_RUNS_BT = 5
-NUM_RUNS_HC = 100  # Hill Climbing pode falhar, precisa de mais execuções
-NUM_RUNS_RR = 100  # Random Restart é estocástico
+import numpy as np
 
-def run_all_benchmarks():
-    """Executa todos os benchmarks e retorna um dicionário com os resultados."""
+import constructive_benchmark
+import harness_paralelo
+import historico_benchmarks
+import instrumentacao
+import medicao_robusta
+import min_conflicts_benchmark
+import portfolio
+import registro_solvers
+
+# As execuções de cada algoritmo vêm do registro (Solver.runs_padrao); estas são as da medição robusta
+NUM_RUNS_ROBUSTO = 100
+
+# Varredura em N: faixas por tipo de busca e orçamento de tempo por algoritmo
+NS_SWEEP_BUSCA_LOCAL = range(4, 31)
+NS_SWEEP_ENUMERACAO = range(4, 15)
+RUNS_SWEEP_POR_N = 10
+ORCAMENTO_SWEEP_S = 30.0
+
+# Comparação com a solução construtiva em N grande
+N_BASELINE = 10**6
+RUNS_BASELINE = 3
+
+# Perfilamento (--profile)
+RUNS_PROFILE = 20
+LINHAS_PROFILE = 25
+
+def _metricas_estocasticas(nome, num_runs, workers, semente_mestre, execucoes=None):
+    """
+    Executa as runs de `nome` pelo harness, com sementes por execução reprodutíveis via
+    harness_paralelo.reproduzir(nome, semente), e guarda cada execução em `execucoes[nome]`
+    (se fornecido). Sem workers, roda em série; sem semente mestre, sorteia uma, que fica
+    registrada em master_seed.
+    """
+    if semente_mestre is None:
+        semente_mestre = np.random.SeedSequence().entropy
+    resultados = harness_paralelo.executar_runs(nome, num_runs, semente_mestre, 1 if workers is None else workers)
+    if execucoes is not None:
+        execucoes[nome] = resultados
+    return harness_paralelo.agregar(nome, resultados, semente_mestre)
+
+def _sweep_algoritmo(executar, ns, runs_por_n, orcamento_s, semente_mestre):
+    """
+    Varre N em ordem crescente até esgotar o orçamento do algoritmo. O tempo vem
+    de execuções sem tracemalloc; a memória, de uma repetição da primeira execução
+    bem-sucedida (mesma semente) com tracemalloc ligado.
+    """
+    pontos = []
+    gasto = 0.0
+    for n in ns:
+        inicio = time.perf_counter()
+        tempos, custos, sementes_ok = [], [], []
+        runs = 0
+        for semente in harness_paralelo.derivar_sementes([semente_mestre, n], runs_por_n):
+            random.seed(semente)
+            tempo, _, custo, found = executar(False, n)
+            runs += 1
+            if found:
+                tempos.append(tempo)
+                custos.append(custo)
+                sementes_ok.append(semente)
+            if gasto + time.perf_counter() - inicio > orcamento_s:
+                break # Orçamento esgotado no meio de N: ponto parcial
+        memoria = None
+        if sementes_ok:
+            random.seed(sementes_ok[0])
+            _, memoria, _, _ = executar(True, n)
+        gasto += time.perf_counter() - inicio
+        pontos.append({
+            "n": n,
+            "runs": runs,
+            "success_rate": len(tempos) / runs,
+            "avg_time_s": sum(tempos) / len(tempos) if tempos else None,
+            "median_time_s": medicao_robusta.resumo_estatistico(tempos)["median"] if tempos else None,
+            "mem_peak_kb": memoria,
+            "avg_cost": sum(custos) / len(custos) if custos else None
+        })
+        if gasto > orcamento_s or not tempos:
+            break # Sem sucesso neste N, N maiores não vão melhorar
+    return pontos
+
+def run_sweep(ns_busca_local=NS_SWEEP_BUSCA_LOCAL, ns_enumeracao=NS_SWEEP_ENUMERACAO,
+              runs_por_n=RUNS_SWEEP_POR_N, orcamento_s=ORCAMENTO_SWEEP_S, semente_mestre=0):
+    """Mede tempo, memória e custo de cada algoritmo em função de N."""
+    sweep = {"budget_s": orcamento_s, "find_one": {}, "find_all": {}}
+    for nome, executar in medicao_robusta.ALGORITMOS.items():
+        print(f"  Varredura {nome} (N={ns_busca_local[0]}..{ns_busca_local[-1]})...")
+        sweep["find_one"][nome] = _sweep_algoritmo(executar, ns_busca_local, runs_por_n,
+                                                   orcamento_s, semente_mestre)
+    for nome, executar in medicao_robusta.ALGORITMOS_ENUMERACAO.items():
+        print(f"  Varredura {nome} (N={ns_enumeracao[0]}..{ns_enumeracao[-1]})...")
+        # Enumeração é determinística: uma execução por N basta
+        sweep["find_all"][nome] = _sweep_algoritmo(executar, ns_enumeracao, 1,
+                                                   orcamento_s, semente_mestre)
+    return sweep
+
+def run_baseline(n=N_BASELINE, num_runs=RUNS_BASELINE):
+    """
+    Compara Min-Conflicts, a única busca que escala até N=10⁶, com a solução
+    construtiva O(N). Sem tracemalloc, que domina o tempo nesses tamanhos.
+    """
+    construtiva = constructive_benchmark.get_constructive_metrics(num_runs=num_runs, n=n, medir_memoria=False)["find_one"]
+    min_conflicts = min_conflicts_benchmark.get_min_conflicts_metrics(num_runs=num_runs, n=n, medir_memoria=False)["find_one"]
+    return {
+        "n": n,
+        "constructive": construtiva,
+        "min_conflicts": min_conflicts,
+        "min_conflicts_time_ratio": (min_conflicts["avg_time_s"] / construtiva["avg_time_s"]
+                                     if construtiva["avg_time_s"] else None)
+    }
+
+def run_throughput(k=registro_solvers.K_VAZAO, n=8):
+    """Soluções por segundo de cada solver registrado com solve_many(k) sobre estado aquecido."""
+    return {nome: registro_solvers.medir_vazao(nome, k, n) for nome in registro_solvers.descobrir()}
+
+def run_budget(orcamento_s=registro_solvers.ORCAMENTO_S, prazo_s=registro_solvers.PRAZO_QUALIDADE_S, n=8):
+    """
+    Medidas por orçamento de tempo de cada solver registrado: soluções distintas em
+    `orcamento_s` segundos e conflitos do melhor estado de find_best após `prazo_s`.
+    """
+    return {nome: {"budget": registro_solvers.medir_orcamento(nome, orcamento_s, n),
+                   "deadline": registro_solvers.qualidade_no_prazo(nome, prazo_s, n=n)}
+            for nome in registro_solvers.descobrir()}
+
+def run_profile(algoritmo, num_runs=RUNS_PROFILE, n=8, ordenacao="cumulative", linhas=LINHAS_PROFILE,
+                arquivo=None, progresso=False, semente_mestre=0):
+    """
+    Executa `algoritmo` (nome de medicao_robusta.ALGORITMOS ou ALGORITMOS_ENUMERACAO)
+    sob cProfile, imprime as funções mais caras e devolve os contadores da instrumentação.
+    """
+    algoritmos = {**medicao_robusta.ALGORITMOS, **medicao_robusta.ALGORITMOS_ENUMERACAO}
+    if algoritmo not in algoritmos:
+        raise ValueError(f"Algoritmo desconhecido: {algoritmo!r} (use um de {tuple(algoritmos)})")
+    executar = algoritmos[algoritmo]
+    instr = instrumentacao.Instrumentacao(progresso=instrumentacao.imprimir_progresso if progresso else None)
+
+    perfil = cProfile.Profile()
+    for semente in harness_paralelo.derivar_sementes(semente_mestre, num_runs):
+        random.seed(semente)
+        perfil.enable()
+        executar(False, n, instr)
+        perfil.disable()
+
+    estatisticas = pstats.Stats(perfil).strip_dirs().sort_stats(ordenacao)
+    estatisticas.print_stats(linhas)
+    if arquivo:
+        estatisticas.dump_stats(arquivo)
+    return instr.relatorio()
+
+def run_all_benchmarks(workers=None, semente_mestre=None, robusto=False, sweep=False, orcamento_s=ORCAMENTO_SWEEP_S,
+                       baseline_n=None, execucoes=None, vazao_k=None, orcamento_fixo_s=None,
+                       prazo_s=registro_solvers.PRAZO_QUALIDADE_S, portfolio_ns=None):
+    """
+    Executa todos os benchmarks e retorna um dicionário com os resultados. As execuções
+    individuais de cada algoritmo são acumuladas em `execucoes` ({algoritmo: [resultado
+    por execução]}), se fornecido.
+    """
     all_metrics = {}
 
-    print(f"Executando Backtracking benchmark ({NUM_RUNS_BT} execuções)...")
-    metrics_bt = backtracking_8_queens.get_backtracking_metrics(num_runs=NUM_RUNS_BT)
-    all_metrics["backtracking"] = metrics_bt
-    print("Backtracking benchmark concluído.")
+    for nome, classe in registro_solvers.descobrir().items():
+        num_runs = classe.runs_padrao
+        print(f"\nExecutando {classe.rotulo} benchmark ({num_runs} execuções)...")
+        if classe.estocastico:
+            all_metrics[nome] = _metricas_estocasticas(nome, num_runs, workers, semente_mestre, execucoes)
+        else:
+            all_metrics[nome] = classe().metrics(num_runs)
+            # As métricas das buscas completas incluem find_all; as execuções individuais
+            # (find_one) vêm de runs próprias, baratas em N=8
+            if execucoes is not None:
+                execucoes[nome] = harness_paralelo.executar_runs(nome, num_runs, semente_mestre or 0)
+        print(f"{classe.rotulo} benchmark concluído.")
+
+    if vazao_k:
+        print(f"\nExecutando medição de vazão (solve_many com {vazao_k} execuções por solver)...")
+        all_metrics["throughput"] = run_throughput(k=vazao_k)
+        print("Medição de vazão concluída.")
+
+    if orcamento_fixo_s:
+        print(f"\nExecutando medição por orçamento ({orcamento_fixo_s:.1f} s por solver, qualidade em "
+              f"{prazo_s * 1000:.0f} ms)...")
+        all_metrics["budget"] = run_budget(orcamento_fixo_s, prazo_s)
+        print("Medição por orçamento concluída.")
+
+    if portfolio_ns:
+        print(f"\nExecutando corridas do portfólio ({', '.join(portfolio.COMPETIDORES)}) em N={list(portfolio_ns)}...")
+        all_metrics["portfolio"] = portfolio.correr_por_n(portfolio_ns, semente_mestre=semente_mestre or 0)
+        print("Corridas do portfólio concluídas.")
+
+    if robusto:
+        print(f"\nExecutando medição robusta (tempo sem tracemalloc, {medicao_robusta.NUM_AQUECIMENTO} aquecimentos, memória em passe separado)...")
+        all_metrics["robust"] = medicao_robusta.get_robust_metrics(num_runs=NUM_RUNS_ROBUSTO,
+                                                                   semente_mestre=semente_mestre or 0)
+        print("Medição robusta concluída.")
 
-    print(f"\nExecutando Hill Climbing benchmark ({NUM_RUNS_HC} execuções)...")
-    metrics_hc = hill_climbing_benchmark.get_hill_climbing_metrics(num_runs=NUM_RUNS_HC)
-    all_metrics["hill_climbing"] = metrics_hc
-    print("Hill Climbing benchmark concluído.")
+    if sweep:
+        print(f"\nExecutando varredura em N (orçamento de {orcamento_s:.0f} s por algoritmo)...")
+        all_metrics["sweep"] = run_sweep(orcamento_s=orcamento_s, semente_mestre=semente_mestre or 0)
+        print("Varredura concluída.")
 
-    print(f"\nExecutando Random Restart benchmark ({NUM_RUNS_RR} execuções)...")
-    metrics_rr = random_restart_benchmark.get_random_restart_metrics(num_runs=NUM_RUNS_RR)
-    all_metrics["random_restart"] = metrics_rr
-    print("Random Restart benchmark concluído.")
+    if baseline_n:
+        print(f"\nExecutando comparação com a solução construtiva (N={baseline_n})...")
+        all_metrics["baseline"] = run_baseline(n=baseline_n)
+        print("Comparação concluída.")
 
     return all_metrics
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Distribui as execuções estocásticas num pool com N processos")
+    parser.add_argument("--seed", type=int, default=None,
+                        help="Semente mestre: cada execução recebe uma semente derivada, reprodutível "
+                             "(sem --seed, uma semente mestre é sorteada e registrada nas métricas)")
+    parser.add_argument("--robusto", action="store_true",
+                        help="Inclui mediana/p95/mín/IC com passes separados de tempo e memória")
+    parser.add_argument("--sweep", action="store_true",
+                        help="Varre N (4..30 buscas de uma solução, 4..14 enumeração completa)")
+    parser.add_argument("--orcamento", type=float, default=ORCAMENTO_SWEEP_S,
+                        help="Orçamento de tempo, em segundos, de cada algoritmo na varredura")
+    parser.add_argument("--baseline", type=int, nargs="?", const=N_BASELINE, default=None, metavar="N",
+                        help=f"Compara Min-Conflicts com a solução construtiva em N grande (padrão {N_BASELINE})")
+    parser.add_argument("--vazao", type=int, nargs="?", const=registro_solvers.K_VAZAO, default=None, metavar="K",
+                        help=f"Mede a vazão (soluções/s) de solve_many(K) em cada solver (padrão {registro_solvers.K_VAZAO})")
+    parser.add_argument("--orcamento-fixo", type=float, nargs="?", const=registro_solvers.ORCAMENTO_S, default=None,
+                        metavar="S", help="Conta as soluções distintas de cada solver em S segundos e a qualidade "
+                                          f"no prazo de --prazo (padrão {registro_solvers.ORCAMENTO_S:.0f} s)")
+    parser.add_argument("--prazo", type=float, default=registro_solvers.PRAZO_QUALIDADE_S,
+                        help="Prazo, em segundos, da medição de qualidade de --orcamento-fixo")
+    parser.add_argument("--portfolio", type=int, nargs="*", default=None, metavar="N",
+                        help="Corre o portfólio de solvers em processos paralelos e registra o vencedor de cada N "
+                             f"(padrão {' '.join(map(str, portfolio.NS_PORTFOLIO))})")
+    parser.add_argument("--saida", default=historico_benchmarks.ARQUIVO_METRICAS,
+                        help="Arquivo JSON com as métricas desta execução")
+    parser.add_argument("--execucoes", default=historico_benchmarks.ARQUIVO_EXECUCOES,
+                        help="Arquivo .npz com tempo, memória, custo, semente e sucesso de cada execução")
+    parser.add_argument("--sem-historico", action="store_true",
+                        help="Não anexa esta execução ao histórico (resultados/historico.jsonl)")
+    parser.add_argument("--comparar-com", metavar="REF", default=None,
+                        help="Compara com uma linha de base (JSON, índice do histórico ou revisão) e sai com 1 se houver regressão")
+    parser.add_argument("--profile", metavar="ALGORITMO", default=None,
+                        help="Só perfila ALGORITMO com cProfile (ex.: backtracking, min_conflicts) e sai")
+    parser.add_argument("--profile-n", type=int, default=8, help="N usado no perfilamento")
+    parser.add_argument("--profile-runs", type=int, default=RUNS_PROFILE, help="Execuções perfiladas")
+    parser.add_argument("--profile-sort", default="cumulative",
+                        help="Ordenação do pstats (cumulative, tottime, ncalls, ...)")
+    parser.add_argument("--profile-out", default=None, help="Arquivo .prof para snakeviz/pstats")
+    parser.add_argument("--progresso", action="store_true",
+                        help="Mostra os contadores da instrumentação durante o perfilamento")
+    args = parser.parse_args()
+
+    if args.profile:
+        relatorio = run_profile(args.profile, num_runs=args.profile_runs, n=args.profile_n,
+                                ordenacao=args.profile_sort, arquivo=args.profile_out,
+                                progresso=args.progresso, semente_mestre=args.seed or 0)
+        print("Instrumentação:")
+        print(json.dumps(relatorio, indent=4))
+        raise SystemExit(0)
+
     print("Iniciando a coleta de métricas de benchmark para os algoritmos das 8 Rainhas...")
     
-    collected_metrics = run_all_benchmarks()
+    execucoes = {}
+    collected_metrics = run_all_benchmarks(workers=args.workers, semente_mestre=args.seed, robusto=args.robusto,
+                                           sweep=args.sweep, orcamento_s=args.orcamento, baseline_n=args.baseline,
+                                           execucoes=execucoes, vazao_k=args.vazao,
+                                           orcamento_fixo_s=args.orcamento_fixo, prazo_s=args.prazo,
+                                           portfolio_ns=(args.portfolio or portfolio.NS_PORTFOLIO)
+                                                        if args.portfolio is not None else None)
     
     # Salvar as métricas em um arquivo JSON para uso posterior (gráficos, relatório)
-    output_file = "/home/ubuntu/benchmark_metrics.json"
+    output_file = args.saida
     try:
+        os.makedirs(os.path.dirname(os.path.abspath(output_file)), exist_ok=True)
         with open(output_file, "w") as f:
             json.dump(collected_metrics, f, indent=4)
         print(f"\nMétricas de benchmark salvas em: {output_file}")
     except Exception as e:
         print(f"\nErro ao salvar métricas em JSON: {e}")
 
+    # Execuções individuais de todos os algoritmos
+    if execucoes:
+        try:
+            historico_benchmarks.salvar_execucoes(execucoes, args.execucoes)
+            print(f"Execuções individuais salvas em: {args.execucoes}")
+        except OSError as e:
+            print(f"Erro ao salvar as execuções individuais: {e}")
+
+    # Histórico append-only: cada execução fica registrada com revisão, Python e máquina
+    if not args.sem_historico:
+        try:
+            historico_benchmarks.registrar(collected_metrics)
+            print(f"Execução anexada ao histórico: {historico_benchmarks.HISTORICO_PADRAO}")
+        except OSError as e:
+            print(f"Erro ao gravar o histórico: {e}")
+
     # Imprimir um resumo das métricas coletadas
     print("\n--- Resumo das Métricas Coletadas ---")
     for algo_name, metrics in collected_metrics.items():
@@ -57,6 +316,41 @@ if __name__ == "__main__":
                     print(f"    {key}: {value:.4f}")
                 else:
                     print(f"    {key}: {value}")
+        if algo_name == "robust":
+            for nome, robustas in metrics.items():
+                tempo = robustas["time_s"]
+                if tempo:
+                    print(f"  {nome}: mediana {tempo['median']:.6f} s, p95 {tempo['p95']:.6f} s, "
+                          f"mín {tempo['min']:.6f} s, IC95 mediana [{tempo['ci95_median'][0]:.6f}, {tempo['ci95_median'][1]:.6f}] s")
+            continue
+        if algo_name == "throughput":
+            for nome, vazao in metrics.items():
+                print(f"  {nome}: {vazao['solves_per_s']:.1f} soluções/s (sucesso {vazao['success_rate']:.0%})")
+            continue
+        if algo_name == "budget":
+            for nome, medidas in metrics.items():
+                orcamento, prazo = medidas["budget"], medidas["deadline"]
+                print(f"  {nome}: {orcamento['distinct_solutions']} soluções distintas em {orcamento['budget_s']:.1f} s "
+                      f"({orcamento['solutions_per_s']:.1f}/s); em {prazo['deadline_s'] * 1000:.0f} ms resolve "
+                      f"{prazo['success_rate']:.0%}, mediana de conflitos {prazo['median_conflicts']}")
+            continue
+        if algo_name == "portfolio":
+            for n, registro in metrics.items():
+                if registro["winner"]:
+                    print(f"  N={n}: {registro['winner']} {registro['wins']}, mediana {registro['median_wall_s']:.4f} s")
+                else:
+                    print(f"  N={n}: sem vencedor{' (sem solução)' if registro['no_solution'] else ''}")
+            continue
+        if algo_name == "baseline":
+            print(f"  N={metrics['n']}: construtiva {metrics['constructive']['avg_time_s']:.4f} s, "
+                  f"min-conflicts {metrics['min_conflicts']['avg_time_s']:.4f} s")
+            continue
+        if algo_name == "sweep":
+            for tipo in ("find_one", "find_all"):
+                for nome, pontos in metrics[tipo].items():
+                    if pontos:
+                        print(f"  {tipo} {nome}: N={pontos[0]['n']}..{pontos[-1]['n']}")
+            continue
         if "find_all" in metrics: # Apenas para Backtracking
             print("  Métricas para encontrar TODAS as soluções:")
             for key, value in metrics["find_all"].items():
@@ -66,3 +360,10 @@ if __name__ == "__main__":
                     print(f"    {key}: {value}")
     print("\nColeta de métricas finalizada.")
 
+    if args.comparar_com:
+        print()
+        descricao_base, base = historico_benchmarks.carregar_referencia(args.comparar_com)
+        regressoes = historico_benchmarks.imprimir_comparacao(historico_benchmarks.comparar(collected_metrics, base),
+                                                              descricao_base, "esta execução")
+        raise SystemExit(1 if regressoes else 0)
+
@@ -0,0 +1,217 @@
+"""
+Simulated Annealing para o problema das N Rainhas (versão para benchmark).
+
+Cada passo propõe mover uma rainha em conflito, sorteada de uma lista de colunas em
+conflito mantida incrementalmente, para uma linha aleatória; a variação de conflitos vem
+do AvaliadorConflitos em O(1), então cada proposta custa O(1) amortizado, também em N
+grande. Movimentos que pioram são aceitos com probabilidade exp(-delta / T). A temperatura
+é atualizada a cada N passos (uma "varredura") por um dos esquemas de resfriamento de ESQUEMAS:
+  * geometric: T *= alfa, com alfa escolhido para chegar a T_FINAL no último passo;
+  * linear: T decresce linearmente de T_INICIAL a T_FINAL;
+  * adaptive: ajusta T para manter a taxa de aceitação de pioras perto de um alvo
+    que decai exponencialmente ao longo do orçamento (esquema de Lam modificado).
+"""
+import math
+import random
+import time
+import tracemalloc
+
+from avaliador_conflitos import AvaliadorConflitos
+from registro_solvers import Solver, registrar
+
+NUM_RAINHAS = 8
+MAX_PASSOS_POR_RAINHA = 2000 # Orçamento de propostas (x N) antes de desistir
+# O adaptativo não resfria até T_FINAL no fim do orçamento, então um orçamento maior não o
+# atrasa: só alcança a cauda de execuções lentas (em N=200, 2000 x N deixava ~10% sem solução)
+MAX_PASSOS_POR_RAINHA_ADAPTATIVO = 3000
+T_INICIAL = 1.0
+T_FINAL = 0.02
+TAXA_ALVO_INICIAL = 0.3 # Taxa de aceitação de pioras pretendida no início (adaptive)
+DECAIMENTO_ALVO = 0.02 # Constante de tempo do alvo, em fração do orçamento (adaptive)
+FATOR_AJUSTE = 0.99 # Passo multiplicativo do ajuste adaptativo (passos maiores oscilam e congelam cedo)
+
+def resfriamento_geometrico(max_passos, janela, t_inicial=T_INICIAL, t_final=T_FINAL):
+    alfa = (t_final / t_inicial) ** (janela / max_passos)
+    return lambda passo, temperatura, taxa_aceitacao: max(t_final, temperatura * alfa)
+
+def resfriamento_linear(max_passos, janela, t_inicial=T_INICIAL, t_final=T_FINAL):
+    return lambda passo, temperatura, taxa_aceitacao: max(t_final, t_inicial * (1 - passo / max_passos))
+
+def resfriamento_adaptativo(max_passos, janela, t_inicial=T_INICIAL, t_final=T_FINAL):
+    def proxima(passo, temperatura, taxa_aceitacao):
+        alvo = TAXA_ALVO_INICIAL * math.exp(-passo / (DECAIMENTO_ALVO * max_passos))
+        if taxa_aceitacao > alvo:
+            return max(t_final, temperatura * FATOR_AJUSTE)
+        return min(t_inicial, temperatura / FATOR_AJUSTE)
+    return proxima
+
+# nome -> fábrica(max_passos, janela) de função (passo, temperatura, taxa de aceitação) -> nova temperatura
+ESQUEMAS = {
+    "geometric": resfriamento_geometrico,
+    "linear": resfriamento_linear,
+    "adaptive": resfriamento_adaptativo,
+}
+
+def simulated_annealing(n=NUM_RAINHAS, esquema="geometric", rng=random, instrumentacao=None, cancelado=None):
+    """
+    Executa o annealing a partir de um estado aleatório, até resolver, esgotar o orçamento
+    ou `cancelado.is_set()` (consultado a cada janela de temperatura).
+    Retorna (melhor estado visto, seus conflitos, avaliações de delta).
+    """
+    if esquema not in ESQUEMAS:
+        raise ValueError(f"Esquema de resfriamento desconhecido: {esquema!r} (use um de {tuple(ESQUEMAS)})")
+    max_passos = (MAX_PASSOS_POR_RAINHA_ADAPTATIVO if esquema == "adaptive" else MAX_PASSOS_POR_RAINHA) * n
+    janela = n
+    proxima_temperatura = ESQUEMAS[esquema](max_passos, janela)
+
+    avaliador = AvaliadorConflitos([rng.randrange(n) for _ in range(n)])
+    temperatura = T_INICIAL
+    pioras_propostas = pioras_aceitas = 0
+    estado = avaliador.estado
+    melhor_estado, melhores_conflitos = list(estado), avaliador.conflitos
+    randrange, aleatorio, exp = rng.randrange, rng.random, math.exp
+
+    # Colunas em conflito, para sortear a rainha proposta em O(1) amortizado. Toda rainha
+    # em conflito está na lista; as que deixaram de estar são descartadas quando sorteadas.
+    # A soma das colunas de cada linha/diagonal identifica a única ocupante de uma linha
+    # com uma rainha, que passa a estar em conflito quando outra chega.
+    deslocamento = n - 1
+    contadores = (avaliador.linhas, avaliador.diag_principal, avaliador.diag_secundaria)
+    somas = ([0] * n, [0] * (2 * n - 1), [0] * (2 * n - 1))
+    for c, l in enumerate(estado):
+        somas[0][l] += c; somas[1][c + l] += c; somas[2][c - l + deslocamento] += c
+    em_conflito = [c for c in range(n) if avaliador.conflitos_da_rainha(c, estado[c]) > 0]
+    na_lista = [False] * n
+    for c in em_conflito:
+        na_lista[c] = True
+
+    def mover(coluna, linha):
+        linha_atual = estado[coluna]
+        if linha == linha_atual:
+            return
+        for contador, soma, indice in zip(contadores, somas, (linha, coluna + linha, coluna - linha + deslocamento)):
+            if contador[indice] == 1 and not na_lista[soma[indice]]:
+                na_lista[soma[indice]] = True
+                em_conflito.append(soma[indice])
+            soma[indice] += coluna
+        somas[0][linha_atual] -= coluna
+        somas[1][coluna + linha_atual] -= coluna
+        somas[2][coluna - linha_atual + deslocamento] -= coluna
+        avaliador.mover(coluna, linha)
+        if not na_lista[coluna] and avaliador.conflitos_da_rainha(coluna, linha) > 0:
+            na_lista[coluna] = True
+            em_conflito.append(coluna)
+
+    for passo in range(1, max_passos + 1):
+        if avaliador.conflitos == 0:
+            return avaliador.estado, 0, passo - 1
+        while True: # Só propõe mover rainhas em conflito
+            idx = randrange(len(em_conflito))
+            coluna = em_conflito[idx]
+            if avaliador.conflitos_da_rainha(coluna, estado[coluna]) > 0:
+                break
+            em_conflito[idx] = em_conflito[-1]
+            em_conflito.pop()
+            na_lista[coluna] = False
+        linha = randrange(n)
+        delta = avaliador.delta(coluna, linha)
+        aceito = delta <= 0
+        if not aceito:
+            pioras_propostas += 1
+            aceito = aleatorio() < exp(-delta / temperatura)
+            pioras_aceitas += aceito
+        if aceito:
+            mover(coluna, linha)
+            if avaliador.conflitos < melhores_conflitos:
+                melhor_estado, melhores_conflitos = list(estado), avaliador.conflitos
+        if instrumentacao is not None:
+            instrumentacao.contar("avaliacoes")
+            if aceito: instrumentacao.contar("movimentos")
+
+        if passo % janela == 0:
+            taxa_aceitacao = pioras_aceitas / pioras_propostas if pioras_propostas else 0.0
+            temperatura = proxima_temperatura(passo, temperatura, taxa_aceitacao)
+            pioras_propostas = pioras_aceitas = 0
+            if cancelado is not None and cancelado.is_set():
+                return melhor_estado, melhores_conflitos, passo
+
+    return melhor_estado, melhores_conflitos, max_passos
+
+def simulated_annealing_single_run(n=NUM_RAINHAS, medir_memoria=True, esquema="geometric", instrumentacao=None,
+                                   cancelado=None):
+    """Executa uma única tentativa de Simulated Annealing para encontrar uma solução."""
+    if medir_memoria: tracemalloc.start()
+    start_time = time.perf_counter()
+
+    estado, conflitos, avaliacoes = simulated_annealing(n, esquema, instrumentacao=instrumentacao, cancelado=cancelado)
+    solucao = estado if conflitos == 0 else None
+
+    end_time = time.perf_counter()
+    peak_mem = 0
+    if medir_memoria:
+        current_mem, peak_mem = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    return solucao, end_time - start_time, peak_mem / 1024, avaliacoes, solucao is not None  # KB
+
+def get_simulated_annealing_metrics(num_runs=100, esquema="geometric", n=NUM_RAINHAS):
+    times, mems, costs = [], [], []
+    solutions_found = 0
+    solution_example = None
+
+    for _ in range(num_runs):
+        solution, time_val, mem_val, cost_val, found = simulated_annealing_single_run(n, esquema=esquema)
+        if found:
+            if solution_example is None: solution_example = solution
+            times.append(time_val)
+            mems.append(mem_val)
+            costs.append(cost_val)
+            solutions_found += 1
+
+    avg_time = sum(times) / len(times) if times else 0
+    avg_mem = sum(mems) / len(mems) if mems else 0
+    avg_cost = sum(costs) / len(costs) if costs else 0
+    success_rate = solutions_found / num_runs if num_runs > 0 else 0
+
+    return {
+        "find_one": {
+            "avg_time_s": avg_time,
+            "avg_mem_peak_kb": avg_mem,
+            "avg_cost_conflict_evals": avg_cost,
+            "success_rate": success_rate,
+            "solutions_found_count": solutions_found,
+            "solution_example": solution_example
+        }
+    }
+
+class SimulatedAnnealingSolver(Solver):
+    esquema = "geometric"
+
+    def single_run(self, medir_memoria=True, instrumentacao=None):
+        return simulated_annealing_single_run(self.n, medir_memoria, self.esquema, instrumentacao)
+
+    def _find_best(self, cancelado, instrumentacao=None):
+        return simulated_annealing(self.n, self.esquema, instrumentacao=instrumentacao, cancelado=cancelado)
+
+    def metrics(self, num_runs=None):
+        return get_simulated_annealing_metrics(self._num_runs(num_runs), self.esquema, self.n)
+
+# Um solver registrado por esquema de resfriamento
+for _esquema in ESQUEMAS:
+    registrar(f"simulated_annealing_{_esquema}")(type(
+        f"SimulatedAnnealing{_esquema.title()}Solver", (SimulatedAnnealingSolver,),
+        {"esquema": _esquema, "rotulo": f"Simulated Annealing ({_esquema})"}))
+
+if __name__ == '__main__':
+    import sys
+    esquema = sys.argv[1] if len(sys.argv) > 1 else "geometric"
+    n = int(sys.argv[2]) if len(sys.argv) > 2 else NUM_RAINHAS
+    metrics_sa = get_simulated_annealing_metrics(num_runs=20, esquema=esquema, n=n)
+    print(f"Simulated Annealing Metrics (Find One, {esquema}, N={n}):")
+    print(f"  Avg Time (successful runs): {metrics_sa['find_one']['avg_time_s']:.6f} s")
+    print(f"  Avg Peak Memory (successful runs): {metrics_sa['find_one']['avg_mem_peak_kb']:.2f} KB")
+    print(f"  Avg Cost (Conflict Evaluations for successful runs): {metrics_sa['find_one']['avg_cost_conflict_evals']:.2f}")
+    print(f"  Success Rate: {metrics_sa['find_one']['success_rate']:.2%}")
+    print(f"  Solutions Found: {metrics_sa['find_one']['solutions_found_count']}")
+    if metrics_sa['find_one']['solution_example'] and n <= 64:
+        print(f"  Solution Example: {metrics_sa['find_one']['solution_example']}")
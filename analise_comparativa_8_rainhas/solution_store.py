@@ -0,0 +1,128 @@
+"""
+Armazenamento compacto, em disco, do conjunto completo de soluções das N Rainhas.
+
+Cada solução é gravada como uma linha de N bytes (uint8, board[col] = linha), após
+um cabeçalho fixo de 16 bytes. O arquivo é construído uma vez, em streaming a partir
+de EightQueensBacktracking.iter_solutions, e depois aberto com numpy.memmap: acesso
+aleatório e iteração sem cópia e sem recomputar a busca. Para N=8..15 isso custa
+N bytes por solução, contra ~100 bytes por rainha das listas de listas do Python.
+"""
+import os
+import struct
+import time
+
+import numpy as np
+
+from backtracking_8_queens import EightQueensBacktracking
+
+MAGIC = b"NQSS"
+VERSION = 1
+HEADER = struct.Struct("<4sBBxxQ") # magic, versão, N, padding, número de soluções
+DEFAULT_STORE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "solucoes")
+WRITE_CHUNK = 4096 # Soluções acumuladas antes de cada escrita
+
+def default_store_path(n):
+    """Caminho padrão do arquivo de soluções para N."""
+    return os.path.join(DEFAULT_STORE_DIR, f"nqueens_{n}.bin")
+
+def build_store(n, path=None, engine="bitmask"):
+    """
+    Enumera todas as soluções de N e grava no formato compacto, sem acumulá-las em
+    memória. O número de soluções é escrito no cabeçalho ao final.
+    Retorna (path, número de soluções, nós visitados).
+    """
+    if n > 255:
+        raise ValueError(f"N={n} não cabe em linhas uint8")
+    path = path or default_store_path(n)
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    solver = EightQueensBacktracking(n, engine=engine)
+    count = 0
+    tmp_path = path + ".tmp" # Evita deixar um arquivo pela metade se a construção falhar
+    with open(tmp_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, n, 0))
+        chunk = bytearray()
+        for board in solver.iter_solutions():
+            chunk += bytes(board)
+            count += 1
+            if count % WRITE_CHUNK == 0:
+                f.write(chunk)
+                chunk.clear()
+        f.write(chunk)
+        f.seek(0)
+        f.write(HEADER.pack(MAGIC, VERSION, n, count))
+    os.replace(tmp_path, path)
+    return path, count, solver.nodes_visited
+
+class SolutionStore:
+    """Visão somente leitura, mapeada em memória, de um arquivo gerado por build_store."""
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            magic, version, n, count = HEADER.unpack(f.read(HEADER.size))
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} não é um arquivo de soluções válido (versão {VERSION})")
+        self.path = path
+        self.n = n
+        self.count = count
+        # np.memmap não aceita shape vazio; com zero soluções basta um array vazio
+        if count:
+            self.rows = np.memmap(path, dtype=np.uint8, mode="r", offset=HEADER.size, shape=(count, n))
+        else:
+            self.rows = np.empty((0, n), dtype=np.uint8)
+
+    @classmethod
+    def open_or_build(cls, n, path=None, engine="bitmask"):
+        """Abre o arquivo de N, construindo-o antes se ainda não existir."""
+        path = path or default_store_path(n)
+        if not os.path.exists(path):
+            build_store(n, path, engine)
+        return cls(path)
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, index):
+        """Linha `index` como visão uint8 do arquivo (sem cópia)."""
+        return self.rows[index]
+
+    def __iter__(self):
+        return iter(self.rows)
+
+    def solution(self, index):
+        """Solução `index` como lista de int, no mesmo formato de find_all_solutions."""
+        return self.rows[index].tolist()
+
+def measure_store(n, path=None, num_runs=5, engine="bitmask"):
+    """
+    Mede o caminho frio (enumerar e gravar) e o quente (abrir o arquivo mapeado e
+    percorrer todas as soluções). A memória do mapeamento não aparece no tracemalloc,
+    então só tempos são reportados.
+    """
+    path = path or default_store_path(n)
+    start_time = time.perf_counter()
+    _, count, nodes = build_store(n, path, engine)
+    cold_time = time.perf_counter() - start_time
+
+    warm_times = []
+    for _ in range(num_runs):
+        start_time = time.perf_counter()
+        store = SolutionStore(path)
+        checksum = int(store.rows.sum(dtype=np.uint64)) # Força a leitura de todas as páginas
+        warm_times.append(time.perf_counter() - start_time)
+        del store
+
+    return {
+        "cold": {"time_s": cold_time, "cost_nodes": nodes, "solutions_count": count},
+        "warm": {"avg_time_s": sum(warm_times) / len(warm_times) if warm_times else 0,
+                 "solutions_count": count, "checksum": checksum if warm_times else None},
+        "file_size_bytes": os.path.getsize(path)
+    }
+
+if __name__ == '__main__':
+    import sys
+    ns = [int(arg) for arg in sys.argv[1:]] or list(range(8, 12))
+    for n in ns:
+        metrics = measure_store(n)
+        print(f"N={n}: {metrics['cold']['solutions_count']} soluções, {metrics['file_size_bytes']} bytes")
+        print(f"  Frio (enumerar + gravar): {metrics['cold']['time_s']:.4f} s")
+        print(f"  Quente (abrir + percorrer): {metrics['warm']['avg_time_s']:.6f} s")
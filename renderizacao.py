@@ -0,0 +1,61 @@
+import pygame
+from functools import lru_cache
+
+# Cores
+BRANCO = (255, 255, 255)
+PRETO = (0, 0, 0)
+VERMELHO = (255, 0, 0)
+AZUL = (0, 0, 255)
+
+# Eventos que pedem redesenho mesmo sem mudança de solução (janela descoberta/restaurada)
+EVENTOS_EXPOSICAO = (pygame.VIDEOEXPOSE, getattr(pygame, "WINDOWEXPOSED", pygame.VIDEOEXPOSE))
+
+# Fontes criadas uma única vez por tamanho (pygame.font.Font é caro)
+@lru_cache(maxsize=None)
+def fonte(tamanho):
+    return pygame.font.Font(None, tamanho)
+
+# Camada de renderização: tabuleiro, rainha e botão são pré-renderizados uma vez
+# e cada quadro só faz blits, em vez de redesenhar N² casas e recriar a fonte.
+class RenderizadorTabuleiro:
+    def __init__(self, num_rainhas, tam_celula, altura_botao, texto_botao="Nova Solução"):
+        self.num_rainhas = num_rainhas
+        self.tam_celula = tam_celula
+        self.lado = num_rainhas * tam_celula
+        self.botao_rect = pygame.Rect(0, self.lado, self.lado, altura_botao)
+        self.tabuleiro = self._renderizar_tabuleiro()
+        self.rainha = self._renderizar_rainha()
+        self.botao = self._renderizar_botao(texto_botao)
+
+    def _renderizar_tabuleiro(self):
+        superficie = pygame.Surface((self.lado, self.lado))
+        superficie.fill(BRANCO)
+        for linha in range(self.num_rainhas):
+            for coluna in range((linha + 1) % 2, self.num_rainhas, 2):  # Só as casas pretas
+                rect = pygame.Rect(coluna * self.tam_celula, linha * self.tam_celula, self.tam_celula, self.tam_celula)
+                pygame.draw.rect(superficie, PRETO, rect)
+        return superficie
+
+    def _renderizar_rainha(self):
+        superficie = pygame.Surface((self.tam_celula, self.tam_celula), pygame.SRCALPHA)
+        centro = self.tam_celula // 2
+        pygame.draw.circle(superficie, VERMELHO, (centro, centro), max(1, self.tam_celula // 3))
+        return superficie
+
+    def _renderizar_botao(self, texto_botao):
+        superficie = pygame.Surface(self.botao_rect.size)
+        superficie.fill(AZUL)
+        texto = fonte(36).render(texto_botao, True, BRANCO)
+        superficie.blit(texto, ((self.botao_rect.width - texto.get_width()) // 2,
+                                (self.botao_rect.height - texto.get_height()) // 2))
+        return superficie
+
+    def desenhar(self, screen, solucao):
+        screen.blit(self.tabuleiro, (0, 0))
+        # blits em lote: uma chamada para todas as rainhas, importante para N na casa das centenas
+        screen.blits([(self.rainha, (coluna * self.tam_celula, linha * self.tam_celula))
+                      for coluna, linha in enumerate(solucao)], doreturn=False)
+        screen.blit(self.botao, self.botao_rect.topleft)
+
+    def clicou_botao(self, posicao):
+        return self.botao_rect.collidepoint(posicao)
@@ -0,0 +1,50 @@
+import threading
+
+import pygame
+
+# Eventos postados pela thread do solver para o loop do Pygame
+EVENTO_PASSO = pygame.USEREVENT + 1    # estado intermediário (modo animado)
+EVENTO_SOLUCAO = pygame.USEREVENT + 2  # resultado final da busca
+
+# Executa o solver numa thread de fundo, para o loop de eventos não congelar.
+# Cada busca recebe um número de geração: eventos de buscas canceladas (o usuário
+# clicou de novo) chegam com geração antiga e são ignorados pelo loop principal.
+class TrabalhadorSolver:
+    def __init__(self):
+        self.geracao = 0
+        self._cancelado = threading.Event()
+        self._thread = None
+
+    def cancelar(self):
+        self._cancelado.set()
+
+    def iniciar(self, solver, passos=None, intervalo=0.05):
+        """
+        Cancela a busca em andamento e inicia outra. Sem `passos`, roda
+        solver(cancelado) sem nenhuma sobrecarga de animação. Com `passos`, consome
+        o gerador passos(cancelado) de (estado, conflitos), postando um EVENTO_PASSO
+        a cada `intervalo` segundos.
+        """
+        self.cancelar()
+        self.geracao += 1
+        self._cancelado = threading.Event()
+        alvo = self._animar if passos else self._resolver
+        self._thread = threading.Thread(target=alvo, args=(passos or solver, self._cancelado, self.geracao, intervalo),
+                                        daemon=True)
+        self._thread.start()
+
+    def _resolver(self, solver, cancelado, geracao, intervalo):
+        solucao = solver(cancelado)
+        if solucao is not None and not cancelado.is_set():
+            pygame.event.post(pygame.event.Event(EVENTO_SOLUCAO, geracao=geracao, solucao=solucao, conflitos=None))
+
+    def _animar(self, passos, cancelado, geracao, intervalo):
+        estado, conflitos = None, None
+        for estado, conflitos in passos(cancelado):
+            if cancelado.is_set():
+                return
+            pygame.event.post(pygame.event.Event(EVENTO_PASSO, geracao=geracao, solucao=estado, conflitos=conflitos))
+            if cancelado.wait(intervalo):  # Dorme entre quadros, acordando se cancelado
+                return
+        if estado is not None and not cancelado.is_set():
+            pygame.event.post(pygame.event.Event(EVENTO_SOLUCAO, geracao=geracao, solucao=estado, conflitos=conflitos))